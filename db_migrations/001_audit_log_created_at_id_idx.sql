@@ -0,0 +1,3 @@
+-- Keyset pagination of the audit log (newest first): GET /api/v1/audit-log/entries
+-- Oracle scans the index backwards for ORDER BY created_at DESC, id DESC, so each page reads only its own rows.
+CREATE INDEX audit_log_created_at_id_idx ON audit_log (created_at, id);
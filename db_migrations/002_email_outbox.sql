@@ -0,0 +1,17 @@
+-- Outbox of the email notifications: written in the transaction of the change, sent by the email outbox worker.
+-- Sent emails are deleted, emails which could not be sent after the configured attempts are kept with status DEAD.
+CREATE TABLE email_outbox (
+    id              NUMBER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    created_at      DATE DEFAULT SYSDATE NOT NULL,
+    status          VARCHAR2(10) NOT NULL,
+    attempts        NUMBER(5) NOT NULL,
+    next_attempt_at DATE NOT NULL,
+    last_error      NVARCHAR2(1000),
+    -- Token of the last claim: only the worker holding it records the outcome of the send
+    claim_token     VARCHAR2(32),
+    subject         NVARCHAR2(1000) NOT NULL,
+    message         NCLOB NOT NULL
+);
+
+-- Due emails, oldest first
+CREATE INDEX email_outbox_due_idx ON email_outbox (status, next_attempt_at);
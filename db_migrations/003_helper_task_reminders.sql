@@ -0,0 +1,18 @@
+-- Ledger of the reminders sent about helper tasks, so the daily reminders only query the tasks still due for one and
+-- re-runs do not send them again.
+-- reminder_date is the start (or deadline) of the task for upcoming reminders and the day of the reminder for overdue
+-- reminders.
+CREATE TABLE helper_task_reminders (
+    task_id       NUMBER NOT NULL REFERENCES helper_tasks (id),
+    kind          VARCHAR2(20) NOT NULL,
+    reminder_date DATE NOT NULL,
+    created_at    DATE DEFAULT SYSDATE NOT NULL,
+    CONSTRAINT helper_task_reminders_pk PRIMARY KEY (task_id, kind, reminder_date)
+);
+
+-- Days on which the daily reminders ran successfully: missed upcoming reminders are only caught up for the days
+-- since the last run.
+CREATE TABLE helper_task_reminder_runs (
+    run_date   DATE NOT NULL PRIMARY KEY,
+    created_at DATE DEFAULT SYSDATE NOT NULL
+);
@@ -0,0 +1,10 @@
+-- Leases of the scheduler leaders: only the worker holding the lease runs the scheduled jobs. The leader renews its
+-- lease, if it dies another worker takes over after the lease expired. The token is incremented on every change of
+-- the owner, jobs check it before committing (fencing). Rows are created by the application.
+CREATE TABLE scheduler_locks (
+    name         VARCHAR2(50) PRIMARY KEY,
+    owner        VARCHAR2(200) NOT NULL,
+    token        NUMBER NOT NULL,
+    locked_until DATE NOT NULL,
+    acquired_at  DATE NOT NULL
+);
@@ -0,0 +1,14 @@
+-- Helper task lists of a year: COALESCE(starts_at, deadline) BETWEEN ... (function-based index), optionally filtered
+-- on published and ordered by urgent.
+CREATE INDEX helper_tasks_timing_idx ON helper_tasks (COALESCE(starts_at, deadline), published, urgent);
+
+-- Daily reminders: ranges on the timings of the tasks not validated yet (validated_by_id IS NULL). validated_by_id is
+-- in the indexes, so the filter does not need the table rows. Rows with a NULL timing are not indexed, the predicates
+-- never match them.
+CREATE INDEX helper_tasks_starts_at_idx ON helper_tasks (starts_at, validated_by_id);
+CREATE INDEX helper_tasks_ends_at_idx ON helper_tasks (ends_at, validated_by_id);
+CREATE INDEX helper_tasks_deadline_idx ON helper_tasks (deadline, validated_by_id);
+
+-- Sign-up checks (EXISTS on the helpers of a task with a member) and the reminder ledger (NOT EXISTS) are covered by
+-- the primary keys of helper_task_helpers (task_id, member_id) and helper_task_reminders (task_id, kind,
+-- reminder_date).
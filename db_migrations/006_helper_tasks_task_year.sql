@@ -0,0 +1,11 @@
+-- Year of the helper tasks as a virtual column, so the task lists of a year filter with equality on an index
+-- (same as `get_task_year()`: the year of the start, the end or the deadline).
+ALTER TABLE helper_tasks ADD (
+    task_year NUMBER(4) GENERATED ALWAYS AS (EXTRACT(YEAR FROM COALESCE(starts_at, ends_at, deadline))) VIRTUAL
+);
+
+-- Task lists of a year, optionally filtered on published and ordered by urgent
+CREATE INDEX helper_tasks_year_idx ON helper_tasks (task_year, published, urgent);
+
+-- Replaced by helper_tasks_year_idx
+DROP INDEX helper_tasks_timing_idx;
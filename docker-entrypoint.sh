@@ -7,4 +7,8 @@ echo "$CONFIG_JSON" > "conf/config.json"
 echo "Preparing conf/logging.conf ..."
 echo "$LOGGING_CONF" > "conf/logging.conf"
 
-python -m ycc_hull.main
+if [ "${1:-}" = "worker" ]; then
+    python -m ycc_hull.worker
+else
+    python -m ycc_hull.main
+fi
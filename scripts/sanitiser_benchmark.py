@@ -0,0 +1,46 @@
+"""
+Sanitiser microbenchmark: per-field cost of the input sanitisation, with and without the result cache.
+"""
+
+import timeit
+from collections.abc import Callable
+
+from ycc_hull.models.base import sanitise_html_input, sanitise_text_input
+
+_FIELDS: list[tuple[str, Callable[[str | None], str | None], str]] = [
+    ("Name", sanitise_text_input, "Michele"),
+    ("Phone", sanitise_text_input, "+41 76 123 45 67"),
+    ("Email", sanitise_text_input, "michele.huff@mailinator.com"),
+    ("Title", sanitise_text_input, "Surveillance: Regatta on the lake"),
+    ("Text with markup", sanitise_text_input, "Bring <b>sunscreen</b> & water"),
+    (
+        "HTML",
+        sanitise_html_input,
+        "<p>Please <em>arrive</em> 15 minutes early.</p>"
+        '<ul><li>Life jacket</li><li>Radio</li></ul><a href="https://ycc.app.cern.ch">Details</a>',
+    ),
+]
+
+_NUMBER = 2000
+
+
+def _microseconds_per_call(
+    function: Callable[[str | None], str | None], value: str
+) -> float:
+    return timeit.timeit(lambda: function(value), number=_NUMBER) / _NUMBER * 1_000_000
+
+
+def main() -> None:
+    print(f"{'Field':<20} {'Uncached (µs)':>15} {'Cached (µs)':>15}")
+
+    for name, function, value in _FIELDS:
+        # The undecorated function (if the cache is there)
+        uncached = getattr(function, "__wrapped__", function)
+        print(
+            f"{name:<20} {_microseconds_per_call(uncached, value):>15.2f} "
+            f"{_microseconds_per_call(function, value):>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
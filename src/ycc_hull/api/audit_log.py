@@ -2,16 +2,21 @@
 Audit log API endpoints.
 """
 
-from collections.abc import Sequence
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from ycc_hull.api.errors import create_http_exception_403
+from ycc_hull.api.responses import create_export_response
 from ycc_hull.app_controllers import get_audit_log_controller
 from ycc_hull.auth import User, auth
 from ycc_hull.controllers.audit_log_controller import AuditLogController
 from ycc_hull.models.audit_log_dtos import (
     AuditLogEntriesDeleteRequestDto,
+    AuditLogEntriesExportQueryDto,
+    AuditLogEntriesPageDto,
+    AuditLogEntriesQueryDto,
     AuditLogEntryDto,
 )
 
@@ -20,12 +25,29 @@
 
 @api_audit_log.get("/api/v1/audit-log/entries")
 async def audit_log_entries_get(
+    query: Annotated[AuditLogEntriesQueryDto, Query()],
     user: User = Depends(auth),
     controller: AuditLogController = Depends(get_audit_log_controller),
-) -> Sequence[AuditLogEntryDto]:
+) -> AuditLogEntriesPageDto:
     _check_can_access(user)
 
-    return await controller.find_all_entries()
+    return await controller.find_entries(query)
+
+
+@api_audit_log.get("/api/v1/audit-log/entries/export")
+async def audit_log_entries_export(
+    query: Annotated[AuditLogEntriesExportQueryDto, Query()],
+    user: User = Depends(auth),
+    controller: AuditLogController = Depends(get_audit_log_controller),
+) -> StreamingResponse:
+    _check_can_access(user)
+
+    return create_export_response(
+        controller.stream_entries(query),
+        dto_class=AuditLogEntryDto,
+        export_format=query.format,
+        filename="audit-log",
+    )
 
 
 @api_audit_log.get("/api/v1/audit-log/entries/{entry_id}")
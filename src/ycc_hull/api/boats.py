@@ -4,8 +4,9 @@
 
 from collections.abc import Sequence
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
+from ycc_hull.api.responses import create_json_response_with_etag
 from ycc_hull.auth import auth
 from ycc_hull.controllers.boats_controller import BoatsController
 from ycc_hull.models.dtos import BoatDto
@@ -14,6 +15,8 @@
 controller = BoatsController()
 
 
-@api_boats.get("/api/v1/boats")
-async def boats_get() -> Sequence[BoatDto]:
-    return await controller.find_all()
+@api_boats.get("/api/v1/boats", response_model=Sequence[BoatDto])
+async def boats_get(request: Request) -> Response:
+    return create_json_response_with_etag(
+        request, await controller.find_all_serialised()
+    )
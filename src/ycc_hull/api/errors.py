@@ -32,3 +32,7 @@ def create_http_exception_404(detail: Any) -> HTTPException:
 
 def create_http_exception_409(detail: Any) -> HTTPException:
     return create_http_exception(409, detail)
+
+
+def create_http_exception_503(detail: Any) -> HTTPException:
+    return create_http_exception(503, detail)
@@ -5,19 +5,27 @@
 from collections.abc import Sequence
 from datetime import date
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from ycc_hull.api.errors import create_http_exception_403
+from ycc_hull.api.responses import (
+    create_export_response,
+    create_json_response_with_etag,
+)
 from ycc_hull.app_controllers import get_helpers_controller
 from ycc_hull.auth import User, auth
 from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.models.export import ExportFormat
 from ycc_hull.models.helpers_dtos import (
     HelpersAppPermissionDto,
     HelpersAppPermissionGrantRequestDto,
     HelpersAppPermissionUpdateRequestDto,
+    HelperTaskBulkCreationRequestDto,
     HelperTaskCategoryDto,
     HelperTaskCreationRequestDto,
     HelperTaskDto,
+    HelperTaskHelpersAdditionRequestDto,
     HelperTaskMarkAsDoneRequestDto,
     HelperTaskUpdateRequestDto,
     HelperTaskValidationRequestDto,
@@ -71,19 +79,25 @@ async def helpers_permissions_revoke(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@api_helpers.get("/api/v1/helpers/task-categories")
+@api_helpers.get(
+    "/api/v1/helpers/task-categories", response_model=Sequence[HelperTaskCategoryDto]
+)
 async def helper_task_categories_get(
+    request: Request,
     controller: HelpersController = Depends(get_helpers_controller),
-) -> Sequence[HelperTaskCategoryDto]:
-    return await controller.find_all_task_categories()
+) -> Response:
+    return create_json_response_with_etag(
+        request, await controller.find_all_task_categories_serialised()
+    )
 
 
-@api_helpers.get("/api/v1/helpers/tasks")
+@api_helpers.get("/api/v1/helpers/tasks", response_model=Sequence[HelperTaskDto])
 async def helper_tasks_get(
+    request: Request,
     year: int | None = None,
     user: User = Depends(auth),
     controller: HelpersController = Depends(get_helpers_controller),
-) -> Sequence[HelperTaskDto]:
+) -> Response:
     if not _can_access_year(year, user):
         error_message = (
             f"You do not have permission to list tasks for {year}"
@@ -92,7 +106,30 @@ async def helper_tasks_get(
         )
         raise create_http_exception_403(error_message)
 
-    return await controller.find_all_tasks(year=year, published=_published(user))
+    return create_json_response_with_etag(
+        request,
+        await controller.find_all_tasks_serialised(
+            year=year, published=_published(user)
+        ),
+    )
+
+
+@api_helpers.get("/api/v1/helpers/tasks/export")
+async def helper_tasks_export(
+    year: int | None = None,
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    user: User = Depends(auth),
+    controller: HelpersController = Depends(get_helpers_controller),
+) -> StreamingResponse:
+    if not user.helpers_app_admin:
+        raise create_http_exception_403("You do not have permission to export tasks")
+
+    return create_export_response(
+        controller.stream_tasks(year=year),
+        dto_class=HelperTaskDto,
+        export_format=export_format,
+        filename=f"helper-tasks-{year}" if year else "helper-tasks",
+    )
 
 
 @api_helpers.get("/api/v1/helpers/tasks/{task_id}")
@@ -127,6 +164,26 @@ async def helper_tasks_create(
     return await controller.create_task(request, user)
 
 
+@api_helpers.post("/api/v1/helpers/tasks/bulk", response_model=Sequence[HelperTaskDto])
+async def helper_tasks_create_bulk(
+    request: HelperTaskBulkCreationRequestDto,
+    user: User = Depends(auth),
+    controller: HelpersController = Depends(get_helpers_controller),
+) -> Sequence[HelperTaskDto]:
+    if not user.helpers_app_admin and not user.helpers_app_editor:
+        raise create_http_exception_403(
+            "You do not have permission to create helper tasks"
+        )
+    if not user.helpers_app_admin and any(
+        task.contact_id != user.member_id for task in request.tasks
+    ):
+        raise create_http_exception_403(
+            "You have to be the contact for the tasks you create"
+        )
+
+    return await controller.create_tasks(request.tasks, user)
+
+
 @api_helpers.put("/api/v1/helpers/tasks/{task_id}")
 async def helper_tasks_update(
     task_id: int,
@@ -192,6 +249,20 @@ async def helper_tasks_helper_add(
     return await controller.add_helper(task_id, member_id, user)
 
 
+@api_helpers.post("/api/v1/helpers/tasks/{task_id}/helpers")
+async def helper_tasks_helpers_add(
+    task_id: int,
+    request: HelperTaskHelpersAdditionRequestDto,
+    user: User = Depends(auth),
+    controller: HelpersController = Depends(get_helpers_controller),
+) -> HelperTaskDto:
+    await _check_can_update(
+        task_id, contact_id=user.member_id, user=user, controller=controller
+    )
+
+    return await controller.add_helpers(task_id, request.member_ids, user)
+
+
 @api_helpers.delete("/api/v1/helpers/tasks/{task_id}/helpers/{member_id}")
 async def helper_tasks_helper_remove(
     task_id: int,
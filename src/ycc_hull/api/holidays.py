@@ -4,8 +4,9 @@
 
 from collections.abc import Sequence
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
+from ycc_hull.api.responses import create_json_response_with_etag
 from ycc_hull.app_controllers import get_holidays_controller
 from ycc_hull.auth import auth
 from ycc_hull.controllers.holidays_controller import HolidaysController
@@ -14,8 +15,11 @@
 api_holidays = APIRouter(dependencies=[Depends(auth)])
 
 
-@api_holidays.get("/api/v1/holidays")
+@api_holidays.get("/api/v1/holidays", response_model=Sequence[HolidayDto])
 async def holidays_get(
+    request: Request,
     controller: HolidaysController = Depends(get_holidays_controller),
-) -> Sequence[HolidayDto]:
-    return await controller.find_all()
+) -> Response:
+    return create_json_response_with_etag(
+        request, await controller.find_all_serialised()
+    )
@@ -4,8 +4,9 @@
 
 from collections.abc import Sequence
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
+from ycc_hull.api.responses import create_json_response_with_etag
 from ycc_hull.app_controllers import get_licences_controller
 from ycc_hull.auth import auth
 from ycc_hull.controllers.licences_controller import LicencesController
@@ -14,8 +15,13 @@
 api_licences = APIRouter(dependencies=[Depends(auth)])
 
 
-@api_licences.get("/api/v1/licence-infos")
+@api_licences.get(
+    "/api/v1/licence-infos", response_model=Sequence[LicenceDetailedInfoDto]
+)
 async def licence_infos_get(
+    request: Request,
     controller: LicencesController = Depends(get_licences_controller),
-) -> Sequence[LicenceDetailedInfoDto]:
-    return await controller.find_all_licence_infos()
+) -> Response:
+    return create_json_response_with_etag(
+        request, await controller.find_all_licence_infos_serialised()
+    )
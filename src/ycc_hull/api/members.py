@@ -5,9 +5,10 @@
 from collections.abc import Sequence
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from ycc_hull.api.errors import create_http_exception_403
+from ycc_hull.api.responses import create_json_response_with_etag
 from ycc_hull.app_controllers import get_members_controller
 from ycc_hull.auth import User, auth
 from ycc_hull.controllers.members_controller import MembersController
@@ -26,11 +27,14 @@ async def members_get(
     return await controller.find_all_public_infos(year=year)
 
 
-@api_members.get("/api/v1/membership-types")
+@api_members.get("/api/v1/membership-types", response_model=Sequence[MembershipTypeDto])
 async def membership_types_get(
+    request: Request,
     controller: MembersController = Depends(get_members_controller),
-) -> Sequence[MembershipTypeDto]:
-    return await controller.find_all_membership_types()
+) -> Response:
+    return create_json_response_with_etag(
+        request, await controller.find_all_membership_types_serialised()
+    )
 
 
 @api_members.get("/api/v1/users")
@@ -0,0 +1,24 @@
+"""
+Metrics API endpoints.
+"""
+
+from fastapi import APIRouter, Depends
+
+from ycc_hull.api.errors import create_http_exception_403
+from ycc_hull.app_controllers import get_metrics_controller
+from ycc_hull.auth import User, auth
+from ycc_hull.controllers.metrics_controller import MetricsController
+from ycc_hull.models.metrics_dtos import MetricsDto
+
+api_metrics = APIRouter(dependencies=[Depends(auth)])
+
+
+@api_metrics.get("/api/v1/metrics")
+async def metrics_get(
+    user: User = Depends(auth),
+    controller: MetricsController = Depends(get_metrics_controller),
+) -> MetricsDto:
+    if not user.helpers_app_admin:
+        raise create_http_exception_403("Forbidden")
+
+    return await controller.get_metrics()
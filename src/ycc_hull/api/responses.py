@@ -0,0 +1,150 @@
+"""
+API response utilities.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ycc_hull.controllers.reference_data_cache import SerialisedDtos
+from ycc_hull.models.export import ExportFormat
+
+# Rows are sent in chunks of about this size
+_EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Spreadsheet applications evaluate cells starting with these as formulas
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def create_json_response_with_etag(
+    request: Request, serialised: SerialisedDtos
+) -> Response:
+    """
+    Creates a JSON response with an ETag. If the client already has the same version (`If-None-Match`), the response is
+    304 Not Modified without body.
+
+    Args:
+        request (Request): request
+        serialised (SerialisedDtos): response body
+
+    Returns:
+        Response: response
+    """
+    # Clients may reuse the response, but must revalidate it first
+    headers = {"ETag": serialised.etag, "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request.headers.get("If-None-Match"), serialised.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=serialised.body, media_type="application/json", headers=headers
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate in ("*", etag):
+            return True
+
+    return False
+
+
+def create_export_response(
+    dtos: AsyncIterator[BaseModel],
+    *,
+    dto_class: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Creates a response which streams the DTOs as they are produced, so the memory use does not depend on their number.
+
+    Args:
+        dtos (AsyncIterator[BaseModel]): DTOs to export
+        dto_class (type[BaseModel]): DTO class, for the CSV header
+        export_format (ExportFormat): export format
+        filename (str): download file name without extension
+
+    Returns:
+        StreamingResponse: response
+    """
+    if export_format == ExportFormat.CSV:
+        content = _chunk(_to_csv_rows(dtos, dto_class))
+        media_type = "text/csv; charset=utf-8"
+        extension = "csv"
+    else:
+        content = _chunk(_to_ndjson_lines(dtos))
+        media_type = "application/x-ndjson"
+        extension = "ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{extension}"'
+        },
+    )
+
+
+async def _to_ndjson_lines(dtos: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for dto in dtos:
+        yield dto.model_dump_json(by_alias=True) + "\n"
+
+
+async def _to_csv_rows(
+    dtos: AsyncIterator[BaseModel], dto_class: type[BaseModel]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = [
+        field.alias or name
+        for name, field in dto_class.model_fields.items()
+        if not field.exclude
+    ]
+
+    def row(values: list[str]) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield row(columns)
+
+    async for dto in dtos:
+        values = dto.model_dump(mode="json", by_alias=True)
+        yield row([_to_csv_cell(values[column]) for column in columns])
+
+
+def _to_csv_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        # Shown as text, not evaluated
+        return "'" + value if value.startswith(_CSV_FORMULA_PREFIXES) else value
+    return json.dumps(value, ensure_ascii=False)
+
+
+async def _chunk(parts: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    chunk: list[str] = []
+    size = 0
+
+    async for part in parts:
+        chunk.append(part)
+        size += len(part)
+        if size >= _EXPORT_CHUNK_SIZE:
+            yield "".join(chunk).encode()
+            chunk.clear()
+            size = 0
+
+    if chunk:
+        yield "".join(chunk).encode()
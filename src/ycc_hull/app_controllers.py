@@ -10,6 +10,7 @@
 from ycc_hull.controllers.holidays_controller import HolidaysController
 from ycc_hull.controllers.licences_controller import LicencesController
 from ycc_hull.controllers.members_controller import MembersController
+from ycc_hull.controllers.metrics_controller import MetricsController
 
 
 @dataclass(frozen=True)
@@ -24,20 +25,29 @@ class Controllers:
     holidays_controller: HolidaysController
     licences_controller: LicencesController
     members_controller: MembersController
+    metrics_controller: MetricsController
 
 
-def init_app_controllers(app: FastAPI) -> None:
-    # Starlette's app.state is perfect to share this with the scheduler
-    app.state.controllers = Controllers(
+def create_controllers() -> Controllers:
+    """
+    Creates the controllers, for the API process and for the standalone worker.
+    """
+    return Controllers(
         audit_log_controller=AuditLogController(),
         boats_controller=BoatsController(),
         helpers_controller=HelpersController(),
         holidays_controller=HolidaysController(),
         licences_controller=LicencesController(),
         members_controller=MembersController(),
+        metrics_controller=MetricsController(),
     )
 
 
+def init_app_controllers(app: FastAPI) -> None:
+    # Starlette's app.state is perfect to share this with the scheduler
+    app.state.controllers = create_controllers()
+
+
 def get_controllers(app_or_request: FastAPI | Request) -> Controllers:
     app = app_or_request.app if isinstance(app_or_request, Request) else app_or_request
     return app.state.controllers
@@ -65,3 +75,7 @@ def get_licences_controller(app_or_request: Request) -> LicencesController:
 
 def get_members_controller(app_or_request: Request) -> MembersController:
     return get_controllers(app_or_request).members_controller
+
+
+def get_metrics_controller(app_or_request: Request) -> MetricsController:
+    return get_controllers(app_or_request).metrics_controller
@@ -2,15 +2,27 @@
 Keycloak authentication components.
 """
 
+import asyncio
+import hashlib
 import logging
+import time
 
+import httpx
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from keycloak import KeycloakOpenID
-from keycloak.exceptions import KeycloakAuthenticationError, KeycloakInvalidTokenError
+from keycloak.exceptions import (
+    KeycloakAuthenticationError,
+    KeycloakConnectionError,
+    KeycloakError,
+    KeycloakGetError,
+    KeycloakInvalidTokenError,
+)
 
-from ycc_hull.api.errors import create_http_exception_401
-from ycc_hull.config import CONFIG
+from ycc_hull.api.errors import create_http_exception_401, create_http_exception_503
+from ycc_hull.cache import CacheStats, TtlCache
+from ycc_hull.config import CONFIG, TokenValidation
+from ycc_hull.jwks import JwksTokenVerifier, TokenVerificationError
 from ycc_hull.models.user import User
 from ycc_hull.utils import full_type_name
 
@@ -22,6 +34,9 @@
 )
 _INACTIVE_USER = "Inactive user. Please contact the club."
 _INACTIVE_MEMBER = "Inactive member. Please contact the club."
+_AUTHENTICATION_UNAVAILABLE = (
+    "Authentication service unavailable. Please try again later."
+)
 
 
 _KEYCLOAK = KeycloakOpenID(
@@ -29,15 +44,69 @@
     realm_name=CONFIG.keycloak.realm,
     client_id=CONFIG.keycloak.client,
     client_secret_key=CONFIG.keycloak.client_secret,
+    timeout=CONFIG.keycloak.timeout_seconds,
 )
 
 
+_ISSUER = f"{CONFIG.keycloak.server_url}/realms/{CONFIG.keycloak.realm}"
+
 # Programmatic access to the token endpoint: _KEYCLOAK.well_known()["token_endpoint"]
-TOKEN_ENDPOINT = f"{CONFIG.keycloak.server_url}/realms/{CONFIG.keycloak.realm}/protocol/openid-connect/token"
+TOKEN_ENDPOINT = f"{_ISSUER}/protocol/openid-connect/token"
+_USERINFO_ENDPOINT = f"{_ISSUER}/protocol/openid-connect/userinfo"
 _logger.info("Initialising OAuth 2 scheme with token endpoint: %s", TOKEN_ENDPOINT)
 _OAUTH2_SCHEME = OAuth2PasswordBearer(tokenUrl=TOKEN_ENDPOINT)
 
 
+async def _fetch_jwks() -> dict:
+    return await _KEYCLOAK.a_certs()
+
+
+async def _userinfo(token: str) -> dict:
+    # KeycloakOpenID.a_userinfo() swaps the Authorization header of the shared connection around an await, which
+    # mixes up the tokens of concurrent requests. Same pooled client, but the bearer is only set on this request.
+    connection = _KEYCLOAK.connection
+    try:
+        response = await connection.async_s.get(
+            _USERINFO_ENDPOINT,
+            headers={**connection.headers, "Authorization": f"Bearer {token}"},
+            timeout=connection.timeout,
+        )
+    except httpx.HTTPError as exc:
+        raise KeycloakConnectionError("Can't connect to server") from exc
+
+    if response.status_code != httpx.codes.OK:
+        error = (
+            KeycloakAuthenticationError
+            if response.status_code == httpx.codes.UNAUTHORIZED
+            else KeycloakGetError
+        )
+        raise error(
+            error_message=response.text,
+            response_code=response.status_code,
+            response_body=response.content,
+        )
+
+    return response.json()
+
+
+async def close_keycloak_connection() -> None:
+    """
+    Closes the pooled HTTP connections to Keycloak.
+    """
+    await _KEYCLOAK.connection.aclose()
+
+
+_TOKEN_VALIDATION = CONFIG.keycloak.token_validation
+_logger.info("Token validation: %s", _TOKEN_VALIDATION.value)
+_JWKS_VERIFIER = JwksTokenVerifier(_fetch_jwks, issuer=_ISSUER)
+
+# Keyed by token hash, so the cache does not hold the tokens themselves
+_TOKEN_CACHE: TtlCache[str, User] = TtlCache(
+    max_size=CONFIG.keycloak.token_cache_max_size,
+    ttl_seconds=CONFIG.keycloak.token_cache_ttl_seconds,
+)
+
+
 def _create_user(user_info: dict, token_info: dict) -> User:
     """
     Creates a user.
@@ -107,7 +176,7 @@ def _create_user(user_info: dict, token_info: dict) -> User:
         email=user_info.get("email", token_info.get("email")),
         first_name=user_info.get("given_name", token_info.get("given_name")),
         last_name=user_info.get("family_name", token_info.get("family_name")),
-        groups=tuple(user_info.get("groups", [])),
+        groups=tuple(user_info.get("groups", token_info.get("groups", []))),
         roles=tuple(
             user_info.get("roles", token_info.get("realm_access", {}).get("roles", []))
         ),
@@ -118,34 +187,22 @@ async def auth(token: str = Depends(_OAUTH2_SCHEME)) -> User:
     """
     Authentication dependency.
 
+    Validated tokens are cached, see `KeycloakConfig.token_cache_ttl_seconds`.
+
     Args:
         token (str): OAuth 2 scheme bearer
 
     Raises:
-        HTTPException: 401 Unauthorized
+        HTTPException: 401 Unauthorized, 503 Service Unavailable if Keycloak is unavailable
 
     Returns:
         User: user object
     """
     _logger.debug("Authenticating...")
     try:
-        _logger.debug("Token: %s", token)
-
-        user_info = _KEYCLOAK.userinfo(token)  # cspell:disable-line
-        _logger.debug("User info: %s", user_info)
-        token_info = _KEYCLOAK.introspect(token)
-        _logger.debug("Token info: %s", token_info)
-
-        if not token_info["active"]:
-            _logger.warning("Authentication failed")
-            raise create_http_exception_401(_INACTIVE_USER)
-
-        user = _create_user(user_info=user_info, token_info=token_info)
-        _logger.debug("Authentication succeeded: %s", user)
-
-        if not user.active_member:
-            _logger.info("Inactive member: %s, roles: %s", user.username, user.roles)
-            raise create_http_exception_401(_INACTIVE_MEMBER)
+        user = await _TOKEN_CACHE.get_or_load(
+            _hash_token(token), lambda: _validate_token(token)
+        )
 
         _logger.info(
             "Active member: %s (%d), groups: %s, roles: %s",
@@ -155,10 +212,83 @@ async def auth(token: str = Depends(_OAUTH2_SCHEME)) -> User:
             user.roles,
         )
         return user
-    except (KeycloakAuthenticationError, KeycloakInvalidTokenError) as exc:
+    except (
+        KeycloakAuthenticationError,
+        KeycloakInvalidTokenError,
+        TokenVerificationError,
+    ) as exc:
         _logger.warning(
             "Authentication failed: %s: %s", full_type_name(exc.__class__), exc
         )
         raise create_http_exception_401(  # pylint: disable=raise-missing-from
             _AUTHENTICATION_FAILED
         )
+    except KeycloakError as exc:
+        # Keycloak rejected the request (e.g., expired token): 4xx, no response or 5xx: unavailable
+        rejected = exc.response_code is not None and 400 <= exc.response_code < 500
+        _logger.warning(
+            "Authentication failed, Keycloak %s: %s: %s",
+            "rejected the request" if rejected else "unavailable",
+            full_type_name(exc.__class__),
+            exc,
+        )
+        raise (  # pylint: disable=raise-missing-from
+            create_http_exception_401(_AUTHENTICATION_FAILED)
+            if rejected
+            else create_http_exception_503(_AUTHENTICATION_UNAVAILABLE)
+        )
+
+
+async def _validate_token(token: str) -> tuple[User, float | None]:
+    """
+    Validates the token as configured by `KeycloakConfig.token_validation`.
+
+    Args:
+        token (str): OAuth 2 scheme bearer
+
+    Raises:
+        HTTPException: 401 Unauthorized
+
+    Returns:
+        tuple[User, float | None]: user object and the remaining lifetime of the token in seconds (if known)
+    """
+    _logger.debug("Token: %s", token)
+
+    if _TOKEN_VALIDATION == TokenValidation.JWKS:
+        user_info: dict = {}
+        token_info = await _JWKS_VERIFIER.verify(token)
+        _logger.debug("Token claims: %s", token_info)
+    else:
+        try:
+            # If one request fails, the other one is cancelled
+            async with asyncio.TaskGroup() as task_group:
+                user_info_task = task_group.create_task(_userinfo(token))
+                token_info_task = task_group.create_task(_KEYCLOAK.a_introspect(token))
+        except ExceptionGroup as exc:
+            raise next(iter(exc.exceptions))  # pylint: disable=raise-missing-from
+        user_info = user_info_task.result()
+        token_info = token_info_task.result()
+        _logger.debug("User info: %s", user_info)
+        _logger.debug("Token info: %s", token_info)
+
+        if not token_info["active"]:
+            _logger.warning("Authentication failed")
+            raise create_http_exception_401(_INACTIVE_USER)
+
+    user = _create_user(user_info=user_info, token_info=token_info)
+    _logger.debug("Authentication succeeded: %s", user)
+
+    if not user.active_member:
+        _logger.info("Inactive member: %s, roles: %s", user.username, user.roles)
+        raise create_http_exception_401(_INACTIVE_MEMBER)
+
+    expires_at = token_info.get("exp")
+    return user, (expires_at - time.time() if expires_at is not None else None)
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_cache_stats() -> CacheStats:
+    return _TOKEN_CACHE.stats
@@ -0,0 +1,86 @@
+"""
+Background jobs: the scheduler and the email outbox worker. Run by the API process, or by the standalone worker (`poetry
+run worker`) so the API process only serves requests.
+"""
+
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from ycc_hull.app_controllers import Controllers
+from ycc_hull.controllers.audit_log_sink import AUDIT_LOG_SINK
+from ycc_hull.controllers.notifications.email_outbox import EMAIL_OUTBOX_WORKER
+from ycc_hull.controllers.notifications.smtp import close_smtp_connection_pool
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.invalidation import INVALIDATION_BUS
+from ycc_hull.scheduler import init_scheduler
+from ycc_hull.scheduler_lock import SCHEDULER_LEADER_ELECTION
+from ycc_hull.utils import full_type_name
+
+_logger = logging.getLogger(__name__)
+
+
+async def start_common_services() -> None:
+    """
+    Starts the services needed by both the API process and the standalone worker.
+    """
+    _logger.info("Starting the audit log sink")
+    await AUDIT_LOG_SINK.start()
+
+    _logger.info("Starting the cache invalidation bus")
+    await INVALIDATION_BUS.start()
+
+
+async def stop_common_services() -> None:
+    """
+    Stops the services started by `start_common_services()` and closes the connections.
+    """
+    _logger.info("Writing the queued audit log entries...")
+    await AUDIT_LOG_SINK.stop()
+    _logger.info("Closing DB connection...")
+    await DatabaseContextHolder.context.close()
+    _logger.info("Stopping the cache invalidation bus...")
+    await INVALIDATION_BUS.stop()
+    _logger.info("Closing SMTP connections...")
+    await close_smtp_connection_pool()
+
+
+class BackgroundJobs:
+    """
+    Starts and stops the background jobs of a process.
+    """
+
+    def __init__(self, controllers: Controllers) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._controllers = controllers
+        self._scheduler: AsyncIOScheduler | None = None
+
+    async def start(self) -> None:
+        self._logger.info("Starting the email outbox worker")
+        await EMAIL_OUTBOX_WORKER.start()
+
+        self._scheduler = init_scheduler(self._controllers)
+        if self._scheduler.get_jobs():
+            self._logger.info("Starting the scheduler leader election")
+            await SCHEDULER_LEADER_ELECTION.start()
+        else:
+            self._logger.info(
+                "No scheduled jobs, not taking part in the scheduler leader election"
+            )
+
+        self._logger.info("Starting the scheduler")
+        self._scheduler.start()
+
+    async def stop(self) -> None:
+        """
+        Stops the background jobs. Emails not sent yet stay in the outbox.
+        """
+        if self._scheduler is not None:
+            self._logger.info("Stopping the scheduler...")
+            self._scheduler.shutdown()
+            self._scheduler = None
+
+        self._logger.info("Releasing the scheduler lease...")
+        await SCHEDULER_LEADER_ELECTION.stop()
+        self._logger.info("Stopping the email outbox worker...")
+        await EMAIL_OUTBOX_WORKER.stop()
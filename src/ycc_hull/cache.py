@@ -0,0 +1,184 @@
+"""
+In-process caches.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Cache statistics.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    collapsed: int
+    """Lookups which waited for an already in-flight load of the same key instead of loading it again."""
+
+
+class TtlCache(Generic[K, V]):  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded cache with per-entry expiry. None values are not supported.
+
+    When full, the least recently used entry is evicted. Concurrent `get_or_load()` calls for the same key are
+    collapsed into a single load. A TTL of zero (or less) disables the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"Invalid cache size: {max_size}")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._in_flight: dict[K, asyncio.Future[V]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._collapsed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            collapsed=self._collapsed,
+        )
+
+    def get(self, key: K) -> V | None:
+        """
+        Gets a value from the cache.
+
+        Args:
+            key (K): cache key
+
+        Returns:
+            V | None: the cached value or None if the key is not cached or the entry has expired
+        """
+        value = self._get(key)
+
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+        return value
+
+    def _get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V, *, max_age_seconds: float | None = None) -> None:
+        """
+        Puts a value in the cache.
+
+        Args:
+            key (K): cache key
+            value (V): value
+            max_age_seconds (float, optional): Maximum age of the entry. The entry never lives longer than the
+                cache TTL. Defaults to None (cache TTL).
+        """
+        ttl_seconds = (
+            self._ttl_seconds
+            if max_age_seconds is None
+            else min(self._ttl_seconds, max_age_seconds)
+        )
+        if ttl_seconds <= 0:
+            return
+
+        self._entries[key] = (value, self._clock() + ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[tuple[V, float | None]]],
+    ) -> V:
+        """
+        Gets a value from the cache or loads it if it is not cached.
+
+        If a load for the same key is already in progress, waits for its result instead of loading the value again.
+        Failed loads are not cached, the exception is propagated to all waiting callers.
+
+        Args:
+            key (K): cache key
+            loader (Callable[[], Awaitable[tuple[V, float | None]]]): Loads the value and returns it together with
+                its maximum age in seconds (None for the cache TTL).
+
+        Returns:
+            V: the cached or loaded value
+        """
+        if not self.enabled:
+            value, _ = await loader()
+            return value
+
+        cached_value = self._get(key)
+        if cached_value is not None:
+            self._hits += 1
+            return cached_value
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._collapsed += 1
+            return await asyncio.shield(in_flight)
+
+        self._misses += 1
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            value, max_age_seconds = await loader()
+            self.put(key, value, max_age_seconds=max_age_seconds)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case nobody else was waiting for it
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
@@ -24,6 +24,79 @@ class Environment(str, Enum):
     LOCAL = "LOCAL"
 
 
+class AuditLogDataFormat(str, Enum):
+    """
+    Audit log data format.
+    """
+
+    PRETTY = "PRETTY"
+    """Indented JSON with the old and new objects of changes."""
+    COMPACT = "COMPACT"
+    """JSON without whitespace, changes only identify the old and new objects (next to the diff)."""
+
+
+class AuditLogDataConfig(CamelisedBaseModel):
+    """
+    Audit log data configuration.
+    """
+
+    format: AuditLogDataFormat = AuditLogDataFormat.PRETTY
+    compression_threshold: int | None = Field(
+        default=None,
+        description="Data longer than this many characters is stored compressed. If None, data is not compressed.",
+    )
+
+
+class AuditLogSinkConfig(CamelisedBaseModel):
+    """
+    Audit log sink configuration.
+    """
+
+    max_queue_size: int = Field(
+        default=10000,
+        description="Maximum number of entries waiting to be written. When full, entries are dropped.",
+    )
+    batch_size: int = Field(
+        default=100, description="Maximum number of entries written at once."
+    )
+    flush_interval_seconds: float = Field(
+        default=1,
+        description="Maximum time an entry waits in the queue when the batch is not full.",
+    )
+
+
+class DatabasePoolConfig(CamelisedBaseModel):
+    """
+    Database connection pool configuration.
+    """
+
+    size: int = Field(default=5, description="Number of connections kept open.")
+    max_overflow: int = Field(
+        default=10,
+        description="Additional connections opened under load on top of `size`.",
+    )
+    timeout_seconds: float = Field(
+        default=30,
+        description="How long to wait for a free connection before failing the request.",
+    )
+    recycle_seconds: int = Field(
+        default=3600,
+        description="Connections older than this are replaced, so firewalls do not drop them silently. -1 disables recycling.",
+    )
+    pre_ping: bool = Field(
+        default=True,
+        description="Whether to check connections before use. The native pool only checks connections idle for more than 60 seconds.",
+    )
+    native: bool = Field(
+        default=False,
+        description="Whether to use the python-oracledb connection pool instead of the SQLAlchemy one (Oracle only).",
+    )
+    drcp_connection_class: str | None = Field(
+        default=None,
+        description="DRCP connection class for the native pool. If set, the sessions are reused across connections of the same class.",
+    )
+
+
 class EmailConfig(CamelisedBaseModel):
     """
     Email configuration.
@@ -38,6 +111,73 @@ class EmailConfig(CamelisedBaseModel):
     smtp_start_tls: bool
     smtp_username: str | None = None
     smtp_password: str | None = None
+    smtp_pool_size: int = Field(
+        default=2,
+        description="Maximum number of SMTP connections, i.e., messages sent concurrently.",
+    )
+    smtp_idle_timeout_seconds: float = Field(
+        default=60,
+        description="Pooled SMTP connections idle for longer than this are closed.",
+    )
+    smtp_health_check_seconds: float = Field(
+        default=10,
+        description="Pooled SMTP connections idle for longer than this are checked (NOOP) before reuse.",
+    )
+
+
+class EmailOutboxConfig(CamelisedBaseModel):
+    """
+    Email outbox worker configuration.
+    """
+
+    concurrency: int = Field(
+        default=2, description="Maximum number of emails sent concurrently."
+    )
+    rate_per_second: float = Field(
+        default=2, description="Maximum sustained number of emails sent per second."
+    )
+    burst: int = Field(
+        default=10,
+        description="Maximum number of emails sent at once after the worker was idle.",
+    )
+    batch_size: int = Field(
+        default=50, description="Maximum number of emails claimed at once."
+    )
+    poll_interval_seconds: float = Field(
+        default=10,
+        description=(
+            "How often the worker looks for due emails. Emails enqueued by this process wake the worker immediately."
+        ),
+    )
+    lease_seconds: float = Field(
+        default=300,
+        description=(
+            "How long an email is reserved for the worker sending it before other workers may send it. Emails are"
+            " claimed one by one right before sending, so this must exceed the SMTP timeouts of a single send."
+        ),
+    )
+    max_attempts: int = Field(
+        default=8,
+        description="Emails which could not be sent after this many attempts are dead-lettered (status DEAD).",
+    )
+    backoff_base_seconds: float = Field(
+        default=30,
+        description="Delay before the first retry, doubled for every attempt.",
+    )
+    backoff_max_seconds: float = Field(
+        default=3600, description="Maximum delay between two attempts."
+    )
+
+
+class TokenValidation(str, Enum):
+    """
+    Token validation mode enumeration.
+    """
+
+    INTROSPECTION = "INTROSPECTION"
+    """Asks Keycloak for the user info and introspects the token on every validation."""
+    JWKS = "JWKS"
+    """Verifies the token signature locally against the cached JWKS of the realm. Revoked tokens are accepted until they expire."""
 
 
 class KeycloakConfig(CamelisedBaseModel):
@@ -50,6 +190,20 @@ class KeycloakConfig(CamelisedBaseModel):
     client: str
     client_secret: str
     swagger_client: str | None = None
+    timeout_seconds: int = Field(
+        default=10, description="Timeout of the requests to Keycloak."
+    )
+    token_validation: TokenValidation = TokenValidation.INTROSPECTION
+    token_cache_ttl_seconds: int = Field(
+        default=60,
+        description=(
+            "How long a validated token is cached. Entries never outlive the token expiry. "
+            "Revoked tokens are accepted until their entry expires. 0 disables the cache."
+        ),
+    )
+    token_cache_max_size: int = Field(
+        default=1000, description="Maximum number of cached tokens."
+    )
 
 
 class NotificationsConfig(CamelisedBaseModel):
@@ -63,6 +217,31 @@ class NotificationsConfig(CamelisedBaseModel):
             "If None, notifications are disabled."
         )
     )
+    reminder_catch_up_days: int = Field(
+        default=1,
+        description=(
+            "Upcoming task reminders of at most this many days missed since the last successful run (e.g., the daily "
+            "run failed) are still sent."
+        ),
+    )
+
+
+class SchedulerLockConfig(CamelisedBaseModel):
+    """
+    Scheduler leader election configuration.
+    """
+
+    lease_seconds: float = Field(
+        default=60,
+        description=(
+            "How long the scheduler leader holds its lease without renewing it. If the leader dies, another worker "
+            "takes over after this."
+        ),
+    )
+    renew_interval_seconds: float = Field(
+        default=15,
+        description="How often the leader renews its lease and the other workers try to take over an expired one.",
+    )
 
 
 class YccAppConfig(CamelisedBaseModel):
@@ -82,11 +261,52 @@ class Config(CamelisedBaseModel):
     model_config = ConfigDict(frozen=True)
 
     environment: Environment
+    api_runs_background_jobs: bool = Field(
+        default=True,
+        description=(
+            "Whether the API process also runs the background jobs (scheduler, email outbox worker). Set to false "
+            "when running them in the standalone worker (`poetry run worker`)."
+        ),
+    )
+    audit_log_data: AuditLogDataConfig = AuditLogDataConfig()
+    audit_log_sink: AuditLogSinkConfig = AuditLogSinkConfig()
     database_url: str
+    database_pool: DatabasePoolConfig = DatabasePoolConfig()
     cors_origins: frozenset[str]
     email: EmailConfig | None = None
+    email_outbox: EmailOutboxConfig = EmailOutboxConfig()
     keycloak: KeycloakConfig
+    helper_task_list_cache_ttl_seconds: int = Field(
+        default=60,
+        description=(
+            "How long helper task lists are cached. Changes invalidate the lists immediately in this process and, "
+            "with an invalidation bus, in the other processes. Otherwise changes made by other processes are visible "
+            "after this. 0 disables the cache."
+        ),
+    )
+    invalidation_bus_url: str | None = Field(
+        default=None,
+        description=(
+            "Redis URL (e.g., `redis://localhost:6379/0`) of the cache invalidation bus shared by the workers, "
+            "requires the `redis` extra. If None, caches are invalidated only in the process making the change."
+        ),
+    )
+    invalidation_bus_timeout_seconds: float = Field(
+        default=2,
+        description=(
+            "Connect and publish timeout of the cache invalidation bus. Changes are published after the commit, a "
+            "slow or hanging server delays the response at most this long."
+        ),
+    )
     notifications: NotificationsConfig
+    reference_data_cache_ttl_seconds: int = Field(
+        default=3600,
+        description=(
+            "How long reference data (boats, holidays, licence infos, membership types, helper task categories) is cached. "
+            "Changes made outside of this application are visible after this. 0 disables the cache."
+        ),
+    )
+    scheduler_lock: SchedulerLockConfig = SchedulerLockConfig()
     uvicorn_port: int
     ycc_app: YccAppConfig
 
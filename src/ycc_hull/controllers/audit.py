@@ -9,7 +9,13 @@
 from pydantic import BaseModel
 
 from ycc_hull.auth import User
-from ycc_hull.config import CONFIG, Environment
+from ycc_hull.config import (
+    CONFIG,
+    AuditLogDataConfig,
+    AuditLogDataFormat,
+    Environment,
+)
+from ycc_hull.db.audit_data import encode_audit_data
 from ycc_hull.db.entities import AuditLogEntryEntity
 from ycc_hull.utils import full_type_name
 
@@ -36,12 +42,47 @@ def _to_pretty_json(obj: Any) -> str:
     return json.dumps(obj, indent=2, default=_to_json_dict)
 
 
+def _to_compact_json(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=_to_json_dict)
+
+
+def _to_identifier(obj: Any) -> Any:
+    if isinstance(obj, BaseModel) and "id" in obj.__class__.model_fields:
+        return {"@type": full_type_name(obj.__class__), "id": getattr(obj, "id")}
+    return obj
+
+
+def _compact(data: dict) -> dict:
+    # The diff has the changes, the objects are only identified
+    if "diff" not in data:
+        return data
+    return {
+        key: _to_identifier(value) if key in ("old", "new") else value
+        for key, value in data.items()
+    }
+
+
+def _encode(data: dict, config: AuditLogDataConfig) -> str:
+    if config.format == AuditLogDataFormat.COMPACT:
+        json_data = _to_compact_json(_compact(data))
+    else:
+        json_data = _to_pretty_json(data)
+
+    return encode_audit_data(
+        json_data, compression_threshold=config.compression_threshold
+    )
+
+
 def create_audit_entry(
-    user: User, description: str, data: dict | None = None
+    user: User,
+    description: str,
+    data: dict | None = None,
+    *,
+    config: AuditLogDataConfig = CONFIG.audit_log_data,
 ) -> AuditLogEntryEntity:
     return AuditLogEntryEntity(
         application=_APPLICATION,
         principal=user.username,
         description=description,
-        data=_to_pretty_json(data) if data else None,
+        data=_encode(data, config) if data else None,
     )
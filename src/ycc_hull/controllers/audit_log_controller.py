@@ -2,36 +2,97 @@
 Audit log controller.
 """
 
-from collections.abc import Sequence
+import base64
+import binascii
+import json
+from collections.abc import AsyncGenerator
+from datetime import date, datetime, time, timedelta
 
-from sqlalchemy import delete, desc, select
+from sqlalchemy import ColumnElement, and_, delete, desc, or_, select
 from sqlalchemy.orm import defer
 
 from ycc_hull.controllers.base_controller import BaseController
-from ycc_hull.controllers.exceptions import ControllerNotFoundException
+from ycc_hull.controllers.exceptions import (
+    ControllerBadRequestException,
+    ControllerNotFoundException,
+)
 from ycc_hull.db.entities import AuditLogEntryEntity
 from ycc_hull.models.audit_log_dtos import (
     AuditLogEntriesDeleteRequestDto,
+    AuditLogEntriesFilterDto,
+    AuditLogEntriesPageDto,
+    AuditLogEntriesQueryDto,
     AuditLogEntryDto,
 )
 from ycc_hull.models.user import User
 
+# Newest first, the ID makes the order total (and the keyset unique)
+_ORDER = (desc(AuditLogEntryEntity.created_at), desc(AuditLogEntryEntity.id))
+
 
 class AuditLogController(BaseController):
     """
     Audit log controller. Returns DTO objects.
     """
 
-    async def find_all_entries(self) -> Sequence[AuditLogEntryDto]:
-        return await self.database_context.query_all(
-            select(AuditLogEntryEntity)
-            .options(
-                defer(AuditLogEntryEntity.data, raiseload=True),
+    async def find_entries(
+        self, query: AuditLogEntriesQueryDto
+    ) -> AuditLogEntriesPageDto:
+        """
+        Finds a page of entries, from the newest to the oldest. Pages are fetched by keyset (`created_at`, `id`), so
+        each page costs the same, regardless of how deep it is.
+
+        Args:
+            query (AuditLogEntriesQueryDto): filters and page
+
+        Returns:
+            AuditLogEntriesPageDto: the page
+        """
+        # One more entry to know whether there is a next page
+        entries: list[AuditLogEntryEntity] = list(
+            await self.database_context.query_all(
+                select(AuditLogEntryEntity)
+                .options(
+                    defer(AuditLogEntryEntity.data, raiseload=True),
+                )
+                .where(*_create_filters(query))
+                .where(*_create_cursor_filters(query.cursor))
+                .order_by(*_ORDER)
+                .limit(query.limit + 1),
             )
-            .order_by(desc(AuditLogEntryEntity.created_at)),
-            async_transformer=AuditLogEntryDto.create_without_large_fields,
+        )
+        has_next_page = len(entries) > query.limit
+        if has_next_page:
+            entries.pop()
+
+        return AuditLogEntriesPageDto(
+            entries=[
+                await AuditLogEntryDto.create_without_large_fields(entry)
+                for entry in entries
+            ],
+            next_cursor=_encode_cursor(entries[-1]) if has_next_page else None,
         )
 
+    async def stream_entries(
+        self, entries_filter: AuditLogEntriesFilterDto
+    ) -> AsyncGenerator[AuditLogEntryDto, None]:
+        """
+        Streams all matching entries with their data, from the newest to the oldest, for exports.
+
+        Args:
+            entries_filter (AuditLogEntriesFilterDto): filters
+
+        Yields:
+            AuditLogEntryDto: entries
+        """
+        async for entry in self.database_context.stream_all(
+            select(AuditLogEntryEntity)
+            .where(*_create_filters(entries_filter))
+            .order_by(*_ORDER),
+            batch_transformer=AuditLogEntryDto.create_many,
+        ):
+            yield entry
+
     async def get_entry_by_id(
         self,
         entry_id: int,
@@ -49,7 +110,7 @@ async def get_entry_by_id(
     async def delete_entries(
         self, request: AuditLogEntriesDeleteRequestDto, user: User
     ) -> None:
-        with self.database_action(
+        async with self.database_action(
             action="Audit Log / Delete Entries", user=user, details={"request": request}
         ) as session:
             self._logger.info(
@@ -58,13 +119,13 @@ async def delete_entries(
                 user.username,
             )
 
-            result = session.execute(
+            result = await session.execute(
                 delete(AuditLogEntryEntity).where(
                     AuditLogEntryEntity.created_at < request.cutoff_date,
                 )
             )
 
-            session.commit()
+            await session.commit()
 
             self._logger.info(
                 "Deleted %d audit log entries older than %s, user: %s",
@@ -72,6 +133,67 @@ async def delete_entries(
                 request.cutoff_date,
                 user.username,
             )
-            self._audit_log(
-                session, user, f"AuditLog/DeleteEntriesBefore/{request.cutoff_date}"
+            await self._audit_log(
+                user, f"AuditLog/DeleteEntriesBefore/{request.cutoff_date}"
+            )
+
+
+def _create_filters(query: AuditLogEntriesFilterDto) -> list[ColumnElement[bool]]:
+    filters: list[ColumnElement[bool]] = []
+
+    if query.principal:
+        filters.append(AuditLogEntryEntity.principal == query.principal)
+    if query.description_prefix:
+        filters.append(
+            AuditLogEntryEntity.description.startswith(
+                query.description_prefix, autoescape=True
             )
+        )
+    if query.created_from:
+        filters.append(
+            AuditLogEntryEntity.created_at >= _start_of_day(query.created_from)
+        )
+    if query.created_to:
+        filters.append(
+            AuditLogEntryEntity.created_at
+            < _start_of_day(query.created_to + timedelta(days=1))
+        )
+
+    return filters
+
+
+def _create_cursor_filters(cursor: str | None) -> list[ColumnElement[bool]]:
+    if not cursor:
+        return []
+
+    created_at, entry_id = _decode_cursor(cursor)
+    return [
+        or_(
+            AuditLogEntryEntity.created_at < created_at,
+            and_(
+                AuditLogEntryEntity.created_at == created_at,
+                AuditLogEntryEntity.id < entry_id,
+            ),
+        )
+    ]
+
+
+def _start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time())
+
+
+def _encode_cursor(entry: AuditLogEntryEntity) -> str:
+    # Opaque for the clients, the time is stored as in the database (local time without time zone)
+    return base64.urlsafe_b64encode(
+        json.dumps([entry.created_at.isoformat(), entry.id]).encode()
+    ).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, entry_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(entry_id, int):
+            raise ValueError(f"Invalid id: {entry_id}")
+        return datetime.fromisoformat(created_at), entry_id
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ControllerBadRequestException("Invalid cursor") from exc
@@ -0,0 +1,156 @@
+"""
+Audit log sink: writes audit log entries in batches, off the request path.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ycc_hull.config import CONFIG
+from ycc_hull.db.context import DatabaseContext, DatabaseContextHolder
+from ycc_hull.db.entities import AuditLogEntryEntity
+from ycc_hull.utils import full_type_name
+
+
+@dataclass(frozen=True)
+class AuditLogSinkStats:
+    """
+    Audit log sink statistics.
+    """
+
+    queue_size: int
+    max_queue_size: int
+    written: int
+    dropped: int
+    """Entries rejected because the queue was full."""
+    failed: int
+    """Entries lost because their batch could not be written."""
+
+
+class AuditLogSink:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded queue of audit log entries drained by a single writer, which inserts them in batches in its own session.
+
+    A batch is written when it is full, or at the latest after the flush interval. When the queue is full, entries
+    are dropped (and logged) instead of blocking the actions. Until the sink is started (e.g., in tests and scripts),
+    entries are written immediately.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        database_context: Callable[
+            [], DatabaseContext
+        ] = lambda: DatabaseContextHolder.context,
+    ) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._queue: asyncio.Queue[AuditLogEntryEntity] = asyncio.Queue(max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._database_context = database_context
+        self._writer: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def started(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def stats(self) -> AuditLogSinkStats:
+        return AuditLogSinkStats(
+            queue_size=self._queue.qsize(),
+            max_queue_size=self._queue.maxsize,
+            written=self._written,
+            dropped=self._dropped,
+            failed=self._failed,
+        )
+
+    async def start(self) -> None:
+        if self._writer is None:
+            self._stopping = False
+            self._writer = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the sink after writing the queued entries.
+        """
+        if self._writer is not None:
+            self._stopping = True
+            await self._writer
+            self._writer = None
+
+    async def write(self, entry: AuditLogEntryEntity) -> None:
+        """
+        Queues the entry, or writes it immediately if the sink is not started. Never raises.
+
+        Args:
+            entry (AuditLogEntryEntity): entry
+        """
+        if not self.started:
+            await self._write_batch([entry])
+            return
+
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            self._logger.error(
+                "Audit log queue full, dropped entry: %s, principal: %s",
+                entry.description,
+                entry.principal,
+            )
+
+    async def _run(self) -> None:
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._write_batch(batch)
+
+    async def _next_batch(self) -> list[AuditLogEntryEntity]:
+        batch: list[AuditLogEntryEntity] = []
+        loop = asyncio.get_running_loop()
+        # Without entries, wakes up every interval to check whether the sink is stopping
+        deadline = loop.time() + self._flush_interval_seconds
+
+        while len(batch) < self._batch_size:
+            if self._stopping and self._queue.empty():
+                break
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+
+        return batch
+
+    async def _write_batch(self, batch: list[AuditLogEntryEntity]) -> None:
+        try:
+            async with self._database_context().session() as session:
+                session.add_all(batch)
+                await session.commit()
+            self._written += len(batch)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._failed += len(batch)
+            self._logger.exception(
+                "Failed to write %d audit log entries: %s",
+                len(batch),
+                [entry.description for entry in batch],
+            )
+
+
+AUDIT_LOG_SINK = AuditLogSink(
+    max_queue_size=CONFIG.audit_log_sink.max_queue_size,
+    batch_size=CONFIG.audit_log_sink.batch_size,
+    flush_interval_seconds=CONFIG.audit_log_sink.flush_interval_seconds,
+)
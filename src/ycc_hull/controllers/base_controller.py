@@ -2,18 +2,18 @@
 Base controller.
 """
 
-import asyncio
 import logging
 import re
 from abc import ABCMeta
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 from pprint import pformat
-from typing import Any, Coroutine, Generator
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.exc import DatabaseError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ycc_hull.controllers.audit import create_audit_entry
+from ycc_hull.controllers.audit_log_sink import AUDIT_LOG_SINK
 from ycc_hull.controllers.exceptions import ControllerConflictException
 from ycc_hull.db.context import DatabaseContext, DatabaseContextHolder
 from ycc_hull.db.entities import BaseEntity
@@ -34,16 +34,16 @@ def __init__(self) -> None:
     def database_context(self) -> DatabaseContext:
         return DatabaseContextHolder.context
 
-    @contextmanager
-    def database_action(
+    @asynccontextmanager
+    async def database_action(
         self,
         *,
         action: str,
         # None is allowed but must be explicit
         user: User | None,
         details: dict[str, Any] | None,
-    ) -> Generator[Session, None, None]:
-        with self.database_context.session() as session:
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with self.database_context.session() as session:
             try:
                 yield session
             except DatabaseError as exc:
@@ -102,20 +102,16 @@ def _update_entity_from_dto(
         for field, value in request.__dict__.items():
             setattr(entity, field, value)
 
-    def _audit_log(
-        self, session: Session, user: User, description: str, data: dict | None = None
+    async def _audit_log(
+        self, user: User, description: str, data: dict | None = None
     ) -> None:
-        async def wrapper() -> None:
-            session.add(create_audit_entry(user, description, data))
-            session.commit()
-
-        self._run_in_background(wrapper())
-
-    def _run_in_background(self, coroutine: Coroutine[Any, Any, Any]) -> None:
-        async def wrapper() -> None:
-            try:
-                await coroutine
-            except Exception:  # pylint: disable=broad-exception-caught
-                self._logger.exception("Background task failed")
-
-        asyncio.create_task(wrapper())
+        # Written in the sink's own session, the session of the action may still be in use
+        await AUDIT_LOG_SINK.write(create_audit_entry(user, description, data))
+
+    async def _flush_and_expire(self, session: AsyncSession) -> None:
+        """
+        Flushes the changes and expires the entities like a commit, but keeps the transaction open, e.g., to enqueue
+        notifications about the changes in the same transaction.
+        """
+        await session.flush()
+        session.expire_all()
@@ -7,6 +7,11 @@
 from sqlalchemy import select
 
 from ycc_hull.controllers.base_controller import BaseController
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+    SerialisedDtos,
+)
 from ycc_hull.db.entities import BoatEntity
 from ycc_hull.models.dtos import BoatDto
 
@@ -21,3 +26,8 @@ async def find_all(self) -> Sequence[BoatDto]:
             select(BoatEntity).order_by(BoatEntity.table_pos),
             async_transformer=BoatDto.create,
         )
+
+    async def find_all_serialised(self) -> SerialisedDtos:
+        return await REFERENCE_DATA_CACHE.get_or_load(
+            ReferenceData.BOATS, self.find_all
+        )
@@ -0,0 +1,76 @@
+"""
+Helper task list cache.
+"""
+
+from collections.abc import Awaitable, Callable, Sequence
+
+from ycc_hull.cache import CacheStats, TtlCache
+from ycc_hull.config import CONFIG
+from ycc_hull.controllers.reference_data_cache import SerialisedDtos
+from ycc_hull.invalidation import INVALIDATION_BUS, InvalidationTopic
+from ycc_hull.models.helpers_dtos import HelperTaskDto
+
+
+class HelperTaskListCache:
+    """
+    Read-through cache of serialised helper task lists per year and published filter.
+
+    Entries are versioned: every change of the tasks increments the version, so lists loaded before the change are
+    never returned afterwards, even if their load finishes after the change. Changes are published on the invalidation
+    bus (`InvalidationTopic.HELPER_TASKS`), without a shared bus changes made by other processes are visible after the
+    TTL.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_size: int = 64) -> None:
+        self._cache: TtlCache[tuple[int, int | None, bool | None], SerialisedDtos] = (
+            TtlCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        )
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get_or_load(
+        self,
+        *,
+        year: int | None,
+        published: bool | None,
+        loader: Callable[[], Awaitable[Sequence[HelperTaskDto]]],
+    ) -> SerialisedDtos:
+        """
+        Gets the serialised task list from the cache or loads it if it is not cached.
+
+        Args:
+            year (int | None): year filter
+            published (bool | None): published filter
+            loader (Callable[[], Awaitable[Sequence[HelperTaskDto]]]): Loads the tasks.
+
+        Returns:
+            SerialisedDtos: the serialised tasks
+        """
+
+        async def load() -> tuple[SerialisedDtos, float | None]:
+            return SerialisedDtos.create(await loader()), None
+
+        # The version is taken before loading, a change during the load makes the loaded list outdated
+        return await self._cache.get_or_load((self._version, year, published), load)
+
+    def invalidate(self) -> None:
+        """
+        Invalidates all task lists of this process. Changes should be published on the invalidation bus instead.
+        """
+        self._version += 1
+        self._cache.clear()
+
+
+HELPER_TASK_LIST_CACHE = HelperTaskListCache(
+    ttl_seconds=CONFIG.helper_task_list_cache_ttl_seconds
+)
+INVALIDATION_BUS.subscribe(
+    InvalidationTopic.HELPER_TASKS, HELPER_TASK_LIST_CACHE.invalidate
+)
@@ -0,0 +1,165 @@
+"""
+Checks of the helper task changes, raising `ControllerConflictException` if a change is not allowed.
+"""
+
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import date
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ycc_hull.controllers.exceptions import ControllerConflictException
+from ycc_hull.db.entities import HelperTaskEntity, HelperTaskHelperEntity, LicenceEntity
+from ycc_hull.models.helpers_dtos import (
+    HelperTaskDto,
+    HelperTaskState,
+    HelperTaskUpdateRequestDto,
+)
+from ycc_hull.utils import get_now
+
+
+async def check_can_update_task(
+    request: HelperTaskUpdateRequestDto, original_task: HelperTaskDto
+) -> None:
+    anyone_signed_up = original_task.captain or original_task.helpers
+
+    # Check: Cannot change the task year if anyone has signed up
+    # Active Members change over year, but let's rather save the complicated check, since this should not be a main use case
+    if anyone_signed_up and original_task.year != request.year:
+        raise ControllerConflictException(
+            "You cannot change the year of the task after anyone has signed up. Please create a new task instead."
+        )
+
+    if anyone_signed_up and not request.published:
+        raise ControllerConflictException(
+            "You must publish a task after anyone has signed up"
+        )
+
+    # Check: If a captain has signed up then the new licence must be active for the captain
+    if (
+        original_task.captain
+        and request.captain_required_licence_info_id is not None
+        and request.captain_required_licence_info_id
+        != (
+            original_task.captain_required_licence_info.id
+            if original_task.captain_required_licence_info
+            else None
+        )
+    ):
+        captain_entity = original_task.captain.member.get_entity()
+        # Loads the licences, active_licence_infos is a plain property
+        await captain_entity.awaitable_attrs.licences
+        if not any(
+            licence_info_entity.infoid == request.captain_required_licence_info_id
+            for licence_info_entity in captain_entity.active_licence_infos
+        ):
+            raise ControllerConflictException(
+                "Cannot change captain required licence info because the signed up captain does not have the newly specified licence"
+            )
+
+    # Check: Cannot set the maximum number of helpers below the number of already signed-up helpers
+    signed_up_helper_count = len(original_task.helpers)
+    if request.helper_max_count < signed_up_helper_count:
+        raise ControllerConflictException(
+            f"Cannot set the maximum number of helpers below the number of already signed-up helpers ({signed_up_helper_count})"
+        )
+
+
+async def check_can_sign_up_as_captain(
+    *,
+    task: HelperTaskDto,
+    member_id: int,
+    editor_action: bool,
+    session: AsyncSession,
+) -> None:
+    await check_can_sign_up(task=task, member_id=member_id, editor_action=editor_action)
+
+    if task.captain:
+        raise ControllerConflictException("Task already has a captain")
+
+    if task.captain_required_licence_info:
+        has_licence = (
+            await session.scalar(
+                select(LicenceEntity).where(
+                    LicenceEntity.member_id == member_id,
+                    LicenceEntity.licence_id == task.captain_required_licence_info.id,
+                    LicenceEntity.status > 0,
+                )
+            )
+            is not None
+        )
+
+        if not has_licence:
+            raise ControllerConflictException(
+                f"Task captain needs licence: {task.captain_required_licence_info.licence}"
+            )
+
+
+async def check_can_sign_up_as_helper(
+    *,
+    task: HelperTaskDto,
+    find_tasks: Callable[..., Awaitable[Sequence[HelperTaskDto]]],
+    member_id: int,
+    editor_action: bool,
+    session: AsyncSession,
+) -> None:
+    await check_can_sign_up(task=task, member_id=member_id, editor_action=editor_action)
+
+    if len(task.helpers) >= task.helper_max_count:
+        raise ControllerConflictException("Task helper limit reached")
+
+    if not editor_action:
+        # Check: helper cannot sign up for multiple surveillance tasks before mid-June:
+        # 1. This allows more members completing one surveillance shift in the beginning of the season
+        # 2. Members who want to do all their tasks early can still do maintenance tasks
+
+        surveillance_task = "surveillance" in task.category.title.lower()
+        mid_june = date(task.year, 6, 15)
+        message = "You cannot sign up for multiple surveillance shifts before mid-June — but you can still sign up for maintenance tasks!"
+
+        if surveillance_task and task.starts_at and task.starts_at.date() < mid_june:
+            # Check if the member has signed up for any other surveillance shift before mid-June
+            other_tasks = await find_tasks(
+                year=task.year,
+                task_id=None,
+                published=None,
+                where=and_(
+                    # Assumes that we only have one surveillance category, good enough
+                    HelperTaskEntity.category_id == task.category.id,
+                    HelperTaskEntity.starts_at < mid_june,
+                    or_(
+                        HelperTaskEntity.helpers.any(
+                            HelperTaskHelperEntity.member_id == member_id
+                        ),
+                    ),
+                ),
+                session=session,
+            )
+            if other_tasks:
+                raise ControllerConflictException(message)
+
+
+async def check_can_sign_up(
+    *, task: HelperTaskDto, member_id: int, editor_action: bool
+) -> None:
+    if not task.published:
+        raise ControllerConflictException("Cannot sign up for an unpublished task")
+
+    if not editor_action:
+        if task.state == HelperTaskState.DONE:
+            raise ControllerConflictException(
+                "Cannot sign up for a task marked as done"
+            )
+        if task.state == HelperTaskState.VALIDATED:
+            raise ControllerConflictException("Cannot sign up for a validated task")
+
+        now = get_now()
+        if (task.starts_at and task.starts_at < now) or (
+            task.deadline and task.deadline < now
+        ):
+            raise ControllerConflictException("Cannot sign up for a task in the past")
+
+    if task.captain and task.captain.member.id == member_id:
+        raise ControllerConflictException("Already signed up as captain")
+    if any(helper.member.id == member_id for helper in task.helpers):
+        raise ControllerConflictException("Already signed up as helper")
@@ -2,11 +2,14 @@
 Helpers controller.
 """
 
-from collections.abc import Sequence
-from datetime import date, datetime, timedelta
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any
 
-from sqlalchemy import ColumnElement, and_, func, or_, select
-from sqlalchemy.orm import Session, defer
+from sqlalchemy import ColumnElement, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from ycc_hull.config import CONFIG
 from ycc_hull.controllers.base_controller import BaseController
@@ -14,17 +17,35 @@
     ControllerConflictException,
     ControllerNotFoundException,
 )
+from ycc_hull.controllers.helper_task_list_cache import HELPER_TASK_LIST_CACHE
+from ycc_hull.controllers.helpers_checks import (
+    check_can_sign_up,
+    check_can_sign_up_as_captain,
+    check_can_sign_up_as_helper,
+    check_can_update_task,
+)
+from ycc_hull.controllers.helpers_queries import create_task_query
+from ycc_hull.controllers.helpers_reminders import (
+    find_due_reminders,
+    record_reminder_run,
+)
 from ycc_hull.controllers.notifications.helpers_notifications_controller import (
     HelpersNotificationsController,
+    ReminderRunStats,
+)
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+    SerialisedDtos,
 )
 from ycc_hull.db.entities import (
     HelpersAppPermissionEntity,
     HelperTaskCategoryEntity,
     HelperTaskEntity,
     HelperTaskHelperEntity,
-    LicenceEntity,
     MemberEntity,
 )
+from ycc_hull.invalidation import INVALIDATION_BUS, InvalidationTopic
 from ycc_hull.models.dtos import MemberPublicInfoDto
 from ycc_hull.models.helpers_dtos import (
     HelpersAppPermissionDto,
@@ -35,15 +56,15 @@
     HelperTaskDto,
     HelperTaskMarkAsDoneRequestDto,
     HelperTaskState,
-    HelperTaskType,
     HelperTaskUpdateRequestDto,
     HelperTaskValidationRequestDto,
 )
 from ycc_hull.models.user import User
+from ycc_hull.scheduler_lock import SchedulerLease
 from ycc_hull.utils import deep_diff, get_now
 
 
-class HelpersController(BaseController):
+class HelpersController(BaseController):  # pylint: disable=too-many-public-methods
     """
     Helpers controller. Returns DTO objects.
     """
@@ -53,6 +74,39 @@ def __init__(self) -> None:
 
         self._notifications = HelpersNotificationsController()
 
+    @asynccontextmanager
+    async def database_action(
+        self,
+        *,
+        action: str,
+        user: User | None,
+        details: dict[str, Any] | None,
+        changes_tasks: bool = True,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Database action which invalidates the helper task lists if it committed a change of the tasks.
+
+        Args:
+            changes_tasks (bool, optional): whether the action changes tasks. Defaults to True.
+        """
+        committed = False
+
+        def on_commit(_: Session) -> None:
+            nonlocal committed
+            committed = True
+
+        try:
+            async with super().database_action(
+                action=action, user=user, details=details
+            ) as session:
+                if changes_tasks:
+                    event.listen(session.sync_session, "after_commit", on_commit)
+                yield session
+        finally:
+            # Also if the action failed after the commit
+            if committed:
+                await INVALIDATION_BUS.publish(InvalidationTopic.HELPER_TASKS)
+
     async def find_all_permissions(self) -> Sequence[HelpersAppPermissionDto]:
         return await self.database_context.query_all(
             select(HelpersAppPermissionEntity)
@@ -64,20 +118,24 @@ async def find_all_permissions(self) -> Sequence[HelpersAppPermissionDto]:
     async def grant_permission(
         self, request: HelpersAppPermissionGrantRequestDto, user: User
     ) -> HelpersAppPermissionDto:
-        with self.database_action(
-            action="Helpers / Grant Permission", user=user, details={"request": request}
+        async with self.database_action(
+            action="Helpers / Grant Permission",
+            user=user,
+            details={"request": request},
+            changes_tasks=False,
         ) as session:
             permission_entity = HelpersAppPermissionEntity(**request.model_dump())
             session.add(permission_entity)
-            session.commit()
+            await session.commit()
+            await session.refresh(permission_entity)
 
             permission = await HelpersAppPermissionDto.create(permission_entity)
             self._logger.info(
                 "Granted permission: %s, user: %s", permission, user.username
             )
 
-            self._audit_log(
-                session, user, "Helpers/Permissions/Grant", {"new": permission}
+            await self._audit_log(
+                user, "Helpers/Permissions/Grant", {"new": permission}
             )
 
             return permission
@@ -85,10 +143,11 @@ async def grant_permission(
     async def update_permission(
         self, member_id: int, request: HelpersAppPermissionUpdateRequestDto, user: User
     ) -> HelpersAppPermissionDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helpers / Update Permission",
             user=user,
             details={"member_id": member_id, "request": request},
+            changes_tasks=False,
         ) as session:
             original_permission = await self._get_permission_by_id(
                 member_id, session=session
@@ -96,15 +155,15 @@ async def update_permission(
 
             permission_entity = original_permission.get_entity()
             self._update_entity_from_dto(permission_entity, request)
-            session.commit()
+            await session.commit()
+            await session.refresh(permission_entity)
 
             updated_permission = await HelpersAppPermissionDto.create(permission_entity)
             self._logger.info(
                 "Updated permission: %s, user: %s", updated_permission, user.username
             )
 
-            self._audit_log(
-                session,
+            await self._audit_log(
                 user,
                 f"Helpers/Permissions/Update/{member_id}",
                 {
@@ -120,16 +179,17 @@ async def revoke_permission(self, member_id: int, user: User) -> None:
         if member_id == user.member_id:
             raise ControllerConflictException("You cannot revoke your own permissions")
 
-        with self.database_action(
+        async with self.database_action(
             action="Helpers / Revoke Permission",
             user=user,
             details={"member_id": member_id},
+            changes_tasks=False,
         ) as session:
             permission = await self._get_permission_by_id(member_id, session=session)
 
             permission_entity = permission.get_entity()
-            session.delete(permission_entity)
-            session.commit()
+            await session.delete(permission_entity)
+            await session.commit()
 
             self._logger.info(
                 "Revoked permission: %s, user: %s",
@@ -137,8 +197,7 @@ async def revoke_permission(self, member_id: int, user: User) -> None:
                 user.username,
             )
 
-            self._audit_log(
-                session,
+            await self._audit_log(
                 user,
                 f"Helpers/Permissions/Revoke/{member_id}",
                 {
@@ -147,7 +206,7 @@ async def revoke_permission(self, member_id: int, user: User) -> None:
             )
 
     async def _get_permission_by_id(
-        self, member_id: int, *, session: Session
+        self, member_id: int, *, session: AsyncSession
     ) -> HelpersAppPermissionDto:
         entries = await self.database_context.query_all(
             select(HelpersAppPermissionEntity).where(
@@ -168,17 +227,52 @@ async def find_all_task_categories(self) -> Sequence[HelperTaskCategoryDto]:
             async_transformer=HelperTaskCategoryDto.create,
         )
 
+    async def find_all_task_categories_serialised(self) -> SerialisedDtos:
+        return await REFERENCE_DATA_CACHE.get_or_load(
+            ReferenceData.HELPER_TASK_CATEGORIES, self.find_all_task_categories
+        )
+
     async def find_all_tasks(
         self, *, year: int | None = None, published: bool | None = None
     ) -> Sequence[HelperTaskDto]:
         return await self._find_tasks(year=year, task_id=None, published=published)
 
+    async def find_all_tasks_serialised(
+        self, *, year: int | None = None, published: bool | None = None
+    ) -> SerialisedDtos:
+        return await HELPER_TASK_LIST_CACHE.get_or_load(
+            year=year,
+            published=published,
+            loader=partial(self.find_all_tasks, year=year, published=published),
+        )
+
+    async def stream_tasks(
+        self, *, year: int | None = None
+    ) -> AsyncGenerator[HelperTaskDto, None]:
+        """
+        Streams all tasks with the large fields, in the same order as `find_all_tasks()`, for exports.
+
+        Args:
+            year (int | None, optional): year filter. Defaults to None.
+
+        Yields:
+            HelperTaskDto: tasks
+        """
+        async for task in self.database_context.stream_all(
+            create_task_query(
+                year=year, task_id=None, published=None, where=None, large_fields=True
+            ),
+            # One factory per batch, the member DTOs are shared within the batch
+            batch_transformer=HelperTaskDto.create_many,
+        ):
+            yield task
+
     async def find_task_by_id(
         self,
         task_id: int,
         *,
         published: bool | None = None,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> HelperTaskDto | None:
         return await self._find_task_by_id(
             task_id, published=published, session=session
@@ -189,7 +283,7 @@ async def get_task_by_id(
         task_id: int,
         *,
         published: bool | None = None,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> HelperTaskDto:
         task = await self.find_task_by_id(task_id, published=published, session=session)
         if task:
@@ -199,40 +293,106 @@ async def get_task_by_id(
     async def create_task(
         self, request: HelperTaskCreationRequestDto, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Create", user=user, details={"request": request}
         ) as session:
             task_entity = HelperTaskEntity(**request.model_dump())
             session.add(task_entity)
-            session.commit()
+            await session.commit()
+            await session.refresh(task_entity)
 
             task = await HelperTaskDto.create(task_entity)
             self._logger.info("Created task: %s, user: %s", task.id, user.username)
 
-            self._audit_log(session, user, "Helpers/Tasks/Create", {"new": task})
+            await self._audit_log(user, "Helpers/Tasks/Create", {"new": task})
 
             return task
 
+    async def create_tasks(
+        self, requests: Sequence[HelperTaskCreationRequestDto], user: User
+    ) -> list[HelperTaskDto]:
+        """
+        Creates several tasks in one transaction, either all or none of them.
+
+        Args:
+            requests (Sequence[HelperTaskCreationRequestDto]): creation requests
+            user (User): user creating the tasks
+
+        Returns:
+            list[HelperTaskDto]: created tasks, in the order of the requests
+        """
+        async with self.database_action(
+            action="Helper Task / Bulk Create",
+            user=user,
+            details={"requests": requests},
+        ) as session:
+            category_ids = {request.category_id for request in requests}
+            existing_category_ids = set(
+                (
+                    await session.scalars(
+                        select(HelperTaskCategoryEntity.id).where(
+                            HelperTaskCategoryEntity.id.in_(category_ids)
+                        )
+                    )
+                ).all()
+            )
+            if category_ids - existing_category_ids:
+                raise ControllerNotFoundException("Category not found")
+
+            task_entities = [
+                HelperTaskEntity(**request.model_dump()) for request in requests
+            ]
+            session.add_all(task_entities)
+            await session.flush()
+            task_ids = [task_entity.id for task_entity in task_entities]
+            session.expire_all()
+
+            tasks_by_id = {
+                task.id: task
+                for task in await self.database_context.query_all(
+                    create_task_query(
+                        year=None,
+                        task_id=None,
+                        published=None,
+                        where=HelperTaskEntity.id.in_(task_ids),
+                        large_fields=True,
+                    ),
+                    batch_transformer=HelperTaskDto.create_many,
+                    session=session,
+                )
+            }
+            tasks = [tasks_by_id[task_id] for task_id in task_ids]
+            await session.commit()
+
+            self._logger.info(
+                "Created %d tasks: %s, user: %s", len(tasks), task_ids, user.username
+            )
+
+            await self._audit_log(user, "Helpers/Tasks/BulkCreate", {"new": tasks})
+
+            return tasks
+
     async def update_task(
         self,
         task_id: int,
         request: HelperTaskUpdateRequestDto,
         user: User,
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Update",
             user=user,
             details={"task_id": task_id, "request": request},
         ) as session:
             original_task = await self._get_task_by_id(task_id, session=session)
 
-            await self._check_can_update_task(request, original_task)
+            await check_can_update_task(request, original_task)
 
             task_entity = original_task.get_entity()
             self._update_entity_from_dto(task_entity, request)
             if original_task.validated_by is not None:
                 task_entity.urgent = False
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
@@ -242,27 +402,14 @@ async def update_task(
             # Calculate change
             diff = deep_diff(original_task, updated_task)
 
-            self._audit_log(
-                session,
-                user,
-                f"Helpers/Tasks/Update/{task_id}",
-                {
-                    "diff": diff,
-                    "old": original_task,
-                    "new": updated_task,
-                    "notifySignedUpMembers": request.notify_signed_up_members,
-                },
-            )
             if request.notify_signed_up_members:
                 self._logger.info(
                     "Notifying signed up members about the task update (ID: %d), updated fields: %s",
                     task_id,
                     diff.keys(),
                 )
-                self._run_in_background(
-                    self._notifications.on_update(
-                        original_task, updated_task, diff, user
-                    )
+                self._notifications.on_update(
+                    original_task, updated_task, diff, user, session=session
                 )
             else:
                 self._logger.info(
@@ -270,70 +417,39 @@ async def update_task(
                     task_id,
                     diff.keys(),
                 )
+            await session.commit()
 
-            return updated_task
-
-    async def _check_can_update_task(
-        self, request: HelperTaskUpdateRequestDto, original_task: HelperTaskDto
-    ) -> None:
-        anyone_signed_up = original_task.captain or original_task.helpers
-
-        # Check: Cannot change the task year if anyone has signed up
-        # Active Members change over year, but let's rather save the complicated check, since this should not be a main use case
-        if anyone_signed_up and original_task.year != request.year:
-            raise ControllerConflictException(
-                "You cannot change the year of the task after anyone has signed up. Please create a new task instead."
-            )
-
-        if anyone_signed_up and not request.published:
-            raise ControllerConflictException(
-                "You must publish a task after anyone has signed up"
-            )
-
-        # Check: If a captain has signed up then the new licence must be active for the captain
-        if (
-            original_task.captain
-            and request.captain_required_licence_info_id is not None
-            and request.captain_required_licence_info_id
-            != (
-                original_task.captain_required_licence_info.id
-                if original_task.captain_required_licence_info
-                else None
+            await self._audit_log(
+                user,
+                f"Helpers/Tasks/Update/{task_id}",
+                {
+                    "diff": diff,
+                    "old": original_task,
+                    "new": updated_task,
+                    "notifySignedUpMembers": request.notify_signed_up_members,
+                },
             )
-        ):
-            captain_entity = original_task.captain.member.get_entity()
-            if not any(
-                licence_info_entity.infoid == request.captain_required_licence_info_id
-                for licence_info_entity in captain_entity.active_licence_infos
-            ):
-                raise ControllerConflictException(
-                    "Cannot change captain required licence info because the signed up captain does not have the newly specified licence"
-                )
 
-        # Check: Cannot set the maximum number of helpers below the number of already signed-up helpers
-        signed_up_helper_count = len(original_task.helpers)
-        if request.helper_max_count < signed_up_helper_count:
-            raise ControllerConflictException(
-                f"Cannot set the maximum number of helpers below the number of already signed-up helpers ({signed_up_helper_count})"
-            )
+            return updated_task
 
     async def set_captain(
         self, task_id: int, member_id: int, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Set Captain",
             user=user,
             details={"task_id": task_id, "member_id": member_id},
         ) as session:
             task = await self._get_task_by_id(task_id, published=True, session=session)
-            await self._check_can_sign_up_as_captain(
+            await check_can_sign_up_as_captain(
                 task=task, member_id=member_id, editor_action=True, session=session
             )
 
             task_entity = task.get_entity()
             task_entity.captain_id = member_id
             task_entity.captain_signed_up_at = get_now()
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             if not updated_task.captain:
@@ -348,21 +464,20 @@ async def set_captain(
                 user.username,
             )
 
-            self._audit_log(
-                session,
+            self._notifications.on_add_helper(
+                updated_task, updated_task.captain.member, user, session=session
+            )
+            await session.commit()
+
+            await self._audit_log(
                 user,
                 f"Helpers/Tasks/SetCaptain/{task_id}/Captain/{member_id}",
             )
-            self._run_in_background(
-                self._notifications.on_add_helper(
-                    updated_task, updated_task.captain.member, user
-                )
-            )
 
             return updated_task
 
     async def remove_captain(self, task_id: int, user: User) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Remove Captain",
             user=user,
             details={"task_id": task_id},
@@ -378,7 +493,8 @@ async def remove_captain(self, task_id: int, user: User) -> HelperTaskDto:
             task_entity = original_task.get_entity()
             task_entity.captain_id = None
             task_entity.captain_signed_up_at = None
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
@@ -388,37 +504,40 @@ async def remove_captain(self, task_id: int, user: User) -> HelperTaskDto:
                 user.username,
             )
 
-            self._audit_log(
-                session,
+            self._notifications.on_remove_helper(
+                updated_task, original_captain, user, session=session
+            )
+            await session.commit()
+
+            await self._audit_log(
                 user,
                 f"Helpers/Tasks/RemoveCaptain/{task_id}/Captain/{original_captain.id}",
             )
-            self._run_in_background(
-                self._notifications.on_remove_helper(
-                    updated_task, original_captain, user
-                )
-            )
 
             return updated_task
 
     async def add_helper(
         self, task_id: int, member_id: int, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Add Helper",
             user=user,
             details={"task_id": task_id, "member_id": member_id},
         ) as session:
             task = await self._get_task_by_id(task_id, published=True, session=session)
-            await self._check_can_sign_up_as_helper(
-                task=task, member_id=member_id, editor_action=True, session=session
+            await check_can_sign_up_as_helper(
+                task=task,
+                find_tasks=self._find_tasks,
+                member_id=member_id,
+                editor_action=True,
+                session=session,
             )
 
             helper_entity = HelperTaskHelperEntity(
                 task_id=task.id, member_id=member_id, signed_up_at=get_now()
             )
             session.add(helper_entity)
-            session.commit()
+            await self._flush_and_expire(session)
 
             updated_task = await self.get_task_by_id(
                 task_id, published=True, session=session
@@ -433,13 +552,82 @@ async def add_helper(
                 helper.username,
                 user.username,
             )
-            self._audit_log(
-                session,
+            self._notifications.on_add_helper(
+                updated_task, helper, user, session=session
+            )
+            await session.commit()
+
+            await self._audit_log(
                 user,
                 f"Helpers/Tasks/AddHelper/{task_id}/Helper/{member_id}",
             )
-            self._run_in_background(
-                self._notifications.on_add_helper(updated_task, helper, user)
+
+            return updated_task
+
+    async def add_helpers(
+        self, task_id: int, member_ids: Sequence[int], user: User
+    ) -> HelperTaskDto:
+        """
+        Adds several helpers to a task in one transaction, either all or none of them. The helpers get one
+        notification together.
+
+        Args:
+            task_id (int): task ID
+            member_ids (Sequence[int]): members to add as helpers
+            user (User): user adding the helpers
+
+        Returns:
+            HelperTaskDto: updated task
+        """
+        member_ids = list(dict.fromkeys(member_ids))
+
+        async with self.database_action(
+            action="Helper Task / Add Helpers",
+            user=user,
+            details={"task_id": task_id, "member_ids": member_ids},
+        ) as session:
+            task = await self._get_task_by_id(task_id, published=True, session=session)
+
+            if len(task.helpers) + len(member_ids) > task.helper_max_count:
+                raise ControllerConflictException("Task helper limit reached")
+            for member_id in member_ids:
+                await check_can_sign_up(
+                    task=task, member_id=member_id, editor_action=True
+                )
+
+            signed_up_at = get_now()
+            session.add_all(
+                HelperTaskHelperEntity(
+                    task_id=task.id, member_id=member_id, signed_up_at=signed_up_at
+                )
+                for member_id in member_ids
+            )
+            await self._flush_and_expire(session)
+
+            updated_task = await self.get_task_by_id(
+                task_id, published=True, session=session
+            )
+            helpers = [
+                helper.member
+                for helper in updated_task.helpers
+                if helper.member.id in member_ids
+            ]
+
+            self._logger.info(
+                "Added helpers to task: %s, helpers: %s, user: %s",
+                updated_task.id,
+                [helper.username for helper in helpers],
+                user.username,
+            )
+            self._notifications.on_add_helpers(
+                updated_task, helpers, user, session=session
+            )
+            await session.commit()
+
+            await self._audit_log(
+                user,
+                f"Helpers/Tasks/AddHelpers/{task_id}",
+                {"member_ids": member_ids},
             )
 
             return updated_task
@@ -447,7 +635,7 @@ async def add_helper(
     async def remove_helper(
         self, task_id: int, member_id: int, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Remove Helper",
             user=user,
             details={"task_id": task_id, "member_id": member_id},
@@ -472,8 +660,9 @@ async def remove_helper(
                 await helper_entity_to_remove.awaitable_attrs.member
             )
 
-            session.delete(helper_entity_to_remove)
-            session.commit()
+            await session.delete(helper_entity_to_remove)
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
@@ -483,28 +672,27 @@ async def remove_helper(
                 user.username,
             )
 
-            self._audit_log(
-                session,
+            self._notifications.on_remove_helper(
+                updated_task, helper_to_remove, user, session=session
+            )
+            await session.commit()
+
+            await self._audit_log(
                 user,
                 f"Helpers/Tasks/RemoveHelper/{task_id}/Helper/{member_id}",
             )
-            self._run_in_background(
-                self._notifications.on_remove_helper(
-                    updated_task, helper_to_remove, user
-                )
-            )
 
             return updated_task
 
     async def sign_up_as_captain(self, task_id: int, user: User) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Sign Up As Captain",
             user=user,
             details={"task_id": task_id},
         ) as session:
             task = await self._get_task_by_id(task_id, published=True, session=session)
 
-            await self._check_can_sign_up_as_captain(
+            await check_can_sign_up_as_captain(
                 task=task,
                 member_id=user.member_id,
                 editor_action=False,
@@ -513,7 +701,8 @@ async def sign_up_as_captain(self, task_id: int, user: User) -> HelperTaskDto:
             task_entity = task.get_entity()
             task_entity.captain_id = user.member_id
             task_entity.captain_signed_up_at = get_now()
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
@@ -522,21 +711,24 @@ async def sign_up_as_captain(self, task_id: int, user: User) -> HelperTaskDto:
                 user.username,
             )
 
-            self._audit_log(session, user, f"Helpers/Tasks/SignUpAsCaptain/{task_id}")
-            self._run_in_background(self._notifications.on_sign_up(updated_task, user))
+            self._notifications.on_sign_up(updated_task, user, session=session)
+            await session.commit()
+
+            await self._audit_log(user, f"Helpers/Tasks/SignUpAsCaptain/{task_id}")
 
             return updated_task
 
     async def sign_up_as_helper(self, task_id: int, user: User) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Sign Up As Helper",
             user=user,
             details={"task_id": task_id},
         ) as session:
             task = await self.get_task_by_id(task_id, published=True, session=session)
 
-            await self._check_can_sign_up_as_helper(
+            await check_can_sign_up_as_helper(
                 task=task,
+                find_tasks=self._find_tasks,
                 member_id=user.member_id,
                 editor_action=False,
                 session=session,
@@ -546,7 +738,7 @@ async def sign_up_as_helper(self, task_id: int, user: User) -> HelperTaskDto:
                 task_id=task.id, member_id=user.member_id, signed_up_at=get_now()
             )
             session.add(helper_entity)
-            session.commit()
+            await self._flush_and_expire(session)
 
             updated_task = await self.get_task_by_id(
                 task_id, published=True, session=session
@@ -557,15 +749,17 @@ async def sign_up_as_helper(self, task_id: int, user: User) -> HelperTaskDto:
                 user.username,
             )
 
-            self._audit_log(session, user, f"Helpers/Tasks/SignUpAsHelper/{task_id}")
-            self._run_in_background(self._notifications.on_sign_up(updated_task, user))
+            self._notifications.on_sign_up(updated_task, user, session=session)
+            await session.commit()
+
+            await self._audit_log(user, f"Helpers/Tasks/SignUpAsHelper/{task_id}")
 
             return updated_task
 
     async def mark_as_done(
         self, task_id: int, request: HelperTaskMarkAsDoneRequestDto, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Mark As Done",
             user=user,
             details={"task_id": task_id, "request": request},
@@ -583,24 +777,25 @@ async def mark_as_done(
             task_entity.marked_as_done_at = get_now()
             task_entity.marked_as_done_by_id = user.member_id
             task_entity.marked_as_done_comment = request.comment
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
                 "Marked task as done: %s, user: %s", updated_task.id, user.username
             )
 
-            self._audit_log(session, user, f"Helpers/Tasks/MarkAsDone/{task_id}")
-            self._run_in_background(
-                self._notifications.on_mark_as_done(updated_task, user)
-            )
+            self._notifications.on_mark_as_done(updated_task, user, session=session)
+            await session.commit()
+
+            await self._audit_log(user, f"Helpers/Tasks/MarkAsDone/{task_id}")
 
             return updated_task
 
     async def validate(
         self, task_id: int, request: HelperTaskValidationRequestDto, user: User
     ) -> HelperTaskDto:
-        with self.database_action(
+        async with self.database_action(
             action="Helper Task / Validate",
             user=user,
             details={"task_id": task_id, "request": request},
@@ -624,7 +819,8 @@ async def validate(
             task_entity.validated_at = now
             task_entity.validated_by_id = user.member_id
             task_entity.validation_comment = request.comment
-            session.commit()
+            await self._flush_and_expire(session)
+            await session.refresh(task_entity)
 
             updated_task = await HelperTaskDto.create(task_entity)
             self._logger.info(
@@ -633,12 +829,13 @@ async def validate(
                 user.username,
             )
 
-            self._audit_log(
-                session,
+            self._notifications.on_validate(updated_task, user, session=session)
+            await session.commit()
+
+            await self._audit_log(
                 user,
                 f"Helpers/Tasks/Validate/{task_id}",
             )
-            self._run_in_background(self._notifications.on_validate(updated_task, user))
 
             # Do it before the requests finishes, so the next request gets the updated state
             await self._unset_urgent_for_validated_tasks(user=user, session=session)
@@ -646,14 +843,16 @@ async def validate(
             return updated_task
 
     async def _unset_urgent_for_validated_tasks(
-        self, *, user: User, session: Session
+        self, *, user: User, session: AsyncSession
     ) -> None:
         validated_urgent_tasks = (
-            session.scalars(
-                select(HelperTaskEntity).where(
-                    HelperTaskEntity.validated_by_id.is_not(None),
-                    # Need == 1 instead of True for Oracle
-                    HelperTaskEntity.urgent == 1,
+            (
+                await session.scalars(
+                    select(HelperTaskEntity).where(
+                        HelperTaskEntity.validated_by_id.is_not(None),
+                        # Need == 1 instead of True for Oracle
+                        HelperTaskEntity.urgent == 1,
+                    )
                 )
             )
             .unique()
@@ -662,160 +861,76 @@ async def _unset_urgent_for_validated_tasks(
 
         for task in validated_urgent_tasks:
             task.urgent = False
+        # Entities are expired after the commit
+        task_ids = [task.id for task in validated_urgent_tasks]
 
-        session.commit()
+        await session.commit()
 
-        self._logger.info(
-            "Unset urgent for %d validated task(s)", len(validated_urgent_tasks)
-        )
+        self._logger.info("Unset urgent for %d validated task(s)", len(task_ids))
 
-        for task in validated_urgent_tasks:
-            self._audit_log(
-                session, user, f"Helpers/Tasks/UnsetUrgentForValidatedTask/{task.id}"
+        for task_id in task_ids:
+            await self._audit_log(
+                user, f"Helpers/Tasks/UnsetUrgentForValidatedTask/{task_id}"
             )
 
-    async def send_daily_reminders(self) -> None:  # pylint: disable=too-many-locals
+    async def send_daily_reminders(
+        self, *, lease: SchedulerLease | None = None
+    ) -> ReminderRunStats | None:
         """
-        Sends daily reminders to task participants.
-
-        Never send reminders for:
-        - Tasks that are started and are not yet finished (especially multi-day shifts)
-        - Tasks that are validated
-
-        For upcoming tasks send reminders:
-        - 2 weeks before
-        - 3 days before
-        - the day of the task
-
-        Overdue tasks (not validated tasks in the past; to speed up task validation):
-        - Reminders are sent per contact, not per task
-        - Shifts (and invalid timing):
-            - A reminder is sent every day to the contact 1 week after the shift is finished.
-            - The delay gives a window for shift organisers to validate tasks (as shifts "just happen" anyway").
-            - No immediate pressure on shift organisers, especially as the shifts often happen in batches (regattas, surveillance etc.)
-        - Deadline tasks:
-            - A reminder is sent every day to the contact the if the deadline has expired.
-            - Deadline tasks are usually one-off maintenance tasks and in the past the experience was that they are often forgotten
-            - After the deadline expires, it is either done (and should have been validated) or the deadline should be extended
-
-        Notes:
-        - Also send reminders for past years (avoid hanging tasks; tasks can have a deadline on 31 December)
-        - Also send reminders for unpublished tasks (tasks with helpers should not be unpublished)
+        Sends daily reminders to task participants, see `helpers_reminders` for which reminders are sent when.
+
+        Sent reminders and the run are recorded in the same transaction as the emails, so re-runs on the same day send
+        nothing.
+
+        Args:
+            lease (SchedulerLease | None): lease of the scheduler leader, verified before committing
+
+        Returns:
+            ReminderRunStats | None: statistics of the run, None if emails are disabled
+
+        Raises:
+            SchedulerLeaseLostException: if another worker took over the lease, nothing is sent
         """
         if not CONFIG.emails_enabled(self._logger):
-            return
+            return None
 
-        def debug(task: HelperTaskDto, message: str) -> None:
-            self._logger.debug(
-                "Task %s (id=%d, starts_at=%s, ends_at=%s, deadline=%s): %s",
-                task.title,
-                task.id,
-                task.starts_at,
-                task.ends_at,
-                task.deadline,
-                message,
-            )
+        now = get_now()
 
-        with self.database_action(
+        async with self.database_action(
             action="Helpers / Send Daily Reminders",
             user=None,
             details=None,
+            changes_tasks=False,
         ) as session:
-            # Query all relevant tasks
-            now = get_now()
-
-            # "Round" to the start of the day
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            one_week_ago = now - timedelta(days=7)
-
-            # Using ranges to avoid persisting notification time in the database
-            due_in_2_weeks_start = today_start + timedelta(days=14)
-            due_in_2_weeks_end = today_end + timedelta(days=14)
-            due_in_3_days_start = today_start + timedelta(days=3)
-            due_in_3_days_end = today_end + timedelta(days=3)
-
-            entity_timing_fields = [
-                HelperTaskEntity.starts_at,
-                HelperTaskEntity.ends_at,
-                HelperTaskEntity.deadline,
-            ]
-
-            where = and_(
-                HelperTaskEntity.validated_by_id.is_(None),
-                or_(
-                    # Note: BETWEEN is inclusive (uses <=, not <)
-                    *[
-                        field.between(due_in_2_weeks_start, due_in_2_weeks_end)
-                        for field in entity_timing_fields
-                    ],
-                    *[
-                        field.between(due_in_3_days_start, due_in_3_days_end)
-                        for field in entity_timing_fields
-                    ],
-                    # Today or overdue
-                    *[field <= today_end for field in entity_timing_fields],
+            due = await find_due_reminders(
+                now,
+                find_tasks=partial(
+                    self._find_tasks,
+                    year=None,
+                    task_id=None,
+                    published=None,
+                    session=session,
                 ),
+                session=session,
             )
 
-            tasks = await self._find_tasks(
-                year=None,
-                task_id=None,
-                published=None,
-                where=where,
-                session=session,
+            self._logger.info(
+                "Identified %d upcoming tasks and %d overdue tasks",
+                len(due.upcoming_tasks),
+                len(due.overdue_tasks),
+            )
+            stats = self._notifications.send_reminders(
+                due.upcoming_tasks, due.overdue_tasks, session=session
+            )
+            await record_reminder_run(
+                due, reminded_task_ids=stats.reminded_task_ids, session=session
             )
 
-            # Split tasks how should be the reminders sent
-            upcoming_tasks: list[HelperTaskDto] = []
-            overdue_tasks: list[HelperTaskDto] = []
-
-            for task in tasks:
-                timings = [
-                    t
-                    for t in [task.starts_at, task.ends_at, task.deadline]
-                    if t is not None
-                ]
-
-                if not timings:
-                    # (Invalid) task has no timing information: no reminder
-                    self._logger.warning("Task %s has no timing information", task.id)
-                    continue
-
-                timing_earliest = min(timings)
-                timing_latest = max(timings)
-
-                # Note that here we are actually comparing to now, not to the start of the day
-                task_upcoming = now < timing_earliest
-                task_due = timing_latest < now
-
-                if not task_upcoming and not task_due:
-                    # Ongoing tasks: no reminder
-                    debug(task, "Ongoing task")
-                    continue
-
-                if (
-                    task_due
-                    and task.type == HelperTaskType.SHIFT
-                    and one_week_ago < timing_latest
-                ):
-                    # Shifts: skip reminder if timing_latest is more recent (greater) than one week ago
-                    debug(task, "Overdue shift in grace period")
-                    continue
-
-                if task_due:
-                    debug(task, "Overdue task")
-                    overdue_tasks.append(task)
-                else:
-                    debug(task, "Upcoming task")
-                    upcoming_tasks.append(task)
-
-        self._logger.info(
-            "Identified %d upcoming tasks and %d overdue tasks",
-            len(upcoming_tasks),
-            len(overdue_tasks),
-        )
-        await self._notifications.send_reminders(upcoming_tasks, overdue_tasks)
+            if lease:
+                await lease.verify(session)
+            await session.commit()
+
+        return stats
 
     async def _find_tasks(  # pylint: disable=too-many-arguments
         self,
@@ -824,50 +939,21 @@ async def _find_tasks(  # pylint: disable=too-many-arguments
         task_id: int | None,
         published: bool | None,
         where: ColumnElement[bool] | None = None,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> Sequence[HelperTaskDto]:
-        query = select(HelperTaskEntity)
-
-        exclude_large_fields: bool = task_id is None
-
-        if exclude_large_fields:
-            query = query.options(
-                defer(HelperTaskEntity.long_description, raiseload=True),
-                defer(HelperTaskEntity.marked_as_done_comment, raiseload=True),
-                defer(HelperTaskEntity.validation_comment, raiseload=True),
-            )
-
-        if year is not None:
-            query = query.where(
-                func.coalesce(  # pylint: disable=not-callable
-                    HelperTaskEntity.starts_at, HelperTaskEntity.deadline
-                ).between(
-                    datetime(year, 1, 1, 0, 0, 0, 0),
-                    datetime(year, 12, 31, 23, 59, 59, 0),
-                )
-            )
-        if task_id is not None:
-            query = query.where(HelperTaskEntity.id == task_id)
-        if published is not None:
-            query = query.where(HelperTaskEntity.published == published)
-        if where is not None:
-            query = query.where(where)
-
-        query = query.order_by(
-            HelperTaskEntity.urgent.desc(),
-            func.coalesce(  # pylint: disable=not-callable
-                HelperTaskEntity.starts_at, HelperTaskEntity.deadline
-            ).asc(),
-        )
+        large_fields = task_id is not None
 
         return await self.database_context.query_all(
-            query,
-            async_transformer=(
-                HelperTaskDto.create_without_large_fields
-                if exclude_large_fields
-                else HelperTaskDto.create
+            create_task_query(
+                year=year,
+                task_id=task_id,
+                published=published,
+                where=where,
+                large_fields=large_fields,
+            ),
+            batch_transformer=partial(
+                HelperTaskDto.create_many, large_fields=large_fields
             ),
-            unique=True,
             session=session,
         )
 
@@ -876,7 +962,7 @@ async def _find_task_by_id(
         task_id: int,
         *,
         published: bool | None,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> HelperTaskDto | None:
         tasks = await self._find_tasks(
             year=None, task_id=task_id, published=published, session=session
@@ -888,7 +974,7 @@ async def _get_task_by_id(
         task_id: int,
         *,
         published: bool | None = None,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> HelperTaskDto:
         task = await self._find_task_by_id(
             task_id, published=published, session=session
@@ -899,114 +985,5 @@ async def _get_task_by_id(
             "Task not found or not published" if published else "Task not found"
         )
 
-    async def _check_can_sign_up_as_captain(
-        self,
-        *,
-        task: HelperTaskDto,
-        member_id: int,
-        editor_action: bool,
-        session: Session,
-    ) -> None:
-        await self._check_can_sign_up(
-            task=task, member_id=member_id, editor_action=editor_action
-        )
-
-        if task.captain:
-            raise ControllerConflictException("Task already has a captain")
-
-        if task.captain_required_licence_info:
-            has_licence = (
-                session.scalar(
-                    select(LicenceEntity).where(
-                        LicenceEntity.member_id == member_id,
-                        LicenceEntity.licence_id
-                        == task.captain_required_licence_info.id,
-                        LicenceEntity.status > 0,
-                    )
-                )
-                is not None
-            )
-
-            if not has_licence:
-                raise ControllerConflictException(
-                    f"Task captain needs licence: {task.captain_required_licence_info.licence}"
-                )
-
-    async def _check_can_sign_up_as_helper(
-        self,
-        *,
-        task: HelperTaskDto,
-        member_id: int,
-        editor_action: bool,
-        session: Session,
-    ) -> None:
-        await self._check_can_sign_up(
-            task=task, member_id=member_id, editor_action=editor_action
-        )
-
-        if len(task.helpers) >= task.helper_max_count:
-            raise ControllerConflictException("Task helper limit reached")
-
-        if not editor_action:
-            # Check: helper cannot sign up for multiple surveillance tasks before mid-June:
-            # 1. This allows more members completing one surveillance shift in the beginning of the season
-            # 2. Members who want to do all their tasks early can still do maintenance tasks
-
-            surveillance_task = "surveillance" in task.category.title.lower()
-            mid_june = date(task.year, 6, 15)
-            message = "You cannot sign up for multiple surveillance shifts before mid-June — but you can still sign up for maintenance tasks!"
-
-            if (
-                surveillance_task
-                and task.starts_at
-                and task.starts_at.date() < mid_june
-            ):
-                # Check if the member has signed up for any other surveillance shift before mid-June
-                other_tasks = await self._find_tasks(
-                    year=task.year,
-                    task_id=None,
-                    published=None,
-                    where=and_(
-                        # Assumes that we only have one surveillance category, good enough
-                        HelperTaskEntity.category_id == task.category.id,
-                        HelperTaskEntity.starts_at < mid_june,
-                        or_(
-                            HelperTaskEntity.helpers.any(
-                                HelperTaskHelperEntity.member_id == member_id
-                            ),
-                        ),
-                    ),
-                    session=session,
-                )
-                if other_tasks:
-                    raise ControllerConflictException(message)
-
-    async def _check_can_sign_up(
-        self, *, task: HelperTaskDto, member_id: int, editor_action: bool
-    ) -> None:
-        if not task.published:
-            raise ControllerConflictException("Cannot sign up for an unpublished task")
-
-        if not editor_action:
-            if task.state == HelperTaskState.DONE:
-                raise ControllerConflictException(
-                    "Cannot sign up for a task marked as done"
-                )
-            if task.state == HelperTaskState.VALIDATED:
-                raise ControllerConflictException("Cannot sign up for a validated task")
-
-            now = get_now()
-            if (task.starts_at and task.starts_at < now) or (
-                task.deadline and task.deadline < now
-            ):
-                raise ControllerConflictException(
-                    "Cannot sign up for a task in the past"
-                )
-
-        if task.captain and task.captain.member.id == member_id:
-            raise ControllerConflictException("Already signed up as captain")
-        if any(helper.member.id == member_id for helper in task.helpers):
-            raise ControllerConflictException("Already signed up as helper")
-
     def _starts_in_the_future(self, task: HelperTaskDto) -> bool:
         return bool(task.starts_at and task.starts_at > get_now())
@@ -0,0 +1,58 @@
+"""
+Helper task queries.
+"""
+
+from sqlalchemy import ColumnElement, Select, func, select
+from sqlalchemy.orm import defer, joinedload, lazyload, selectinload
+
+from ycc_hull.db.entities import HelperTaskEntity, HelperTaskHelperEntity, MemberEntity
+
+# Loads everything `HelperTaskDto` needs with a fixed number of queries, regardless of the number of tasks: the
+# many-to-one relationships are joined, the helpers are loaded in a second query, as joining them would repeat each
+# task row for every helper. The back reference to the task is resolved from the identity map.
+_TASK_LOADER_OPTIONS = (
+    joinedload(HelperTaskEntity.category),
+    joinedload(HelperTaskEntity.contact).joinedload(MemberEntity.user),
+    joinedload(HelperTaskEntity.captain_required_licence_info),
+    joinedload(HelperTaskEntity.captain).joinedload(MemberEntity.user),
+    joinedload(HelperTaskEntity.marked_as_done_by).joinedload(MemberEntity.user),
+    joinedload(HelperTaskEntity.validated_by).joinedload(MemberEntity.user),
+    selectinload(HelperTaskEntity.helpers).options(
+        joinedload(HelperTaskHelperEntity.member).joinedload(MemberEntity.user),
+        lazyload(HelperTaskHelperEntity.helper_task),
+    ),
+)
+
+
+def create_task_query(
+    *,
+    year: int | None,
+    task_id: int | None,
+    published: bool | None,
+    where: ColumnElement[bool] | None,
+    large_fields: bool,
+) -> Select:
+    query = select(HelperTaskEntity).options(*_TASK_LOADER_OPTIONS)
+
+    if not large_fields:
+        query = query.options(
+            defer(HelperTaskEntity.long_description, raiseload=True),
+            defer(HelperTaskEntity.marked_as_done_comment, raiseload=True),
+            defer(HelperTaskEntity.validation_comment, raiseload=True),
+        )
+
+    if year is not None:
+        query = query.where(HelperTaskEntity.task_year == year)
+    if task_id is not None:
+        query = query.where(HelperTaskEntity.id == task_id)
+    if published is not None:
+        query = query.where(HelperTaskEntity.published == published)
+    if where is not None:
+        query = query.where(where)
+
+    return query.order_by(
+        HelperTaskEntity.urgent.desc(),
+        func.coalesce(  # pylint: disable=not-callable
+            HelperTaskEntity.starts_at, HelperTaskEntity.deadline
+        ).asc(),
+    )
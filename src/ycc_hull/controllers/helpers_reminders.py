@@ -0,0 +1,246 @@
+"""
+Helper task reminders: finds the tasks due for a daily reminder and records the sent reminders in the reminder ledger.
+
+Never send reminders for:
+- Tasks that are started and are not yet finished (especially multi-day shifts)
+- Tasks that are validated
+
+For upcoming tasks send reminders:
+- 2 weeks before
+- 3 days before
+- the day of the task
+
+Overdue tasks (not validated tasks in the past; to speed up task validation):
+- Reminders are sent per contact, not per task
+- Shifts:
+    - A reminder is sent every day to the contact 1 week after the shift is finished.
+    - The delay gives a window for shift organisers to validate tasks (as shifts "just happen" anyway").
+    - No immediate pressure on shift organisers, especially as the shifts often happen in batches (regattas, surveillance etc.)
+- Deadline tasks:
+    - A reminder is sent every day to the contact the if the deadline has expired.
+    - Deadline tasks are usually one-off maintenance tasks and in the past the experience was that they are often forgotten
+    - After the deadline expires, it is either done (and should have been validated) or the deadline should be extended
+
+Sent reminders are recorded in the ledger, so only the tasks still due for a reminder are queried. Successful runs are
+recorded too: upcoming reminders of the days since the last run, at most `reminder_catch_up_days` (e.g., the daily run
+failed), are still sent. Tasks which were not due on a missed day (e.g., created today) are only reminded when due.
+
+Notes:
+- Also send reminders for past years (avoid hanging tasks; tasks can have a deadline on 31 December)
+- Also send reminders for unpublished tasks (tasks with helpers should not be unpublished)
+"""
+
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+
+from sqlalchemy import ColumnElement, and_, exists, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ycc_hull.config import CONFIG
+from ycc_hull.db.entities import (
+    HelperTaskEntity,
+    HelperTaskReminderEntity,
+    HelperTaskReminderRunEntity,
+)
+from ycc_hull.models.helpers_dtos import HelperTaskDto
+
+
+class HelperTaskReminderKind(str, Enum):
+    """
+    Kind of reminder recorded in the reminder ledger.
+    """
+
+    UPCOMING_2_WEEKS = "UPCOMING_2_WEEKS"
+    UPCOMING_3_DAYS = "UPCOMING_3_DAYS"
+    UPCOMING_SAME_DAY = "UPCOMING_SAME_DAY"
+    OVERDUE = "OVERDUE"
+
+
+_UPCOMING_REMINDER_DAYS_BEFORE = {
+    HelperTaskReminderKind.UPCOMING_2_WEEKS: 14,
+    HelperTaskReminderKind.UPCOMING_3_DAYS: 3,
+    HelperTaskReminderKind.UPCOMING_SAME_DAY: 0,
+}
+
+
+@dataclass(frozen=True)
+class DueReminders:
+    """
+    Tasks due for a reminder in a daily run.
+    """
+
+    today_start: datetime
+    upcoming_tasks: list[HelperTaskDto]
+    upcoming_kinds: dict[int, list[HelperTaskReminderKind]]
+    """Kinds of the reminders per task, several if due together (e.g., after catching up)."""
+    overdue_tasks: list[HelperTaskDto]
+
+
+async def find_due_reminders(
+    now: datetime,
+    *,
+    find_tasks: Callable[..., Awaitable[Sequence[HelperTaskDto]]],
+    session: AsyncSession,
+) -> DueReminders:
+    """
+    Finds the tasks due for a reminder today.
+
+    Args:
+        now (datetime): time of the run
+        find_tasks (Callable[..., Awaitable[Sequence[HelperTaskDto]]]): finds the tasks matching the `where` condition
+        session (AsyncSession): session of the run
+    """
+    # "Round" to the start of the day
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+    catch_up = await _get_reminder_catch_up(today_start, session=session)
+
+    upcoming_tasks: dict[int, HelperTaskDto] = {}
+    upcoming_kinds: dict[int, list[HelperTaskReminderKind]] = defaultdict(list)
+
+    for kind, days_before in _UPCOMING_REMINDER_DAYS_BEFORE.items():
+        # Tasks starting `days_before` days after today or after the catch-up days, but not yet started
+        tasks = await find_tasks(
+            where=_upcoming_reminder_due(
+                kind,
+                max(now, today_start + timedelta(days=days_before) - catch_up),
+                today_end + timedelta(days=days_before),
+            )
+        )
+        for task in tasks:
+            # One reminder per task, even if several are due (e.g., after catching up)
+            upcoming_tasks[task.id] = task
+            upcoming_kinds[task.id].append(kind)
+
+    overdue_tasks = await find_tasks(
+        where=_overdue_reminder_due(
+            today_start, now, one_week_ago=now - timedelta(days=7)
+        )
+    )
+
+    return DueReminders(
+        today_start=today_start,
+        upcoming_tasks=list(upcoming_tasks.values()),
+        upcoming_kinds=dict(upcoming_kinds),
+        overdue_tasks=list(overdue_tasks),
+    )
+
+
+async def record_reminder_run(
+    due: DueReminders, *, reminded_task_ids: Iterable[int], session: AsyncSession
+) -> None:
+    """
+    Adds the sent reminders to the ledger and records the run, committed with the emails by the caller.
+    """
+    reminded_task_ids = set(reminded_task_ids)
+
+    session.add_all(
+        HelperTaskReminderEntity(
+            task_id=task.id,
+            kind=kind.value,
+            reminder_date=_to_reminder_date(_get_task_start(task)),
+        )
+        for task in due.upcoming_tasks
+        if task.id in reminded_task_ids
+        for kind in due.upcoming_kinds[task.id]
+    )
+    session.add_all(
+        HelperTaskReminderEntity(
+            task_id=task.id,
+            kind=HelperTaskReminderKind.OVERDUE.value,
+            reminder_date=_to_reminder_date(due.today_start),
+        )
+        for task in due.overdue_tasks
+        if task.id in reminded_task_ids
+    )
+
+    run_date = _to_reminder_date(due.today_start)
+    if await session.get(HelperTaskReminderRunEntity, run_date) is None:
+        session.add(HelperTaskReminderRunEntity(run_date=run_date))
+
+
+async def _get_reminder_catch_up(
+    today_start: datetime, *, session: AsyncSession
+) -> timedelta:
+    # Days missed since the last successful run, at most `reminder_catch_up_days`. No catch-up before the first run.
+    last_run_date = await session.scalar(
+        select(func.max(HelperTaskReminderRunEntity.run_date)).where(
+            HelperTaskReminderRunEntity.run_date < _to_reminder_date(today_start)
+        )
+    )
+    if last_run_date is None:
+        return timedelta()
+
+    missed_days = (_to_reminder_date(today_start) - last_run_date).days - 1
+    return timedelta(
+        days=max(0, min(missed_days, CONFIG.notifications.reminder_catch_up_days))
+    )
+
+
+def _upcoming_reminder_due(
+    kind: HelperTaskReminderKind, starts_after: datetime, starts_before: datetime
+) -> ColumnElement[bool]:
+    return and_(
+        HelperTaskEntity.validated_by_id.is_(None),
+        # Ranges on the columns instead of the start expression, so the indexes can be used
+        or_(
+            # Note: BETWEEN is inclusive (uses <=, not <)
+            HelperTaskEntity.starts_at.between(starts_after, starts_before),
+            and_(
+                HelperTaskEntity.starts_at.is_(None),
+                HelperTaskEntity.deadline.between(starts_after, starts_before),
+            ),
+        ),
+        _reminder_not_sent(kind, _task_start()),
+    )
+
+
+def _overdue_reminder_due(
+    today_start: datetime, now: datetime, *, one_week_ago: datetime
+) -> ColumnElement[bool]:
+    return and_(
+        HelperTaskEntity.validated_by_id.is_(None),
+        or_(
+            # Shifts: after a week of grace period
+            HelperTaskEntity.ends_at <= one_week_ago,
+            # Deadline tasks: right after the deadline
+            and_(
+                HelperTaskEntity.starts_at.is_(None),
+                HelperTaskEntity.deadline < now,
+            ),
+        ),
+        _reminder_not_sent(
+            HelperTaskReminderKind.OVERDUE, _to_reminder_date(today_start)
+        ),
+    )
+
+
+def _get_task_start(task: HelperTaskDto) -> datetime:
+    start = task.starts_at or task.deadline
+    if start is None:
+        raise ValueError(f"Task {task.id} has no timing information")
+    return start
+
+
+def _to_reminder_date(value: datetime) -> datetime:
+    # DATE columns have no time zone: the local time is stored, as for the task timings
+    return value.replace(tzinfo=None)
+
+
+def _task_start() -> ColumnElement[datetime]:
+    return func.coalesce(  # pylint: disable=not-callable
+        HelperTaskEntity.starts_at, HelperTaskEntity.deadline
+    )
+
+
+def _reminder_not_sent(
+    kind: HelperTaskReminderKind, reminder_date: ColumnElement[datetime] | datetime
+) -> ColumnElement[bool]:
+    return ~exists().where(
+        HelperTaskReminderEntity.task_id == HelperTaskEntity.id,
+        HelperTaskReminderEntity.kind == kind.value,
+        HelperTaskReminderEntity.reminder_date == reminder_date,
+    )
@@ -7,6 +7,11 @@
 from sqlalchemy import select
 
 from ycc_hull.controllers.base_controller import BaseController
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+    SerialisedDtos,
+)
 from ycc_hull.db.entities import HolidayEntity
 from ycc_hull.models.dtos import HolidayDto
 
@@ -21,3 +26,8 @@ async def find_all(self) -> Sequence[HolidayDto]:
             select(HolidayEntity).order_by(HolidayEntity.day),
             async_transformer=HolidayDto.create,
         )
+
+    async def find_all_serialised(self) -> SerialisedDtos:
+        return await REFERENCE_DATA_CACHE.get_or_load(
+            ReferenceData.HOLIDAYS, self.find_all
+        )
@@ -7,6 +7,11 @@
 from sqlalchemy import select
 
 from ycc_hull.controllers.base_controller import BaseController
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+    SerialisedDtos,
+)
 from ycc_hull.db.entities import LicenceInfoEntity
 from ycc_hull.models.dtos import LicenceDetailedInfoDto
 
@@ -21,3 +26,8 @@ async def find_all_licence_infos(self) -> Sequence[LicenceDetailedInfoDto]:
             select(LicenceInfoEntity).order_by(LicenceInfoEntity.nlicence),
             async_transformer=LicenceDetailedInfoDto.create,
         )
+
+    async def find_all_licence_infos_serialised(self) -> SerialisedDtos:
+        return await REFERENCE_DATA_CACHE.get_or_load(
+            ReferenceData.LICENCE_INFOS, self.find_all_licence_infos
+        )
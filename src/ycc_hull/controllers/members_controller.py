@@ -7,6 +7,11 @@
 from sqlalchemy import and_, or_, select
 
 from ycc_hull.controllers.base_controller import BaseController
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+    SerialisedDtos,
+)
 from ycc_hull.db.entities import (
     FeeRecordEntity,
     MemberEntity,
@@ -43,7 +48,7 @@ async def find_all_public_infos(
 
         return await self.database_context.query_all(
             query.order_by(MemberEntity.name, MemberEntity.firstname),
-            async_transformer=MemberPublicInfoDto.create,
+            batch_transformer=MemberPublicInfoDto.create_many,
         )
 
     async def find_all_membership_types(self) -> Sequence[MembershipTypeDto]:
@@ -52,6 +57,11 @@ async def find_all_membership_types(self) -> Sequence[MembershipTypeDto]:
             async_transformer=MembershipTypeDto.create,
         )
 
+    async def find_all_membership_types_serialised(self) -> SerialisedDtos:
+        return await REFERENCE_DATA_CACHE.get_or_load(
+            ReferenceData.MEMBERSHIP_TYPES, self.find_all_membership_types
+        )
+
     async def find_all_users(self) -> Sequence[UserDto]:
         return await self.database_context.query_all(
             select(UserEntity).order_by(UserEntity.logon_id),
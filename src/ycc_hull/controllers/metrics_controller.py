@@ -0,0 +1,38 @@
+"""
+Metrics controller.
+"""
+
+from ycc_hull.auth import token_cache_stats
+from ycc_hull.controllers.audit_log_sink import AUDIT_LOG_SINK
+from ycc_hull.controllers.base_controller import BaseController
+from ycc_hull.controllers.helper_task_list_cache import HELPER_TASK_LIST_CACHE
+from ycc_hull.controllers.notifications.email_outbox import EMAIL_OUTBOX_WORKER
+from ycc_hull.controllers.reference_data_cache import REFERENCE_DATA_CACHE
+from ycc_hull.models.metrics_dtos import (
+    AuditLogSinkStatsDto,
+    CacheStatsDto,
+    DatabasePoolStatsDto,
+    EmailOutboxStatsDto,
+    MetricsDto,
+    SchedulerLeaderElectionStatsDto,
+)
+from ycc_hull.scheduler_lock import SCHEDULER_LEADER_ELECTION
+
+
+class MetricsController(BaseController):
+    """
+    Metrics controller. Returns DTO objects.
+    """
+
+    async def get_metrics(self) -> MetricsDto:
+        return MetricsDto(
+            audit_log_sink=AuditLogSinkStatsDto.create(AUDIT_LOG_SINK.stats),
+            database_pool=DatabasePoolStatsDto.create(self.database_context.pool_stats),
+            email_outbox=EmailOutboxStatsDto.create(await EMAIL_OUTBOX_WORKER.stats()),
+            helper_task_list_cache=CacheStatsDto.create(HELPER_TASK_LIST_CACHE.stats),
+            reference_data_cache=CacheStatsDto.create(REFERENCE_DATA_CACHE.stats),
+            scheduler_leader_election=SchedulerLeaderElectionStatsDto.create(
+                SCHEDULER_LEADER_ELECTION.stats
+            ),
+            token_cache=CacheStatsDto.create(token_cache_stats()),
+        )
@@ -0,0 +1,383 @@
+"""
+Email outbox: notifications are stored in the transaction of the change which triggered them, then sent by a worker.
+
+Emails survive restarts and slow SMTP servers do not hold up the requests. Several processes can run workers on the
+same table: right before sending, an email is claimed by moving its next attempt past a lease and storing a claim token,
+so only one worker sends it unless that worker dies or stalls. The outcome of a send is only recorded while the claim
+token still matches, so a worker whose lease expired cannot overwrite the attempt of the worker which took over.
+"""
+
+import asyncio
+import email.policy
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from email.message import EmailMessage
+from email.parser import Parser
+from enum import Enum
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ycc_hull.config import CONFIG, EmailOutboxConfig
+from ycc_hull.controllers.notifications.smtp import get_smtp_connection_pool
+from ycc_hull.db.context import DatabaseContext, DatabaseContextHolder
+from ycc_hull.db.entities import EmailOutboxEntity
+from ycc_hull.rate_limit import TokenBucket
+from ycc_hull.utils import full_type_name, get_now
+
+_MAX_ERROR_LENGTH = 1000
+_MAX_SUBJECT_LENGTH = 1000
+_WAKE_ON_COMMIT = "email_outbox_wake_on_commit"
+
+
+class EmailOutboxStatus(str, Enum):
+    """
+    Email outbox entry status. Sent emails are deleted.
+    """
+
+    PENDING = "PENDING"
+    DEAD = "DEAD"
+
+
+@dataclass(frozen=True)
+class EmailOutboxStats:
+    """
+    Email outbox statistics.
+    """
+
+    pending: int
+    dead: int
+    sent: int
+    retried: int
+    """Failed attempts which will be retried."""
+    dead_lettered: int
+    """Emails given up on by this worker."""
+    lost_claims: int
+    """Emails sent by this worker after its lease expired, whose outcome is recorded by the worker which took over."""
+
+
+def enqueue_email(session: AsyncSession, message: EmailMessage) -> None:
+    """
+    Adds the message to the outbox in the session. It is sent after the session is committed, never if the session is
+    rolled back.
+
+    Args:
+        session (AsyncSession): session of the change triggering the email
+        message (EmailMessage): message
+    """
+    session.add(
+        EmailOutboxEntity(
+            status=EmailOutboxStatus.PENDING.value,
+            attempts=0,
+            next_attempt_at=get_now(),
+            subject=str(message["Subject"])[:_MAX_SUBJECT_LENGTH],
+            message=message.as_string(),
+        )
+    )
+
+    if not session.info.get(_WAKE_ON_COMMIT):
+        session.info[_WAKE_ON_COMMIT] = True
+        event.listen(session.sync_session, "after_commit", _wake_worker, once=True)
+
+
+def _wake_worker(session: Session) -> None:
+    session.info.pop(_WAKE_ON_COMMIT, None)
+    EMAIL_OUTBOX_WORKER.wake()
+
+
+def _parse_message(message: str) -> EmailMessage:
+    return Parser(EmailMessage, policy=email.policy.default).parsestr(message)
+
+
+class EmailOutboxWorker:  # pylint: disable=too-many-instance-attributes
+    """
+    Sends the due emails of the outbox with limited concurrency and rate. Failed emails are retried with exponential
+    backoff and dead-lettered after the maximum number of attempts.
+    """
+
+    def __init__(
+        self,
+        config: EmailOutboxConfig,
+        *,
+        send: Callable[[EmailMessage], Awaitable[None]] | None = None,
+        database_context: Callable[
+            [], DatabaseContext
+        ] = lambda: DatabaseContextHolder.context,
+    ) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._config = config
+        self._send = send or self._send_smtp
+        self._database_context = database_context
+        self._semaphore = asyncio.Semaphore(config.concurrency)
+        self._rate_limiter = TokenBucket(config.rate_per_second, config.burst)
+        self._wake = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._sent = 0
+        self._retried = 0
+        self._dead_lettered = 0
+        self._lost_claims = 0
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    async def start(self) -> None:
+        if self._runner is None:
+            self._stopping = False
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the worker after the emails being sent. The other emails of the batch are not claimed yet, they stay in
+        the outbox.
+        """
+        if self._runner is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._runner
+            self._runner = None
+
+    def wake(self) -> None:
+        """
+        Makes the worker look for due emails now instead of at the next poll.
+        """
+        self._wake.set()
+
+    async def stats(self) -> EmailOutboxStats:
+        async with self._database_context().session() as session:
+            counts = dict(
+                (
+                    await session.execute(
+                        select(
+                            EmailOutboxEntity.status,
+                            func.count(),  # pylint: disable=not-callable
+                        ).group_by(EmailOutboxEntity.status)
+                    )
+                )
+                .tuples()
+                .all()
+            )
+
+        return EmailOutboxStats(
+            pending=counts.get(EmailOutboxStatus.PENDING.value, 0),
+            dead=counts.get(EmailOutboxStatus.DEAD.value, 0),
+            sent=self._sent,
+            retried=self._retried,
+            dead_lettered=self._dead_lettered,
+            lost_claims=self._lost_claims,
+        )
+
+    async def process_due(self) -> int:
+        """
+        Sends a batch of due emails. Each email is claimed right before it is sent, after waiting for the concurrency
+        and rate limits, so the lease only has to cover one send.
+
+        Returns:
+            int: number of emails claimed
+        """
+        due = await self._find_due()
+        if not due:
+            return 0
+
+        started_at = time.monotonic()
+        # One failure does not stop the others
+        results = await asyncio.gather(
+            *(self._deliver(entry_id) for entry_id in due),
+            return_exceptions=True,
+        )
+        duration_seconds = time.monotonic() - started_at
+
+        claimed = 0
+        sent = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                self._logger.error("Failed to update the email outbox", exc_info=result)
+            elif result is not None:
+                claimed += 1
+                if result:
+                    sent += 1
+
+        self._logger.info(
+            "Sent %d of %d emails in %.2f seconds (%.1f emails/s)",
+            sent,
+            claimed,
+            duration_seconds,
+            sent / duration_seconds if duration_seconds else 0,
+        )
+        return claimed
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            # Cleared first, so emails enqueued while sending trigger another round
+            self._wake.clear()
+
+            try:
+                claimed = await self.process_due()
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception("Failed to process the email outbox")
+                claimed = 0
+
+            if claimed < self._config.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(), self._config.poll_interval_seconds
+                    )
+                except TimeoutError:
+                    pass
+
+    async def _find_due(self) -> list[int]:
+        async with self._database_context().session() as session:
+            return list(
+                (
+                    await session.scalars(
+                        select(EmailOutboxEntity.id)
+                        .where(
+                            EmailOutboxEntity.status == EmailOutboxStatus.PENDING.value,
+                            EmailOutboxEntity.next_attempt_at <= get_now(),
+                        )
+                        .order_by(
+                            EmailOutboxEntity.next_attempt_at, EmailOutboxEntity.id
+                        )
+                        .limit(self._config.batch_size)
+                    )
+                ).all()
+            )
+
+    async def _claim(self, entry_id: int) -> tuple[str, str] | None:
+        now = get_now()
+        claim_token = uuid.uuid4().hex
+
+        async with self._database_context().session() as session:
+            # Another worker may have claimed it since it was found
+            result = await session.execute(
+                update(EmailOutboxEntity)
+                .where(
+                    EmailOutboxEntity.id == entry_id,
+                    EmailOutboxEntity.status == EmailOutboxStatus.PENDING.value,
+                    EmailOutboxEntity.next_attempt_at <= now,
+                )
+                .values(
+                    next_attempt_at=now + timedelta(seconds=self._config.lease_seconds),
+                    claim_token=claim_token,
+                )
+            )
+            if result.rowcount != 1:
+                return None
+
+            message = await session.scalar(
+                select(EmailOutboxEntity.message).where(
+                    EmailOutboxEntity.id == entry_id
+                )
+            )
+            await session.commit()
+
+        return (claim_token, message) if message is not None else None
+
+    async def _deliver(self, entry_id: int) -> bool | None:
+        """
+        Returns:
+            bool | None: whether the email was sent, None if another worker claimed it or the worker is stopping
+        """
+        async with self._semaphore:
+            # Checked before and after waiting for the rate limit, so stopping does not wait for the whole batch
+            if self._stopping:
+                return None
+            await self._rate_limiter.acquire()
+            if self._stopping:
+                return None
+
+            claim = await self._claim(entry_id)
+            if claim is None:
+                return None
+            claim_token, message = claim
+
+            try:
+                await self._send(_parse_message(message))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                await self._record_failure(entry_id, claim_token, exc)
+                return False
+
+            await self._record_success(entry_id, claim_token)
+            return True
+
+    async def _record_success(self, entry_id: int, claim_token: str) -> None:
+        async with self._database_context().session() as session:
+            result = await session.execute(
+                delete(EmailOutboxEntity).where(
+                    EmailOutboxEntity.id == entry_id,
+                    EmailOutboxEntity.claim_token == claim_token,
+                )
+            )
+            await session.commit()
+
+        if result.rowcount == 1:
+            self._sent += 1
+        else:
+            self._on_claim_lost(entry_id)
+
+    async def _record_failure(
+        self, entry_id: int, claim_token: str, exc: Exception
+    ) -> None:
+        async with self._database_context().session() as session:
+            entry = await session.scalar(
+                select(EmailOutboxEntity).where(
+                    EmailOutboxEntity.id == entry_id,
+                    EmailOutboxEntity.claim_token == claim_token,
+                )
+            )
+            if entry is None:
+                self._on_claim_lost(entry_id)
+                return
+
+            entry.attempts += 1
+            entry.last_error = f"{full_type_name(exc.__class__)}: {exc}"[
+                :_MAX_ERROR_LENGTH
+            ]
+
+            if entry.attempts >= self._config.max_attempts:
+                entry.status = EmailOutboxStatus.DEAD.value
+                self._dead_lettered += 1
+                self._logger.error(
+                    "Giving up on email %d after %d attempts (Subject: %s): %s",
+                    entry_id,
+                    entry.attempts,
+                    entry.subject,
+                    exc,
+                )
+            else:
+                delay = min(
+                    self._config.backoff_base_seconds * 2 ** (entry.attempts - 1),
+                    self._config.backoff_max_seconds,
+                )
+                entry.next_attempt_at = get_now() + timedelta(seconds=delay)
+                self._retried += 1
+                self._logger.warning(
+                    "Failed to send email %d (attempt %d, Subject: %s), retrying in %s seconds: %s",
+                    entry_id,
+                    entry.attempts,
+                    entry.subject,
+                    delay,
+                    exc,
+                )
+
+            await session.commit()
+
+    def _on_claim_lost(self, entry_id: int) -> None:
+        self._lost_claims += 1
+        self._logger.warning(
+            "Lease of email %d expired while sending, another worker has claimed it, not recording the attempt",
+            entry_id,
+        )
+
+    @staticmethod
+    async def _send_smtp(message: EmailMessage) -> None:
+        await get_smtp_connection_pool().send_message(message)
+
+
+EMAIL_OUTBOX_WORKER = EmailOutboxWorker(CONFIG.email_outbox)
@@ -1,13 +1,20 @@
-import asyncio
 import copy
+import functools
 import logging
 import random
+import time
 from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from email.message import EmailMessage
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ycc_hull.config import CONFIG
 from ycc_hull.controllers.base_controller import BaseController
 from ycc_hull.controllers.notifications.email_message_builder import EmailMessageBuilder
+from ycc_hull.controllers.notifications.email_outbox import enqueue_email
 from ycc_hull.controllers.notifications.format_utils import (
     format_helper_task,
     format_helper_task_min_max_helpers,
@@ -16,14 +23,11 @@
     format_helper_tasks_list,
     format_member_info,
 )
-from ycc_hull.controllers.notifications.smtp import SmtpConnection
 from ycc_hull.models.dtos import MemberPublicInfoDto
 from ycc_hull.models.helpers_dtos import HelperTaskDto
 from ycc_hull.models.user import User
 from ycc_hull.utils import DiffEntry, camel_case_to_words, full_type_name
 
-NOTIFICATION_DELAY_SECONDS = 0.5
-
 _BOAT_PARTY = "⛵️🥳"
 _DEAR_SAILORS = f"<p>Dear Sailors {_BOAT_PARTY},</p>"
 _SIGN_UP_MESSAGES = [
@@ -50,6 +54,24 @@
 """
 
 
+@dataclass(frozen=True)
+class ReminderRunStats:
+    """
+    Statistics of a reminder run.
+    """
+
+    enqueued: int
+    failed: int
+    """Reminders which could not be built."""
+    duration_seconds: float
+    reminded_task_ids: frozenset[int] = frozenset()
+    """Tasks of the enqueued reminders."""
+
+    @property
+    def per_second(self) -> float:
+        return self.enqueued / self.duration_seconds if self.duration_seconds else 0
+
+
 class _HelperTaskChanges:
     """
     Responsible for computing the changes between two helper tasks.
@@ -216,12 +238,14 @@ class HelpersNotificationsController(BaseController):
     Controller for sending helper task notifications.
     """
 
-    async def on_update(
+    def on_update(
         self,
         original_task: HelperTaskDto,
         updated_task: HelperTaskDto,
         diff: dict[str, DiffEntry],
         user: User,
+        *,
+        session: AsyncSession,
     ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
@@ -266,11 +290,15 @@ async def on_update(
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
 
-    async def on_add_helper(
-        self, task: HelperTaskDto, helper: MemberPublicInfoDto, user: User
+    def on_add_helper(
+        self,
+        task: HelperTaskDto,
+        helper: MemberPublicInfoDto,
+        user: User,
+        *,
+        session: AsyncSession,
     ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
@@ -292,11 +320,46 @@ async def on_add_helper(
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
+
+    def on_add_helpers(
+        self,
+        task: HelperTaskDto,
+        helpers: Sequence[MemberPublicInfoDto],
+        user: User,
+        *,
+        session: AsyncSession,
+    ) -> None:
+        if not CONFIG.emails_enabled(self._logger):
+            return
+
+        # One email to all helpers added at once
+        message = (
+            _add_or_remove_helper_email(task, helpers, user)
+            .content(
+                f"""
+{_DEAR_SAILORS}
+
+<p>{user.full_name} has added you to this task.</p>
+
+{format_helper_task(task)}
+
+{_SHIFT_REPLACEMENT_REMINDER}
+{_SIGNATURE}
+"""
+            )
+            .build()
+        )
+
+        enqueue_email(session, message)
 
-    async def on_remove_helper(
-        self, task: HelperTaskDto, helper: MemberPublicInfoDto, user: User
+    def on_remove_helper(
+        self,
+        task: HelperTaskDto,
+        helper: MemberPublicInfoDto,
+        user: User,
+        *,
+        session: AsyncSession,
     ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
@@ -318,10 +381,11 @@ async def on_remove_helper(
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
 
-    async def on_sign_up(self, task: HelperTaskDto, user: User) -> None:
+    def on_sign_up(
+        self, task: HelperTaskDto, user: User, *, session: AsyncSession
+    ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
 
@@ -342,10 +406,11 @@ async def on_sign_up(self, task: HelperTaskDto, user: User) -> None:
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
 
-    async def on_mark_as_done(self, task: HelperTaskDto, user: User) -> None:
+    def on_mark_as_done(
+        self, task: HelperTaskDto, user: User, *, session: AsyncSession
+    ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
 
@@ -366,10 +431,11 @@ async def on_mark_as_done(self, task: HelperTaskDto, user: User) -> None:
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
 
-    async def on_validate(self, task: HelperTaskDto, user: User) -> None:
+    def on_validate(
+        self, task: HelperTaskDto, user: User, *, session: AsyncSession
+    ) -> None:
         if not CONFIG.emails_enabled(self._logger):
             return
 
@@ -390,39 +456,89 @@ async def on_validate(self, task: HelperTaskDto, user: User) -> None:
             .build()
         )
 
-        async with SmtpConnection() as smtp:
-            await smtp.send_message(message)
+        enqueue_email(session, message)
 
-    async def send_reminders(
+    def send_reminders(
         self,
         upcoming_tasks: list[HelperTaskDto],
         overdue_tasks: list[HelperTaskDto],
-    ) -> None:
+        *,
+        session: AsyncSession,
+    ) -> ReminderRunStats:
+        """
+        Builds all reminders up front, then enqueues them at once. The email outbox worker sends them with its
+        concurrency and rate limits. A reminder which cannot be built is logged and counted, the others are still sent.
+
+        Args:
+            upcoming_tasks (list[HelperTaskDto]): tasks to remind the captain and helpers about
+            overdue_tasks (list[HelperTaskDto]): tasks to remind the contacts about
+            session (AsyncSession): session to enqueue the reminders in, committed by the caller
+
+        Returns:
+            ReminderRunStats: statistics of the run
+        """
+        started_at = time.monotonic()
+
         if not CONFIG.emails_enabled(self._logger):
-            return
+            return ReminderRunStats(
+                enqueued=0, failed=0, duration_seconds=time.monotonic() - started_at
+            )
 
-        async with SmtpConnection() as smtp:
-            for task in upcoming_tasks:
-                await self._send_upcoming_task_reminder(task, smtp)
-                await asyncio.sleep(NOTIFICATION_DELAY_SECONDS)
+        overdue_tasks_by_contact_id: dict[int, list[HelperTaskDto]] = defaultdict(list)
+        for task in overdue_tasks:
+            overdue_tasks_by_contact_id[task.contact.id].append(task)
 
-            overdue_tasks_by_contact_id: dict[int, list[HelperTaskDto]] = defaultdict(
-                list
+        builders: list[tuple[str, list[HelperTaskDto], Callable[[], EmailMessage]]] = []
+        builders.extend(
+            (
+                f"upcoming task {task.id}",
+                [task],
+                functools.partial(self._create_upcoming_task_reminder, task),
             )
-            for task in overdue_tasks:
-                overdue_tasks_by_contact_id[task.contact.id].append(task)
-
-            for _, tasks in overdue_tasks_by_contact_id.items():
-                if not tasks:
-                    continue
+            for task in upcoming_tasks
+        )
+        builders.extend(
+            (
+                f"overdue tasks of contact {contact_id}",
+                tasks,
+                functools.partial(
+                    self._create_overdue_tasks_reminder, tasks[0].contact, tasks
+                ),
+            )
+            for contact_id, tasks in overdue_tasks_by_contact_id.items()
+        )
 
-                contact = tasks[0].contact
-                await self._send_overdue_tasks_reminder(contact, tasks, smtp)
-                await asyncio.sleep(NOTIFICATION_DELAY_SECONDS)
+        messages: list[EmailMessage] = []
+        reminded_task_ids: set[int] = set()
+        failed = 0
+        for description, tasks, build in builders:
+            try:
+                messages.append(build())
+            except Exception:  # pylint: disable=broad-exception-caught
+                failed += 1
+                self._logger.exception("Failed to build reminder: %s", description)
+            else:
+                reminded_task_ids.update(task.id for task in tasks)
+
+        for message in messages:
+            enqueue_email(session, message)
+
+        stats = ReminderRunStats(
+            enqueued=len(messages),
+            failed=failed,
+            duration_seconds=time.monotonic() - started_at,
+            reminded_task_ids=frozenset(reminded_task_ids),
+        )
+        self._logger.info(
+            "Enqueued %d reminders (%d failed) in %.2f seconds (%.1f reminders/s)",
+            stats.enqueued,
+            stats.failed,
+            stats.duration_seconds,
+            stats.per_second,
+        )
+        return stats
 
-    async def _send_upcoming_task_reminder(
-        self, task: HelperTaskDto, smtp: SmtpConnection
-    ) -> None:
+    def _create_upcoming_task_reminder(self, task: HelperTaskDto) -> EmailMessage:
         warnings = _get_task_warnings(task)
 
         message_builder = _task_notification_email_to_captain_and_helpers(task)
@@ -430,7 +546,7 @@ async def _send_upcoming_task_reminder(
         if warnings:
             message_builder.to(task.contact)
 
-        message = message_builder.content(
+        return message_builder.content(
             f"""
 {_DEAR_SAILORS}
 
@@ -439,23 +555,16 @@ async def _send_upcoming_task_reminder(
 {format_helper_task(task, warnings=warnings)}
             """
         ).build()
-        await smtp.send_message(message)
-
-    async def _send_overdue_tasks_reminder(
-        self,
-        contact: MemberPublicInfoDto,
-        tasks: list[HelperTaskDto],
-        smtp: SmtpConnection,
-    ) -> None:
-        if not tasks:
-            return
 
+    def _create_overdue_tasks_reminder(
+        self, contact: MemberPublicInfoDto, tasks: list[HelperTaskDto]
+    ) -> EmailMessage:
         tasks_count = len(tasks)
         n_overdue_tasks_str = (
             f"{tasks_count} overdue task{'s' if tasks_count > 1 else ''}"
         )
 
-        message = (
+        return (
             EmailMessageBuilder()
             .to(contact)
             .reply_to(contact)
@@ -482,15 +591,15 @@ async def _send_overdue_tasks_reminder(
             )
         ).build()
 
-        await smtp.send_message(message)
-
 
 def _add_or_remove_helper_email(
-    task: HelperTaskDto, helper: MemberPublicInfoDto, user: User
+    task: HelperTaskDto,
+    helpers: MemberPublicInfoDto | Sequence[MemberPublicInfoDto],
+    user: User,
 ) -> EmailMessageBuilder:
     return (
         EmailMessageBuilder()
-        .to(helper)
+        .to(helpers)
         .cc(task.contact)
         .cc(task.captain.member if task.captain else None)
         .cc(user)
@@ -1,4 +1,11 @@
+"""
+SMTP connections.
+"""
+
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from email.message import EmailMessage
 from types import TracebackType
 from typing import Type
@@ -9,6 +16,51 @@
 from ycc_hull.utils import full_type_name
 
 
+def _create_smtp(config: EmailConfig) -> aiosmtplib.SMTP:
+    return aiosmtplib.SMTP(
+        hostname=config.smtp_host,
+        port=config.smtp_port,
+        start_tls=config.smtp_start_tls,
+        username=config.smtp_username,
+        password=config.smtp_password,
+    )
+
+
+def _prepare_message(
+    message: EmailMessage, config: EmailConfig, logger: logging.Logger
+) -> None:
+    subject = f"{message['Subject']} - {CONFIG.ycc_app.name}"
+    del message["Subject"]
+    message["Subject"] = subject
+
+    if config.content_header:
+        # Add the header after <body> if present, otherwise at the beginning
+        content = message.get_content()
+        body_tag = "<body>"
+        index = content.find(body_tag)
+
+        if index != -1:
+            offset = len(body_tag)
+            content = f"{content[:index + offset]}\n{config.content_header}\n<p>\n{content[index + offset:]}"
+        else:
+            content = f"{config.content_header}\n\n{content}"
+
+        message.set_content(
+            content,
+            subtype="html",
+        )
+
+    logger.info(
+        "Sending email (Subject: %s, To: %s, Cc: %s, Bcc: %s, Reply-To: %s, content length: %d)",
+        message["Subject"],
+        message["To"],
+        message["Cc"],
+        message["Bcc"],
+        message["Reply-To"],
+        len(message.get_content()),
+    )
+
+
 class SmtpConnection:
     """Context manager for an SMTP connection."""
 
@@ -30,13 +82,7 @@ async def __aenter__(self) -> "SmtpConnection":
             self._config.smtp_start_tls,
         )
 
-        self._smtp = aiosmtplib.SMTP(
-            hostname=self._config.smtp_host,
-            port=self._config.smtp_port,
-            start_tls=self._config.smtp_start_tls,
-            username=self._config.smtp_username,
-            password=self._config.smtp_password,
-        )
+        self._smtp = _create_smtp(self._config)
         await self._smtp.connect()
 
         self._logger.info("Connected to SMTP server")
@@ -68,39 +114,200 @@ async def send_message(self, message: EmailMessage) -> None:
         if not self._smtp:
             raise RuntimeError("SMTP connection is not established")
 
-        subject = f"{message['Subject']} - {CONFIG.ycc_app.name}"
-        del message["Subject"]
-        message["Subject"] = subject
+        _prepare_message(message, self._config, self._logger)
+        await self._smtp.send_message(message)
+
+    async def send_messages(self, messages: list[EmailMessage]) -> None:
+        for message in messages:
+            await self.send_message(message)
+
 
-        if self._config.content_header:
-            # Add the header after <body> if present, otherwise at the beginning
-            content = message.get_content()
-            body_tag = "<body>"
-            index = content.find(body_tag)
+# The connection is broken, a new one may succeed
+_CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
 
-            if index != -1:
-                offset = len(body_tag)
-                content = f"{content[:index + offset]}\n{self._config.content_header}\n<p>\n{content[index + offset:]}"
-            else:
-                content = f"{self._config.content_header}\n\n{content}"
 
-            message.set_content(
-                content,
-                subtype="html",
-            )
+class SmtpConnectionPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Long-lived SMTP connections shared by the notifications, so messages do not pay for the TCP connection, STARTTLS
+    and authentication each.
+
+    At most `smtp_pool_size` messages are sent concurrently. Connections idle for more than the idle timeout are closed,
+    connections idle for more than the health check interval are checked with NOOP before reuse. A message which fails
+    because the connection broke is retried once on a new connection.
+    """
+
+    def __init__(
+        self,
+        config: EmailConfig,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._config = config
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(config.smtp_pool_size)
+        # Most recently used last, with the time they were released
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+        self._reaper: asyncio.TimerHandle | None = None
+        self._connects = 0
+        self._reuses = 0
+
+    @property
+    def connects(self) -> int:
+        return self._connects
+
+    @property
+    def reuses(self) -> int:
+        return self._reuses
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def send_message(self, message: EmailMessage) -> None:
+        """
+        Sends the message on a pooled connection.
+
+        Args:
+            message (EmailMessage): message
+        """
+        _prepare_message(message, self._config, self._logger)
+
+        async with self._semaphore:
+            for attempt in (1, 2):
+                smtp = await self._acquire()
+                try:
+                    await smtp.send_message(message)
+                except _CONNECTION_ERRORS as exc:
+                    self._discard(smtp)
+                    if attempt == 2:
+                        raise
+                    self._logger.warning(
+                        "SMTP connection broken, retrying on a new connection: %s",
+                        exc,
+                    )
+                except aiosmtplib.SMTPResponseException:
+                    # Rejected by the server, the connection is still usable
+                    self._release(smtp)
+                    raise
+                except BaseException:
+                    self._discard(smtp)
+                    raise
+                else:
+                    self._release(smtp)
+                    return
+
+    async def close(self) -> None:
+        """
+        Closes the idle connections.
+        """
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._quit(smtp)
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            idle_seconds = self._clock() - released_at
+
+            if idle_seconds >= self._config.smtp_idle_timeout_seconds:
+                self._discard(smtp)
+                continue
+
+            if idle_seconds > self._config.smtp_health_check_seconds:
+                try:
+                    await smtp.noop()
+                except (aiosmtplib.SMTPException, *_CONNECTION_ERRORS) as exc:
+                    self._logger.info("Dropping unhealthy SMTP connection: %s", exc)
+                    self._discard(smtp)
+                    continue
+
+            self._reuses += 1
+            return smtp
 
         self._logger.info(
-            "Sending email (Subject: %s, To: %s, Cc: %s, Bcc: %s, Reply-To: %s, content length: %d)",
-            message["Subject"],
-            message["To"],
-            message["Cc"],
-            message["Bcc"],
-            message["Reply-To"],
-            len(message.get_content()),
+            "Connecting to SMTP server %s:%s as username=%s, start TLS: %s",
+            self._config.smtp_host,
+            self._config.smtp_port,
+            self._config.smtp_username,
+            self._config.smtp_start_tls,
         )
+        smtp = _create_smtp(self._config)
+        await smtp.connect()
+        self._connects += 1
+        return smtp
 
-        await self._smtp.send_message(message)
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        if not smtp.is_connected:
+            return
 
-    async def send_messages(self, messages: list[EmailMessage]) -> None:
-        for message in messages:
-            await self.send_message(message)
+        self._idle.append((smtp, self._clock()))
+        self._schedule_reap()
+
+    def _schedule_reap(self) -> None:
+        if self._idle and not self._reaper:
+            self._reaper = asyncio.get_running_loop().call_later(
+                self._config.smtp_idle_timeout_seconds, self._reap
+            )
+
+    def _reap(self) -> None:
+        self._reaper = None
+        now = self._clock()
+        idle = []
+
+        for smtp, released_at in self._idle:
+            if now - released_at >= self._config.smtp_idle_timeout_seconds:
+                self._discard(smtp)
+            else:
+                idle.append((smtp, released_at))
+
+        self._idle = idle
+        self._schedule_reap()
+
+    async def _quit(self, smtp: aiosmtplib.SMTP) -> None:
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, *_CONNECTION_ERRORS):
+            smtp.close()
+
+    def _discard(self, smtp: aiosmtplib.SMTP) -> None:
+        # Broken or expired connections are not worth a QUIT
+        smtp.close()
+
+
+_SMTP_CONNECTION_POOL: SmtpConnectionPool | None = None
+
+
+def get_smtp_connection_pool() -> SmtpConnectionPool:
+    """
+    Gets the shared SMTP connection pool. Email must be configured.
+
+    Returns:
+        SmtpConnectionPool: the pool
+    """
+    global _SMTP_CONNECTION_POOL  # pylint: disable=global-statement
+
+    if _SMTP_CONNECTION_POOL is None:
+        if CONFIG.email is None:
+            raise ValueError("Email configuration is not set")
+        _SMTP_CONNECTION_POOL = SmtpConnectionPool(CONFIG.email)
+
+    return _SMTP_CONNECTION_POOL
+
+
+async def close_smtp_connection_pool() -> None:
+    """
+    Closes the idle connections of the shared SMTP connection pool, if it was used.
+    """
+    if _SMTP_CONNECTION_POOL:
+        await _SMTP_CONNECTION_POOL.close()
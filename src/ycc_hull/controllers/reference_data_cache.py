@@ -0,0 +1,106 @@
+"""
+Reference data cache.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from enum import Enum
+
+from pydantic import BaseModel
+
+from ycc_hull.cache import CacheStats, TtlCache
+from ycc_hull.config import CONFIG
+from ycc_hull.invalidation import INVALIDATION_BUS, InvalidationTopic
+
+
+class ReferenceData(str, Enum):
+    """
+    Reference data enumeration: data which changes only a few times per year.
+    """
+
+    BOATS = "BOATS"
+    HELPER_TASK_CATEGORIES = "HELPER_TASK_CATEGORIES"
+    HOLIDAYS = "HOLIDAYS"
+    LICENCE_INFOS = "LICENCE_INFOS"
+    MEMBERSHIP_TYPES = "MEMBERSHIP_TYPES"
+
+
+@dataclass(frozen=True)
+class SerialisedDtos:
+    """
+    DTOs serialised to a JSON array, as in API responses.
+    """
+
+    body: bytes
+    etag: str
+
+    @staticmethod
+    def create(dtos: Sequence[BaseModel]) -> "SerialisedDtos":
+        body = (
+            b"["
+            + b",".join(dto.model_dump_json(by_alias=True).encode() for dto in dtos)
+            + b"]"
+        )
+        return SerialisedDtos(
+            body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        )
+
+
+class ReferenceDataCache:
+    """
+    In-process cache of serialised reference data. Entries expire after the configured TTL, changes made outside of
+    this application are visible after that. Changes made by this application must be published on the invalidation
+    bus (`InvalidationTopic.REFERENCE_DATA`).
+    """
+
+    def __init__(self, *, ttl_seconds: float) -> None:
+        self._cache: TtlCache[ReferenceData, SerialisedDtos] = TtlCache(
+            max_size=len(ReferenceData), ttl_seconds=ttl_seconds
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get_or_load(
+        self,
+        reference_data: ReferenceData,
+        loader: Callable[[], Awaitable[Sequence[BaseModel]]],
+    ) -> SerialisedDtos:
+        """
+        Gets the serialised reference data from the cache or loads it if it is not cached.
+
+        Args:
+            reference_data (ReferenceData): reference data
+            loader (Callable[[], Awaitable[Sequence[BaseModel]]]): Loads the DTOs.
+
+        Returns:
+            SerialisedDtos: the serialised DTOs
+        """
+
+        async def load() -> tuple[SerialisedDtos, float | None]:
+            return SerialisedDtos.create(await loader()), None
+
+        return await self._cache.get_or_load(reference_data, load)
+
+    def invalidate(self, *reference_data: ReferenceData) -> None:
+        """
+        Invalidates the specified reference data, or all if none is specified.
+
+        Args:
+            *reference_data (ReferenceData): reference data to invalidate
+        """
+        if not reference_data:
+            self._cache.clear()
+
+        for entry in reference_data:
+            self._cache.invalidate(entry)
+
+
+REFERENCE_DATA_CACHE = ReferenceDataCache(
+    ttl_seconds=CONFIG.reference_data_cache_ttl_seconds
+)
+INVALIDATION_BUS.subscribe(
+    InvalidationTopic.REFERENCE_DATA, REFERENCE_DATA_CACHE.invalidate
+)
@@ -0,0 +1,47 @@
+"""
+Storage encoding of the audit log data (`audit_log.data`).
+
+The data is JSON. Large payloads may be stored compressed: zlib, Base64 encoded (the column is text) and prefixed with
+`_COMPRESSED_PREFIX`. JSON never starts with the prefix, so both forms can be in the table at the same time.
+"""
+
+import base64
+import zlib
+
+_COMPRESSED_PREFIX = "zlib:"
+
+
+def encode_audit_data(data: str, *, compression_threshold: int | None) -> str:
+    """
+    Encodes the JSON data for storage.
+
+    Args:
+        data (str): JSON data
+        compression_threshold (int | None): Data longer than this many characters is compressed. None disables the
+            compression.
+
+    Returns:
+        str: the data to store
+    """
+    if compression_threshold is None or len(data) <= compression_threshold:
+        return data
+
+    return _COMPRESSED_PREFIX + base64.b64encode(zlib.compress(data.encode())).decode()
+
+
+def decode_audit_data(data: str | None) -> str | None:
+    """
+    Decodes the stored data, compressed or not.
+
+    Args:
+        data (str | None): stored data
+
+    Returns:
+        str | None: JSON data
+    """
+    if data is None or not data.startswith(_COMPRESSED_PREFIX):
+        return data
+
+    return zlib.decompress(
+        base64.b64decode(data.removeprefix(_COMPRESSED_PREFIX))
+    ).decode()
@@ -2,29 +2,99 @@
 Database context.
 """
 
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncGenerator, Callable, Sequence
 from typing import Any, Awaitable, TypeVar
 
-import oracledb
-from sqlalchemy import Engine, Select, create_engine, func, select
-from sqlalchemy.orm import Session, sessionmaker
-
-from ycc_hull.config import CONFIG, Environment
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from ycc_hull.config import CONFIG, DatabasePoolConfig, Environment
+from ycc_hull.db.pool import (
+    DatabasePoolStats,
+    InstrumentedAsyncAdaptedQueuePool,
+    NativeOraclePool,
+    queue_pool_options,
+)
 
 T = TypeVar("T")
 
+# Sync driver URL prefix -> async driver URL prefix, so existing configurations keep working
+_ASYNC_DRIVERS = {
+    "oracle+oracledb://": "oracle+oracledb_async://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def to_async_database_url(database_url: str) -> str:
+    """
+    Converts a database URL to use the async variant of its driver.
+
+    Args:
+        database_url (str): database URL, e.g., `oracle+oracledb://...` or `sqlite:///...`
+
+    Returns:
+        str: database URL with an async driver, e.g., `oracle+oracledb_async://...` or `sqlite+aiosqlite:///...`
+    """
+    for sync_prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if database_url.startswith(sync_prefix):
+            return async_prefix + database_url.removeprefix(sync_prefix)
+    return database_url
+
 
 class DatabaseContext:
     """
     Database context.
+
+    Note: python-oracledb only supports asyncio in thin mode, so the Oracle Instant Client is not used.
     """
 
-    def __init__(self, database_url: str, *, echo: bool | None = None) -> None:
-        if database_url.startswith("oracle+oracledb://"):
-            oracledb.init_oracle_client()
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        echo: bool | None = None,
+        pool_config: DatabasePoolConfig | None = None,
+    ) -> None:
+        pool_config = pool_config or DatabasePoolConfig()
+        async_database_url = to_async_database_url(database_url)
+
+        self._native_pool: NativeOraclePool | None = None
+        if pool_config.native:
+            if not async_database_url.startswith("oracle+"):
+                raise ValueError(
+                    "The native connection pool is only supported for Oracle"
+                )
+
+            self._native_pool = NativeOraclePool(pool_config)
+            self._engine: AsyncEngine = create_async_engine(
+                async_database_url,
+                echo=echo,
+                poolclass=NullPool,
+                async_creator=self._native_pool.acquire,
+            )
+            self._native_pool.bind(self._engine)
+        else:
+            self._engine = create_async_engine(
+                async_database_url, echo=echo, **queue_pool_options(pool_config)
+            )
+
+        self.session = async_sessionmaker(self._engine)
+
+    @property
+    def pool_stats(self) -> DatabasePoolStats:
+        if self._native_pool:
+            return self._native_pool.stats
 
-        self._engine: Engine = create_engine(database_url, echo=echo)
-        self.session = sessionmaker(self._engine)
+        pool = self._engine.pool
+        if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            raise AssertionError(f"Unexpected pool type: {type(pool)}")
+        return pool.stats
 
     async def query_all(  # pylint: disable=too-many-arguments
         self,
@@ -32,8 +102,9 @@ async def query_all(  # pylint: disable=too-many-arguments
         *,
         transformer: Callable[[Any], T] | None = None,
         async_transformer: Callable[[Any], Awaitable[T]] | None = None,
+        batch_transformer: Callable[[Sequence[Any]], Sequence[T]] | None = None,
         unique: bool = False,
-        session: Session | None = None,
+        session: AsyncSession | None = None,
     ) -> Sequence[T]:
         """
         Queries all results for the specified SELECT statement from the database.
@@ -42,20 +113,25 @@ async def query_all(  # pylint: disable=too-many-arguments
             statement (Select): a SELECT query
             transformer (Callable[[Any], T], optional): Entity transformer (e.g., DTO factory). Defaults to None.
             async_transformer (Callable[[Any], Awaitable[T]], optional): Async entity transformer (e.g., DTO factory). Defaults to None.
+            batch_transformer (Callable[[Sequence[Any]], Sequence[T]], optional): Transformer of all the entities at once
+                (e.g., batch DTO factory), for eagerly loaded results. Defaults to None.
             unique (bool, optional): Whether to return only unique results. Defaults to False.
-            session (Session, optional): Database session to use. Defaults to None, which will make this function use a new session.
+            session (AsyncSession, optional): Database session to use. Defaults to None, which will make this function use a new session.
 
         Returns:
             Sequence[T]: Query results
         """
-        if transformer and async_transformer:
+        if (
+            len([t for t in (transformer, async_transformer, batch_transformer) if t])
+            > 1
+        ):
             raise AssertionError(
-                "Only one of transformer and async_transformer can be specified"
+                "Only one of transformer, async_transformer and batch_transformer can be specified"
             )
         session_to_use = session or self.session()
 
         try:
-            result = session_to_use.scalars(statement)
+            result = await session_to_use.scalars(statement)
             if unique:
                 result = result.unique()
 
@@ -63,20 +139,54 @@ async def query_all(  # pylint: disable=too-many-arguments
                 return [transformer(row) for row in result]
             if async_transformer:
                 return [await async_transformer(row) for row in result]
+            if batch_transformer:
+                return batch_transformer(result.all())
             return result.all()
         finally:
             if not session:
-                session_to_use.close()
+                await session_to_use.close()
+
+    async def stream_all(
+        self,
+        statement: Select,
+        *,
+        batch_transformer: Callable[[Sequence[Any]], Sequence[T]],
+        batch_size: int = 500,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Streams all results for the specified SELECT statement from the database with a server-side cursor: only one
+        batch of entities is held in memory at a time, regardless of the number of results.
+
+        The session is open until the generator is exhausted or closed. Collections must be loaded with
+        `selectinload()` (per batch), as `joinedload()` of collections needs the whole result.
+
+        Args:
+            statement (Select): a SELECT query
+            batch_transformer (Callable[[Sequence[Any]], Sequence[T]]): Transformer of a batch of entities (e.g.,
+                batch DTO factory).
+            batch_size (int, optional): Number of rows fetched at once. Defaults to 500.
+
+        Yields:
+            T: transformed results
+        """
+        async with self.session() as session:
+            result = await session.stream_scalars(
+                statement.execution_options(yield_per=batch_size)
+            )
+            async for batch in result.partitions():
+                # The identity map holds the entities weakly, the ones of the previous batches are freed
+                for item in batch_transformer(batch):
+                    yield item
 
     async def query_count(
-        self, entity_class: type, *, session: Session | None = None
+        self, entity_class: type, *, session: AsyncSession | None = None
     ) -> int:
         """
         Queries the count for the specified entity class.
 
         Args:
             entity_class (type): Entity class
-            session (Session, optional): Database session to use. Defaults to None, which will make this function use a new session.
+            session (AsyncSession, optional): Database session to use. Defaults to None, which will make this function use a new session.
 
         Returns:
             int: Entity count
@@ -84,7 +194,7 @@ async def query_count(
         session_to_use = session or self.session()
 
         try:
-            result = session_to_use.scalar(
+            result = await session_to_use.scalar(
                 select(func.count()).select_from(  # pylint: disable=not-callable
                     entity_class
                 )
@@ -94,13 +204,15 @@ async def query_count(
             return result
         finally:
             if not session:
-                session_to_use.close()
+                await session_to_use.close()
 
     async def close(self) -> None:
         """
         Closes the database context.
         """
-        self._engine.dispose()
+        await self._engine.dispose()
+        if self._native_pool:
+            await self._native_pool.close()
 
 
 class _DatabaseContextHolder:
@@ -115,7 +227,9 @@ def __init__(self) -> None:
     def context(self) -> DatabaseContext:
         if not self._context:
             self._context = DatabaseContext(
-                CONFIG.database_url, echo=CONFIG.environment == Environment.LOCAL
+                CONFIG.database_url,
+                echo=CONFIG.environment == Environment.LOCAL,
+                pool_config=CONFIG.database_pool,
             )
         return self._context
 
@@ -40,6 +40,7 @@
     CHAR,
     NVARCHAR,
     VARCHAR,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -72,6 +73,8 @@ class AuditLogEntryEntity(BaseEntity):
     """
 
     __tablename__ = "audit_log"
+    # Keyset pagination, see db_migrations/001_audit_log_created_at_id_idx.sql
+    __table_args__ = (Index("audit_log_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -112,6 +115,30 @@ class BoatEntity(BaseEntity):
     capacity: Mapped[int | None] = mapped_column(Integer)
 
 
+class EmailOutboxEntity(BaseEntity):
+    """
+    Represents an email waiting to be sent, see db_migrations/002_email_outbox.sql.
+    """
+
+    __tablename__ = "email_outbox"
+    # Due emails, oldest first
+    __table_args__ = (Index("email_outbox_due_idx", "status", "next_attempt_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        # SYSDATE in Oracle, this is for SQLite (for Oracle it's DB first approach)
+        server_default=text("(DATETIME('now','localtime'))"),
+    )
+    status: Mapped[str] = mapped_column(VARCHAR(10))
+    attempts: Mapped[int] = mapped_column(Integer)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime)
+    last_error: Mapped[str | None] = mapped_column(NVARCHAR(1000))
+    claim_token: Mapped[str | None] = mapped_column(VARCHAR(32))
+    subject: Mapped[str] = mapped_column(NVARCHAR(1000))
+    message: Mapped[str] = mapped_column(UnicodeText)
+
+
 class EntranceFeeRecordEntity(BaseEntity):
     """
     Represents an entrance fee record paid by a new member.
@@ -212,6 +239,15 @@ class HelperTaskEntity(BaseEntity):
     """
 
     __tablename__ = "helper_tasks"
+    # Task lists and reminders, see db_migrations/005_helper_tasks_indexes.sql and 006_helper_tasks_task_year.sql
+    __table_args__ = (
+        # Task lists of a year, then published and the urgent ordering
+        Index("helper_tasks_year_idx", "task_year", "published", "urgent"),
+        # Reminders: ranges on the timings of the tasks not validated yet
+        Index("helper_tasks_starts_at_idx", "starts_at", "validated_by_id"),
+        Index("helper_tasks_ends_at_idx", "ends_at", "validated_by_id"),
+        Index("helper_tasks_deadline_idx", "deadline", "validated_by_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     category_id: Mapped[int] = mapped_column(
@@ -225,6 +261,13 @@ class HelperTaskEntity(BaseEntity):
     starts_at: Mapped[datetime | None] = mapped_column(DateTime)
     ends_at: Mapped[datetime | None] = mapped_column(DateTime)
     deadline: Mapped[datetime | None] = mapped_column(DateTime)
+    # Year of the timing, computed by the database (virtual column in Oracle, this is for SQLite)
+    task_year: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed(
+            "CAST(STRFTIME('%Y', COALESCE(starts_at, ends_at, deadline)) AS INTEGER)"
+        ),
+    )
     # NUMBER(1, 0) in DB
     urgent: Mapped[bool] = mapped_column(Integer)
     captain_required_licence_info_id: Mapped[int | None] = mapped_column(
@@ -299,6 +342,42 @@ class HelperTaskHelperEntity(BaseEntity):
     )
 
 
+class HelperTaskReminderEntity(BaseEntity):
+    """
+    Ledger of the reminders sent about helper tasks, see db_migrations/003_helper_task_reminders.sql.
+    """
+
+    __tablename__ = "helper_task_reminders"
+
+    task_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("helper_tasks.id"), primary_key=True
+    )
+    kind: Mapped[str] = mapped_column(VARCHAR(20), primary_key=True)
+    # Upcoming reminders: start (or deadline) of the task, so a rescheduled task is reminded again
+    # Overdue reminders: day of the reminder, as they are sent daily
+    reminder_date: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        # SYSDATE in Oracle, this is for SQLite (for Oracle it's DB first approach)
+        server_default=text("(DATETIME('now','localtime'))"),
+    )
+
+
+class HelperTaskReminderRunEntity(BaseEntity):
+    """
+    Days on which the daily reminders ran successfully, see db_migrations/003_helper_task_reminders.sql.
+    """
+
+    __tablename__ = "helper_task_reminder_runs"
+
+    run_date: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        # SYSDATE in Oracle, this is for SQLite (for Oracle it's DB first approach)
+        server_default=text("(DATETIME('now','localtime'))"),
+    )
+
+
 class HolidayEntity(BaseEntity):
     """
     Represents a holiday. Holidays are usually the CERN holidays and are used for boat booking rules.
@@ -493,6 +572,21 @@ class MembershipTypeEntity(BaseEntity):
     comments: Mapped[str | None] = mapped_column(VARCHAR(100))
 
 
+class SchedulerLockEntity(BaseEntity):
+    """
+    Represents the lease of a scheduler leader, see db_migrations/004_scheduler_locks.sql.
+    """
+
+    __tablename__ = "scheduler_locks"
+
+    name: Mapped[str] = mapped_column(VARCHAR(50), primary_key=True)
+    owner: Mapped[str] = mapped_column(VARCHAR(200))
+    # Fencing token, incremented on every change of the owner
+    token: Mapped[int] = mapped_column(Integer)
+    locked_until: Mapped[datetime] = mapped_column(DateTime)
+    acquired_at: Mapped[datetime] = mapped_column(DateTime)
+
+
 class UserEntity(BaseEntity):
     """
     Represents a YCC member's login details.
@@ -0,0 +1,215 @@
+"""
+Database connection pools with metrics.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import oracledb
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from ycc_hull.config import DatabasePoolConfig
+
+
+@dataclass(frozen=True)
+class DatabasePoolStats:  # pylint: disable=too-many-instance-attributes
+    """
+    Database connection pool statistics.
+    """
+
+    size: int
+    """Open connections."""
+    max_size: int
+    checked_out: int
+    checkouts: int
+    failed_checkouts: int
+    """Checkouts which timed out or could not connect."""
+    overflow_events: int
+    """Checkouts which had to open a connection on top of the configured pool size."""
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class _PoolMetrics:
+    """
+    Mutable counters behind `DatabasePoolStats`.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.failed_checkouts = 0
+        self.overflow_events = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def record_failed_checkout(self, wait_seconds: float) -> None:
+        self.failed_checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def to_stats(
+        self, *, size: int, max_size: int, checked_out: int
+    ) -> DatabasePoolStats:
+        return DatabasePoolStats(
+            size=size,
+            max_size=max_size,
+            checked_out=checked_out,
+            checkouts=self.checkouts,
+            failed_checkouts=self.failed_checkouts,
+            overflow_events=self.overflow_events,
+            wait_seconds_total=self.wait_seconds_total,
+            wait_seconds_max=self.wait_seconds_max,
+        )
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    SQLAlchemy async queue pool which records checkout wait times and overflow events.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._metrics = _PoolMetrics()
+
+    @property
+    def stats(self) -> DatabasePoolStats:
+        return self._metrics.to_stats(
+            size=self.checkedin() + self.checkedout(),
+            max_size=self.size() + self._max_overflow,
+            checked_out=self.checkedout(),
+        )
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+
+        try:
+            entry = super()._do_get()
+        except Exception:
+            self._metrics.record_failed_checkout(time.perf_counter() - start)
+            raise
+
+        self._metrics.record_checkout(time.perf_counter() - start)
+        return entry
+
+    def _inc_overflow(self) -> bool:
+        # The overflow counter starts at -size, positive values are connections on top of the pool size
+        incremented = super()._inc_overflow()
+        if incremented and self._overflow > 0:
+            self._metrics.overflow_events += 1
+        return incremented
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = super().recreate()
+        if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            raise AssertionError(f"Unexpected pool type: {type(pool)}")
+
+        # Keep the metrics over engine disposals
+        pool._metrics = self._metrics  # pylint: disable=protected-access
+        return pool
+
+
+def queue_pool_options(pool_config: DatabasePoolConfig) -> dict[str, Any]:
+    """
+    Creates the `create_async_engine()` options for an instrumented SQLAlchemy pool.
+
+    Args:
+        pool_config (DatabasePoolConfig): pool configuration
+
+    Returns:
+        dict[str, Any]: engine options
+    """
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": pool_config.size,
+        "max_overflow": pool_config.max_overflow,
+        "pool_timeout": pool_config.timeout_seconds,
+        "pool_recycle": pool_config.recycle_seconds,
+        "pool_pre_ping": pool_config.pre_ping,
+    }
+
+
+class NativeOraclePool:
+    """
+    Lazily created python-oracledb connection pool (e.g., for DRCP). The SQLAlchemy engine must use `NullPool` and
+    `acquire()` as `async_creator`, so closing a connection returns it to this pool.
+    """
+
+    def __init__(self, pool_config: DatabasePoolConfig) -> None:
+        self._pool_config = pool_config
+        self._engine: AsyncEngine | None = None
+        self._pool: oracledb.AsyncConnectionPool | None = None
+        self._metrics = _PoolMetrics()
+
+    def bind(self, engine: AsyncEngine) -> None:
+        """
+        Binds the pool to the engine, the connection parameters are taken from the engine URL.
+
+        Args:
+            engine (AsyncEngine): engine
+        """
+        self._engine = engine
+
+    @property
+    def stats(self) -> DatabasePoolStats:
+        return self._metrics.to_stats(
+            size=self._pool.opened if self._pool else 0,
+            max_size=self._pool_config.size + self._pool_config.max_overflow,
+            checked_out=self._pool.busy if self._pool else 0,
+        )
+
+    async def acquire(self) -> oracledb.AsyncConnection:
+        pool = self._get_pool()
+        opened_before = pool.opened
+        start = time.perf_counter()
+
+        try:
+            connection = await pool.acquire()
+        except Exception:
+            self._metrics.record_failed_checkout(time.perf_counter() - start)
+            raise
+
+        self._metrics.record_checkout(time.perf_counter() - start)
+        if pool.opened > max(opened_before, self._pool_config.size):
+            self._metrics.overflow_events += 1
+        return connection
+
+    async def close(self) -> None:
+        if self._pool:
+            await self._pool.close(force=True)
+            self._pool = None
+
+    def _get_pool(self) -> oracledb.AsyncConnectionPool:
+        if self._pool:
+            return self._pool
+        if not self._engine:
+            raise AssertionError("Native pool is not bound to an engine")
+
+        pool_config = self._pool_config
+        url: URL = self._engine.url
+        _, connect_params = self._engine.dialect.create_connect_args(url)
+
+        self._pool = oracledb.create_pool_async(
+            min=pool_config.size,
+            max=pool_config.size + pool_config.max_overflow,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=int(pool_config.timeout_seconds * 1000),
+            max_lifetime_session=max(pool_config.recycle_seconds, 0),
+            ping_interval=60 if pool_config.pre_ping else -1,
+            cclass=pool_config.drcp_connection_class,
+            purity=(
+                oracledb.PURITY_SELF
+                if pool_config.drcp_connection_class
+                else oracledb.PURITY_DEFAULT
+            ),
+            **connect_params,
+        )
+        return self._pool
@@ -0,0 +1,238 @@
+"""
+Cache invalidation bus: keeps the in-process caches of several workers (processes, pods) coherent.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from enum import Enum
+from typing import Any, Protocol
+
+from ycc_hull.config import CONFIG
+from ycc_hull.utils import full_type_name
+
+
+class InvalidationTopic(str, Enum):
+    """
+    Invalidation topics: kinds of data whose caches are dropped together.
+    """
+
+    HELPER_TASKS = "HELPER_TASKS"
+    REFERENCE_DATA = "REFERENCE_DATA"
+
+
+class InvalidationBus(ABC):
+    """
+    Publishes change events to the subscribers of this process and, depending on the implementation, of other
+    processes. Events are delivered to the local subscribers immediately, before `publish()` returns.
+    """
+
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._subscribers: dict[InvalidationTopic, list[Callable[[], None]]] = {}
+
+    def subscribe(self, topic: InvalidationTopic, callback: Callable[[], None]) -> None:
+        """
+        Subscribes to a topic. The callback must be fast and must not raise.
+
+        Args:
+            topic (InvalidationTopic): topic
+            callback (Callable[[], None]): Called on every change event of the topic.
+        """
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    async def start(self) -> None:
+        """
+        Starts receiving events from other processes.
+        """
+
+    async def stop(self) -> None:
+        """
+        Stops receiving events from other processes.
+        """
+
+    async def publish(self, *topics: InvalidationTopic) -> None:
+        """
+        Publishes change events. Must be called after the data has changed (i.e., after commit).
+
+        Args:
+            *topics (InvalidationTopic): changed topics
+        """
+        self._deliver(*topics)
+        await self._publish_to_other_processes(*topics)
+
+    @abstractmethod
+    async def _publish_to_other_processes(self, *topics: InvalidationTopic) -> None:
+        raise NotImplementedError()
+
+    def _deliver(self, *topics: InvalidationTopic) -> None:
+        for topic in topics:
+            for callback in self._subscribers.get(topic, []):
+                callback()
+
+
+class InProcessInvalidationBus(InvalidationBus):
+    """
+    Invalidation bus of a single process. Other processes see the changes after the TTL of their caches.
+    """
+
+    async def _publish_to_other_processes(self, *topics: InvalidationTopic) -> None:
+        pass
+
+
+class RedisPubSub(Protocol):
+    """
+    The subset of `redis.asyncio.client.PubSub` used by `RedisInvalidationBus`.
+    """
+
+    async def subscribe(self, *channels: str) -> Any: ...
+
+    def listen(self) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def aclose(self) -> None: ...
+
+
+class RedisClient(Protocol):
+    """
+    The subset of `redis.asyncio.Redis` used by `RedisInvalidationBus`.
+    """
+
+    def publish(self, channel: str, message: str) -> Awaitable[int]: ...
+
+    def pubsub(self) -> RedisPubSub: ...
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """
+    Invalidation bus over Redis (or any server speaking its protocol) publish/subscribe.
+
+    Delivery is best effort: if the server is unreachable, other processes see the changes after the TTL of their
+    caches. After (re)subscribing, all topics are delivered locally, as events may have been missed in the meantime.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        *,
+        channel: str = "ycc-hull:invalidation",
+        reconnect_delay_seconds: float = 5,
+        publish_timeout_seconds: float = 2,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._channel = channel
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._publish_timeout_seconds = publish_timeout_seconds
+        # Events published by this process are delivered locally, the copies received from the server are skipped
+        self._origin = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+
+    @property
+    def subscribed(self) -> bool:
+        return self._subscribed.is_set()
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def wait_until_subscribed(self) -> None:
+        await self._subscribed.wait()
+
+    async def _publish_to_other_processes(self, *topics: InvalidationTopic) -> None:
+        message = json.dumps(
+            {"origin": self._origin, "topics": [topic.value for topic in topics]}
+        )
+        try:
+            # Called after every commit: a hanging server must not hold up the request
+            await asyncio.wait_for(
+                self._client.publish(self._channel, message),
+                self._publish_timeout_seconds,
+            )
+        except TimeoutError:
+            self._logger.warning(
+                "Failed to publish %s: no answer in %s s",
+                topics,
+                self._publish_timeout_seconds,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._logger.warning("Failed to publish %s: %s", topics, exc)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._receive()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._logger.warning(
+                    "Invalidation channel lost, reconnecting in %s s: %s",
+                    self._reconnect_delay_seconds,
+                    exc,
+                )
+            self._subscribed.clear()
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _receive(self) -> None:
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(self._channel)
+            self._logger.info("Subscribed to %s", self._channel)
+            self._subscribed.set()
+            self._deliver(*InvalidationTopic)
+
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._on_message(message["data"])
+        finally:
+            await pubsub.aclose()
+
+    def _on_message(self, data: str | bytes) -> None:
+        try:
+            event = json.loads(data)
+            if event["origin"] != self._origin:
+                self._deliver(*(InvalidationTopic(topic) for topic in event["topics"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            self._logger.warning("Invalid message %r: %s", data, exc)
+
+
+def create_invalidation_bus(
+    url: str | None, *, timeout_seconds: float = 2
+) -> InvalidationBus:
+    """
+    Creates the invalidation bus.
+
+    Args:
+        url (str | None): Redis URL, if None, the bus is in-process
+        timeout_seconds (float, optional): connect and publish timeout. Defaults to 2.
+
+    Returns:
+        InvalidationBus: the invalidation bus
+    """
+    if url is None:
+        return InProcessInvalidationBus()
+
+    # Optional dependency, only needed if configured
+    from redis.asyncio import Redis  # pylint: disable=import-outside-toplevel
+
+    # No socket timeout: the subscription waits for messages without one
+    return RedisInvalidationBus(
+        Redis.from_url(url, socket_connect_timeout=timeout_seconds),
+        publish_timeout_seconds=timeout_seconds,
+    )
+
+
+INVALIDATION_BUS = create_invalidation_bus(
+    CONFIG.invalidation_bus_url,
+    timeout_seconds=CONFIG.invalidation_bus_timeout_seconds,
+)
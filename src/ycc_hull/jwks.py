@@ -0,0 +1,138 @@
+"""
+Local JWT verification against a cached JSON Web Key Set (JWKS).
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from jwcrypto.common import JWException
+from jwcrypto.jwk import JWKSet
+from jwcrypto.jwt import JWT, JWTMissingKey
+
+from ycc_hull.utils import full_type_name
+
+# Asymmetric algorithms only: the JWKS contains public keys
+_ALGORITHMS = [
+    "RS256",
+    "RS384",
+    "RS512",
+    "PS256",
+    "PS384",
+    "PS512",
+    "ES256",
+    "ES384",
+    "ES512",
+]
+
+
+class TokenVerificationError(Exception):
+    """
+    This exception is raised when a token cannot be verified locally.
+    """
+
+
+class JwksTokenVerifier:  # pylint: disable=too-many-instance-attributes
+    """
+    Verifies signed JWTs locally against the JWKS of the issuer.
+
+    The key set is fetched on the first verification and cached. It is refreshed when a token refers to an unknown key
+    ID (`kid`), e.g., after a key rotation, but at most once per `min_refresh_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        fetch_jwks: Callable[[], Awaitable[dict]],
+        *,
+        issuer: str,
+        min_refresh_interval_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._fetch_jwks = fetch_jwks
+        self._issuer = issuer
+        self._min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._clock = clock
+
+        self._key_set: JWKSet | None = None
+        self._refreshed_at: float | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def verify(self, token: str) -> dict:
+        """
+        Verifies the token signature and standard claims.
+
+        Args:
+            token (str): JWT
+
+        Raises:
+            TokenVerificationError: if the token is invalid, expired, issued by someone else or signed with an unknown key
+
+        Returns:
+            dict: token claims
+        """
+        key_set = self._key_set or await self._refresh(None)
+
+        try:
+            return self._verify(token, key_set)
+        except JWTMissingKey:
+            self._logger.info("Token signed with an unknown key, refreshing JWKS")
+            key_set = await self._refresh(key_set)
+
+        try:
+            return self._verify(token, key_set)
+        except JWTMissingKey as exc:
+            raise TokenVerificationError("Token signed with an unknown key") from exc
+
+    def _verify(self, token: str, key_set: JWKSet) -> dict:
+        try:
+            jwt = JWT(
+                jwt=token,
+                key=key_set,
+                algs=_ALGORITHMS,
+                check_claims={"exp": None, "iss": self._issuer},
+                expected_type="JWS",
+            )
+            claims = json.loads(jwt.claims)
+        except JWTMissingKey:
+            raise
+        except (JWException, ValueError) as exc:
+            raise TokenVerificationError(
+                f"Invalid token: {full_type_name(exc.__class__)}: {exc}"
+            ) from exc
+
+        # Keycloak also signs ID tokens with the same keys
+        if claims.get("typ") != "Bearer":
+            raise TokenVerificationError(f"Not an access token: {claims.get('typ')}")
+
+        return claims
+
+    async def _refresh(self, stale_key_set: JWKSet | None) -> JWKSet:
+        async with self._refresh_lock:
+            if self._key_set is not None and self._key_set is not stale_key_set:
+                # Someone else refreshed while we were waiting for the lock
+                return self._key_set
+
+            if (
+                self._key_set is not None
+                and self._refreshed_at is not None
+                and self._clock() - self._refreshed_at
+                < self._min_refresh_interval_seconds
+            ):
+                return self._key_set
+
+            self._logger.info("Fetching JWKS")
+            jwks = await self._fetch_jwks()
+
+            key_set = JWKSet()
+            key_set.import_keyset(json.dumps(jwks))
+
+            self._key_set = key_set
+            self._refreshed_at = self._clock()
+            self._logger.info(
+                "Fetched JWKS with key IDs: %s",
+                [key.get("kid") for key in jwks.get("keys", [])],
+            )
+            return key_set
@@ -25,10 +25,17 @@
 from ycc_hull.api.holidays import api_holidays
 from ycc_hull.api.licences import api_licences
 from ycc_hull.api.members import api_members
+from ycc_hull.api.metrics import api_metrics
 from ycc_hull.app_controllers import (
     get_controllers,
     init_app_controllers,
 )
+from ycc_hull.auth import close_keycloak_connection
+from ycc_hull.background_jobs import (
+    BackgroundJobs,
+    start_common_services,
+    stop_common_services,
+)
 from ycc_hull.config import CONFIG
 from ycc_hull.constants import LOGGING_CONFIG_FILE
 from ycc_hull.controllers.exceptions import (
@@ -36,8 +43,6 @@
     ControllerConflictException,
     ControllerNotFoundException,
 )
-from ycc_hull.db.context import DatabaseContextHolder
-from ycc_hull.scheduler import init_scheduler
 
 _logger = logging.getLogger(__name__)
 
@@ -70,16 +75,23 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
     ).members_controller.find_all_membership_types()
     _logger.info("DB connection successful, membership types: %s", membership_types)
 
-    _logger.info("Starting the scheduler")
-    scheduler = init_scheduler(fastapi_app)
-    scheduler.start()
+    await start_common_services()
+
+    background_jobs: BackgroundJobs | None = None
+    if CONFIG.api_runs_background_jobs:
+        background_jobs = BackgroundJobs(get_controllers(fastapi_app))
+        await background_jobs.start()
+    else:
+        _logger.info("Background jobs are run by the standalone worker")
 
     yield
 
-    _logger.info("Shutdown event received, closing DB connection...")
-    await DatabaseContextHolder.context.close()
-    _logger.info("Stopping the scheduler...")
-    scheduler.shutdown()
+    _logger.info("Shutdown event received")
+    if background_jobs:
+        await background_jobs.stop()
+    await stop_common_services()
+    _logger.info("Closing Keycloak connections...")
+    await close_keycloak_connection()
 
 
 app = FastAPI(
@@ -138,6 +150,7 @@ async def controller_409_exception_handler(
 app.include_router(api_holidays)
 app.include_router(api_licences)
 app.include_router(api_members)
+app.include_router(api_metrics)
 
 if CONFIG.local:
     from test_data.api.test_data import api_test_data
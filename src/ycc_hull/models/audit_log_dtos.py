@@ -2,10 +2,15 @@
 Audit log API DTO classes.
 """
 
+from collections.abc import Sequence
 from datetime import date, datetime
 
+from pydantic import Field
+
+from ycc_hull.db.audit_data import decode_audit_data
 from ycc_hull.db.entities import AuditLogEntryEntity
 from ycc_hull.models.base import CamelisedBaseModel, CamelisedBaseModelWithEntity
+from ycc_hull.models.export import ExportFormat
 
 
 class AuditLogEntryDto(CamelisedBaseModelWithEntity[AuditLogEntryEntity]):
@@ -19,10 +24,11 @@ class AuditLogEntryDto(CamelisedBaseModelWithEntity[AuditLogEntryEntity]):
     principal: str
     description: str
     data: str | None
+    """JSON, decoded if it was stored compressed."""
 
     @classmethod
     async def create(cls, entry: AuditLogEntryEntity) -> "AuditLogEntryDto":
-        return await cls._create(
+        return cls._create(
             entry,
             data=await entry.awaitable_attrs.data,
         )
@@ -31,28 +37,84 @@ async def create(cls, entry: AuditLogEntryEntity) -> "AuditLogEntryDto":
     async def create_without_large_fields(
         cls, entry: AuditLogEntryEntity
     ) -> "AuditLogEntryDto":
-        return await cls._create(
+        return cls._create(
             entry,
             data=None,
         )
 
+    @classmethod
+    def create_many(
+        cls, entries: Sequence[AuditLogEntryEntity]
+    ) -> list["AuditLogEntryDto"]:
+        """
+        Creates the DTOs without IO: the data must be loaded.
+
+        Args:
+            entries (Sequence[AuditLogEntryEntity]): entries
+
+        Returns:
+            list[AuditLogEntryDto]: DTOs
+        """
+        return [cls._create(entry, data=entry.data) for entry in entries]
+
     @staticmethod
-    async def _create(
+    def _create(
         entry: AuditLogEntryEntity,
         *,
         data: str | None,
     ) -> "AuditLogEntryDto":
-        return AuditLogEntryDto(
+        return AuditLogEntryDto.create_trusted(
             entity=entry,
             id=entry.id,
             created_at=entry.created_at,
             application=entry.application,
             principal=entry.principal,
             description=entry.description,
-            data=data,
+            data=decode_audit_data(data),
         )
 
 
+class AuditLogEntriesFilterDto(CamelisedBaseModel):
+    """
+    DTO for audit log filters.
+    """
+
+    principal: str | None = None
+    description_prefix: str | None = None
+    created_from: date | None = Field(default=None, description="Inclusive")
+    created_to: date | None = Field(default=None, description="Inclusive")
+
+
+class AuditLogEntriesQueryDto(AuditLogEntriesFilterDto):
+    """
+    DTO for an audit log query: filters and the page to return. Entries are ordered from the newest to the oldest.
+    """
+
+    limit: int = Field(default=100, ge=1, le=1000)
+    cursor: str | None = Field(
+        default=None, description="`nextCursor` of the previous page"
+    )
+
+
+class AuditLogEntriesExportQueryDto(AuditLogEntriesFilterDto):
+    """
+    DTO for an audit log export: filters and format.
+    """
+
+    format: ExportFormat = ExportFormat.NDJSON
+
+
+class AuditLogEntriesPageDto(CamelisedBaseModel):
+    """
+    DTO for a page of audit log entries.
+    """
+
+    entries: Sequence[AuditLogEntryDto]
+    next_cursor: str | None = Field(
+        description="Cursor of the next page, None if this is the last page"
+    )
+
+
 class AuditLogEntriesDeleteRequestDto(CamelisedBaseModel):
     """
     DTO for an audit log delete request.
@@ -2,8 +2,10 @@
 Base model.
 """
 
+import re
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, Self, TypeVar
 
 import lxml
 import lxml.etree
@@ -11,13 +13,16 @@
 import lxml.html.clean
 from humps import camelize
 from lxml_html_clean import Cleaner, clean_html
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, model_validator
 from pydantic.fields import FieldInfo
 
 from ycc_hull.utils import TIME_ZONE, full_type_name
 
 EntityT = TypeVar("EntityT")
 
+# Validation context key for values which were sanitised before they were stored
+_TRUSTED = "trusted"
+
 
 class CamelisedBaseModel(BaseModel):
     """
@@ -35,40 +40,63 @@ class CamelisedBaseModel(BaseModel):
     # If you want to mark a field as HTML, use the following syntax:
     #
     # long_description: str | None = Field(json_schema_extra={"html": True})
+    #
+    # Models created from entities which only this service writes (helper tasks, helpers app permissions, audit log),
+    # whose values were sanitised as request DTOs, use `create_trusted()`, which skips the HTML parsing. Tables written
+    # by the legacy applications (members, boats, holidays, helper task categories, etc.) are never trusted.
     @model_validator(mode="before")
     @classmethod
-    def sanitise_values(cls, values: dict) -> dict:
+    def sanitise_values(cls, values: dict, info: ValidationInfo) -> dict:
+        trusted = bool(info.context and info.context.get(_TRUSTED))
         sanitised_values: dict = {}
 
         # Known fields
         for field_name, field_info in cls.model_fields.items():
             cls._extract_and_sanitise_value(
-                field_name, field_info, values, sanitised_values
+                field_name, field_info, values, sanitised_values, trusted=trusted
             )
             cls._extract_and_sanitise_value(
-                field_info.alias, field_info, values, sanitised_values
+                field_info.alias,
+                field_info,
+                values,
+                sanitised_values,
+                trusted=trusted,
             )
 
         # Unknown fields (keep for validation message)
         for key, value in values.items():
-            sanitised_values[key] = cls._sanitise_value(None, value)
+            sanitised_values[key] = cls._sanitise_value(None, value, trusted)
 
         return sanitised_values
 
     @classmethod
-    def _extract_and_sanitise_value(
+    def create_trusted(cls, **values: Any) -> Self:
+        """
+        Creates the model from trusted values, i.e., read from a table only this service writes, after sanitising them
+        as request DTOs. Text is not sanitised, only normalised (stripped, empty to None), date times are still
+        converted to the local time zone.
+
+        Returns:
+            Self: the model
+        """
+        return cls.model_validate(values, context={_TRUSTED: True})
+
+    @classmethod
+    def _extract_and_sanitise_value(  # pylint: disable=too-many-arguments
         cls,
         key: str | None,
         field_info: FieldInfo,
         values: dict,
         sanitised_values: dict,
+        *,
+        trusted: bool,
     ) -> Any:
         if key in values:
             value = values.pop(key)
-            sanitised_values[key] = cls._sanitise_value(field_info, value)
+            sanitised_values[key] = cls._sanitise_value(field_info, value, trusted)
 
     @staticmethod
-    def _sanitise_value(field_info: FieldInfo | None, value: Any) -> Any:
+    def _sanitise_value(field_info: FieldInfo | None, value: Any, trusted: bool) -> Any:
         is_str = isinstance(value, str)
         is_datetime = isinstance(value, datetime)
         is_datetime_field = field_info and field_info.annotation in (
@@ -87,7 +115,11 @@ def _sanitise_value(field_info: FieldInfo | None, value: Any) -> Any:
 
         if is_str and _get_field_info_extra_bool(field_info, "sanitise", True):
             if _get_field_info_extra_bool(field_info, "html", False):
+                if trusted:
+                    return value if value.strip() else None
                 return sanitise_html_input(value)
+            if trusted:
+                return value.strip() or None
             return sanitise_text_input(value)
 
         return value
@@ -125,60 +157,64 @@ def get_entity(self) -> EntityT:
         return self.entity
 
 
+# Characters which lxml would interpret or drop, strings without them are sanitised by stripping
+_NOT_PLAIN_TEXT = re.compile("[<&\x00-\x08\x0b\x0c\x0e-\x1f\ufeff\ufffe\uffff]")
+
+_SANITISE_CACHE_SIZE = 4096
+
+_HTML_CLEANER = Cleaner(
+    scripts=True,
+    javascript=True,
+    comments=True,
+    style=True,
+    inline_style=True,
+    links=True,
+    meta=True,
+    page_structure=True,
+    processing_instructions=True,
+    embedded=True,
+    frames=True,
+    forms=True,
+    annoying_tags=True,
+    kill_tags=[
+        "base",
+        "canvas",
+        "embed",
+        "iframe",
+        "object",
+        "svg",
+    ],
+    remove_tags=["table", "tbody", "thead", "tfoot", "tr", "th", "td"],
+    remove_unknown_tags=True,
+)
+
+
+@lru_cache(maxsize=_SANITISE_CACHE_SIZE)
 def sanitise_text_input(text: str | None) -> str | None:
     if not text:
         return None
+    if not _NOT_PLAIN_TEXT.search(text):
+        return text.strip() or None
 
     try:
-        element = _parse_html(text)
-
-        if element is None:
-            return None
-
-        clean_text = clean_html(element).text_content().strip()
-        return clean_text if clean_text else None
+        return _clean_text(_parse_html(text))
     except Exception as exc:
         raise ValueError(f"Failed to sanitise text input: {text}") from exc
 
 
+@lru_cache(maxsize=_SANITISE_CACHE_SIZE)
 def sanitise_html_input(html: str | None) -> str | None:
     if not html:
         return None
-    if sanitise_text_input(html) is None:
-        return None
 
     try:
         element = _parse_html(html)
 
-        if element is None:
+        # Both cleaners work on a copy of the element
+        if element is None or _clean_text(element) is None:
             return None
 
-        cleaner = Cleaner(
-            scripts=True,
-            javascript=True,
-            comments=True,
-            style=True,
-            inline_style=True,
-            links=True,
-            meta=True,
-            page_structure=True,
-            processing_instructions=True,
-            embedded=True,
-            frames=True,
-            forms=True,
-            annoying_tags=True,
-            kill_tags=[
-                "base",
-                "canvas",
-                "embed",
-                "iframe",
-                "object",
-                "svg",
-            ],
-            remove_tags=["table", "tbody", "thead", "tfoot", "tr", "th", "td"],
-            remove_unknown_tags=True,
-        )
-        clean_element = cleaner.clean_html(element)
+        clean_element = _HTML_CLEANER.clean_html(element)
 
         # clean_element could be wrapped in an extra <div> or <p> tag, it's OK
         return lxml.etree.tostring(clean_element, encoding="unicode", method="html")
@@ -186,6 +222,14 @@ def sanitise_html_input(html: str | None) -> str | None:
         raise ValueError(f"Failed to sanitise HTML input: {html}") from exc
 
 
+def _clean_text(element: lxml.html.HtmlElement | None) -> str | None:
+    if element is None:
+        return None
+
+    clean_text = clean_html(element).text_content().strip()
+    return clean_text if clean_text else None
+
+
 def _parse_html(text: str) -> lxml.html.HtmlElement | None:
     if not text:
         return None
@@ -2,6 +2,7 @@
 General API DTO classes.
 """
 
+from collections.abc import Sequence
 from datetime import date
 
 from pydantic import Field
@@ -81,6 +82,12 @@ class LicenceInfoDto(CamelisedBaseModelWithEntity[LicenceInfoEntity]):
     @staticmethod
     async def create(
         licence_info: LicenceInfoEntity,
+    ) -> "LicenceInfoDto":
+        return LicenceInfoDto.create_loaded(licence_info)
+
+    @staticmethod
+    def create_loaded(
+        licence_info: LicenceInfoEntity,
     ) -> "LicenceInfoDto":
         return LicenceInfoDto(
             entity=licence_info,
@@ -128,6 +135,15 @@ def full_name(self) -> str:
     async def create(
         member: MemberEntity,
     ) -> "MemberPublicInfoDto":
+        return MemberPublicInfoDto.create_loaded(member)
+
+    @staticmethod
+    def create_loaded(
+        member: MemberEntity,
+    ) -> "MemberPublicInfoDto":
+        """
+        Creates the DTO without any IO, the user of the member must be loaded.
+        """
         return MemberPublicInfoDto(
             entity=member,
             id=member.id,
@@ -141,6 +157,12 @@ async def create(
             work_phone=member.work_phone,
         )
 
+    @staticmethod
+    def create_many(
+        members: Sequence[MemberEntity],
+    ) -> list["MemberPublicInfoDto"]:
+        return [MemberPublicInfoDto.create_loaded(member) for member in members]
+
 
 class MemberSensitiveInfoDto(MemberPublicInfoDto):
     """
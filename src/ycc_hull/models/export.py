@@ -0,0 +1,16 @@
+"""
+Export models.
+"""
+
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """
+    Export format.
+    """
+
+    CSV = "CSV"
+    """Header and one row per DTO. Nested objects and lists are JSON in a single cell."""
+    NDJSON = "NDJSON"
+    """One JSON object per line, the same as in other API responses."""
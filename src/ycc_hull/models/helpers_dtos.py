@@ -13,11 +13,14 @@
     HelperTaskCategoryEntity,
     HelperTaskEntity,
     HelperTaskHelperEntity,
+    LicenceInfoEntity,
     MemberEntity,
 )
 from ycc_hull.models.base import CamelisedBaseModel, CamelisedBaseModelWithEntity
 from ycc_hull.models.dtos import LicenceInfoDto, MemberPublicInfoDto
 
+MAX_BULK_SIZE = 100
+
 
 class HelperTaskType(str, Enum):
     """
@@ -52,7 +55,7 @@ class HelpersAppPermissionDto(CamelisedBaseModelWithEntity[HelpersAppPermissionE
     async def create(
         permission: HelpersAppPermissionEntity,
     ) -> "HelpersAppPermissionDto":
-        return HelpersAppPermissionDto(
+        return HelpersAppPermissionDto.create_trusted(
             entity=permission,
             member=await MemberPublicInfoDto.create(
                 await permission.awaitable_attrs.member
@@ -92,12 +95,17 @@ class HelperTaskCategoryDto(CamelisedBaseModelWithEntity[HelperTaskCategoryEntit
 
     @staticmethod
     async def create(category: HelperTaskCategoryEntity) -> "HelperTaskCategoryDto":
+        await category.awaitable_attrs.long_description
+        return HelperTaskCategoryDto.create_loaded(category)
+
+    @staticmethod
+    def create_loaded(category: HelperTaskCategoryEntity) -> "HelperTaskCategoryDto":
         return HelperTaskCategoryDto(
             entity=category,
             id=category.id,
             title=category.title,
             short_description=category.short_description,
-            long_description=await category.awaitable_attrs.long_description,
+            long_description=category.long_description,
         )
 
 
@@ -153,89 +161,30 @@ def state(self) -> HelperTaskState:
 
     @classmethod
     async def create(cls, task: HelperTaskEntity) -> "HelperTaskDto":
-        return await cls._create(
-            task,
-            long_description=await task.awaitable_attrs.long_description,
-            marked_as_done_comment=await task.awaitable_attrs.marked_as_done_comment,
-            validation_comment=await task.awaitable_attrs.validation_comment,
-        )
+        # Loads whatever is not loaded yet (e.g., after a refresh), then creates the DTO without IO
+        for attribute in _TASK_ATTRIBUTES:
+            await getattr(task.awaitable_attrs, attribute)
+        await task.category.awaitable_attrs.long_description
 
-    @classmethod
-    async def create_without_large_fields(
-        cls, task: HelperTaskEntity
-    ) -> "HelperTaskDto":
-        return await cls._create(
-            task,
-            long_description=None,
-            marked_as_done_comment=None,
-            validation_comment=None,
-        )
+        return cls.create_many([task])[0]
 
     @staticmethod
-    async def _create(
-        task: HelperTaskEntity,
-        *,
-        long_description: str | None,
-        marked_as_done_comment: str | None,
-        validation_comment: str | None,
-    ) -> "HelperTaskDto":
-        captain = await task.awaitable_attrs.captain
-        captain_required_licence_info = (
-            await task.awaitable_attrs.captain_required_licence_info
-        )
-        marked_as_done_by = await task.awaitable_attrs.marked_as_done_by
-        validated_by = await task.awaitable_attrs.validated_by
+    def create_many(
+        tasks: Sequence[HelperTaskEntity], *, large_fields: bool = True
+    ) -> list["HelperTaskDto"]:
+        """
+        Creates the DTOs of a result set in one pass, without IO: the relationships of the tasks must be loaded. The
+        member, category and licence DTOs are shared between the tasks.
 
-        return HelperTaskDto(
-            entity=task,
-            id=task.id,
-            category=await HelperTaskCategoryDto.create(
-                await task.awaitable_attrs.category
-            ),
-            title=task.title,
-            short_description=task.short_description,
-            long_description=long_description,
-            contact=await MemberPublicInfoDto.create(
-                await task.awaitable_attrs.contact
-            ),
-            starts_at=task.starts_at,
-            ends_at=task.ends_at,
-            deadline=task.deadline,
-            urgent=task.urgent,
-            captain_required_licence_info=(
-                await LicenceInfoDto.create(captain_required_licence_info)
-                if captain_required_licence_info
-                else None
-            ),
-            helper_min_count=task.helper_min_count,
-            helper_max_count=task.helper_max_count,
-            published=task.published,
-            captain=(
-                await HelperTaskHelperDto.create_from_member_entity(
-                    # Either both or none are present
-                    captain,
-                    task.captain_signed_up_at,  # type: ignore
-                )
-                if task.captain
-                else None
-            ),
-            helpers=[
-                await HelperTaskHelperDto.create(helper)
-                for helper in await task.awaitable_attrs.helpers
-            ],
-            marked_as_done_at=task.marked_as_done_at,
-            marked_as_done_by=(
-                await MemberPublicInfoDto.create(marked_as_done_by)
-                if marked_as_done_by
-                else None
-            ),
-            marked_as_done_comment=marked_as_done_comment,
-            validated_at=task.validated_at,
-            validated_by=(
-                await MemberPublicInfoDto.create(validated_by) if validated_by else None
-            ),
-            validation_comment=validation_comment,
-        )
+        Args:
+            tasks (Sequence[HelperTaskEntity]): tasks
+            large_fields (bool, optional): Whether to include the large fields (loaded or not). Defaults to True.
+
+        Returns:
+            list[HelperTaskDto]: DTOs
+        """
+        factory = _HelperTaskDtoFactory(large_fields=large_fields)
+        return [factory.create(task) for task in tasks]
 
 
 class HelperTaskMutationRequestBaseDto(CamelisedBaseModel):
@@ -301,6 +250,24 @@ class HelperTaskCreationRequestDto(HelperTaskMutationRequestBaseDto):
     """
 
 
+class HelperTaskBulkCreationRequestDto(CamelisedBaseModel):
+    """
+    Bulk creation request DTO for helper tasks, e.g., the surveillance shifts of a season.
+    """
+
+    tasks: list[HelperTaskCreationRequestDto] = Field(
+        min_length=1, max_length=MAX_BULK_SIZE
+    )
+
+
+class HelperTaskHelpersAdditionRequestDto(CamelisedBaseModel):
+    """
+    Request DTO for adding several helpers to a helper task.
+    """
+
+    member_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_SIZE)
+
+
 class HelperTaskUpdateRequestDto(HelperTaskMutationRequestBaseDto):
     """
     Update request DTO for helper task.
@@ -339,7 +306,7 @@ class HelperTaskHelperDto(CamelisedBaseModelWithEntity[HelperTaskHelperEntity]):
     async def create(
         helper: HelperTaskHelperEntity,
     ) -> "HelperTaskHelperDto":
-        return HelperTaskHelperDto(
+        return HelperTaskHelperDto.create_trusted(
             entity=None,
             member=await MemberPublicInfoDto.create(helper.member),
             signed_up_at=helper.signed_up_at,
@@ -349,13 +316,117 @@ async def create(
     async def create_from_member_entity(
         member: MemberEntity, signed_up_at: datetime
     ) -> "HelperTaskHelperDto":
-        return HelperTaskHelperDto(
+        return HelperTaskHelperDto.create_trusted(
             entity=None,
             member=await MemberPublicInfoDto.create(member),
             signed_up_at=signed_up_at,
         )
 
 
+_TASK_ATTRIBUTES = (
+    "long_description",
+    "marked_as_done_comment",
+    "validation_comment",
+    "category",
+    "contact",
+    "captain_required_licence_info",
+    "captain",
+    "helpers",
+    "marked_as_done_by",
+    "validated_by",
+)
+
+
+class _HelperTaskDtoFactory:
+    """
+    Creates helper task DTOs without IO. The member, category and licence DTOs are created once per entity, as the same
+    members and categories appear in many tasks.
+    """
+
+    def __init__(self, *, large_fields: bool) -> None:
+        self._large_fields = large_fields
+        self._members: dict[int, MemberPublicInfoDto] = {}
+        self._categories: dict[int, HelperTaskCategoryDto] = {}
+        self._licence_infos: dict[int, LicenceInfoDto] = {}
+
+    def create(self, task: HelperTaskEntity) -> HelperTaskDto:
+        large_fields = self._large_fields
+
+        return HelperTaskDto.create_trusted(
+            entity=task,
+            id=task.id,
+            category=self._category(task.category),
+            title=task.title,
+            short_description=task.short_description,
+            long_description=task.long_description if large_fields else None,
+            contact=self._member(task.contact),
+            starts_at=task.starts_at,
+            ends_at=task.ends_at,
+            deadline=task.deadline,
+            urgent=task.urgent,
+            captain_required_licence_info=(
+                self._licence_info(task.captain_required_licence_info)
+                if task.captain_required_licence_info
+                else None
+            ),
+            helper_min_count=task.helper_min_count,
+            helper_max_count=task.helper_max_count,
+            published=task.published,
+            captain=(
+                HelperTaskHelperDto.create_trusted(
+                    entity=None,
+                    member=self._member(task.captain),
+                    # Either both or none are present
+                    signed_up_at=task.captain_signed_up_at,  # type: ignore
+                )
+                if task.captain
+                else None
+            ),
+            helpers=[
+                HelperTaskHelperDto.create_trusted(
+                    entity=None,
+                    member=self._member(helper.member),
+                    signed_up_at=helper.signed_up_at,
+                )
+                for helper in task.helpers
+            ],
+            marked_as_done_at=task.marked_as_done_at,
+            marked_as_done_by=(
+                self._member(task.marked_as_done_by) if task.marked_as_done_by else None
+            ),
+            marked_as_done_comment=(
+                task.marked_as_done_comment if large_fields else None
+            ),
+            validated_at=task.validated_at,
+            validated_by=(
+                self._member(task.validated_by) if task.validated_by else None
+            ),
+            validation_comment=task.validation_comment if large_fields else None,
+        )
+
+    def _member(self, member: MemberEntity) -> MemberPublicInfoDto:
+        dto = self._members.get(member.id)
+        if not dto:
+            dto = self._members[member.id] = MemberPublicInfoDto.create_loaded(member)
+        return dto
+
+    def _category(self, category: HelperTaskCategoryEntity) -> HelperTaskCategoryDto:
+        dto = self._categories.get(category.id)
+        if not dto:
+            dto = self._categories[category.id] = HelperTaskCategoryDto.create_loaded(
+                category
+            )
+        return dto
+
+    def _licence_info(self, licence_info: LicenceInfoEntity) -> LicenceInfoDto:
+        dto = self._licence_infos.get(licence_info.infoid)
+        if not dto:
+            dto = self._licence_infos[licence_info.infoid] = (
+                LicenceInfoDto.create_loaded(licence_info)
+            )
+        return dto
+
+
 def get_task_year(task: HelperTaskDto | HelperTaskMutationRequestBaseDto) -> int:
     if task.starts_at:
         return task.starts_at.year
@@ -0,0 +1,111 @@
+"""
+Metrics API DTO classes.
+"""
+
+from dataclasses import asdict
+
+from ycc_hull.cache import CacheStats
+from ycc_hull.controllers.audit_log_sink import AuditLogSinkStats
+from ycc_hull.controllers.notifications.email_outbox import EmailOutboxStats
+from ycc_hull.db.pool import DatabasePoolStats
+from ycc_hull.models.base import CamelisedBaseModel
+from ycc_hull.scheduler_lock import SchedulerLeaderElectionStats
+
+
+class AuditLogSinkStatsDto(CamelisedBaseModel):
+    """
+    DTO for audit log sink statistics.
+    """
+
+    written: int
+    dropped: int
+    failed: int
+    queue_size: int
+    max_queue_size: int
+
+    @staticmethod
+    def create(stats: AuditLogSinkStats) -> "AuditLogSinkStatsDto":
+        return AuditLogSinkStatsDto(**asdict(stats))
+
+
+class CacheStatsDto(CamelisedBaseModel):
+    """
+    DTO for cache statistics.
+    """
+
+    hits: int
+    misses: int
+    collapsed: int
+    size: int
+    max_size: int
+
+    @staticmethod
+    def create(stats: CacheStats) -> "CacheStatsDto":
+        return CacheStatsDto(**asdict(stats))
+
+
+class DatabasePoolStatsDto(CamelisedBaseModel):
+    """
+    DTO for database connection pool statistics.
+    """
+
+    checkouts: int
+    failed_checkouts: int
+    overflow_events: int
+    size: int
+    max_size: int
+    checked_out: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    @staticmethod
+    def create(stats: DatabasePoolStats) -> "DatabasePoolStatsDto":
+        return DatabasePoolStatsDto(**asdict(stats))
+
+
+class EmailOutboxStatsDto(CamelisedBaseModel):
+    """
+    DTO for email outbox statistics.
+    """
+
+    pending: int
+    dead: int
+    sent: int
+    retried: int
+    dead_lettered: int
+    lost_claims: int
+
+    @staticmethod
+    def create(stats: EmailOutboxStats) -> "EmailOutboxStatsDto":
+        return EmailOutboxStatsDto(**asdict(stats))
+
+
+class SchedulerLeaderElectionStatsDto(CamelisedBaseModel):
+    """
+    DTO for scheduler leader election statistics.
+    """
+
+    leader: bool
+    token: int | None
+    acquired: int
+    lost: int
+
+    @staticmethod
+    def create(
+        stats: SchedulerLeaderElectionStats,
+    ) -> "SchedulerLeaderElectionStatsDto":
+        return SchedulerLeaderElectionStatsDto(**asdict(stats))
+
+
+class MetricsDto(CamelisedBaseModel):
+    """
+    DTO for the application metrics.
+    """
+
+    audit_log_sink: AuditLogSinkStatsDto
+    database_pool: DatabasePoolStatsDto
+    email_outbox: EmailOutboxStatsDto
+    helper_task_list_cache: CacheStatsDto
+    reference_data_cache: CacheStatsDto
+    scheduler_leader_election: SchedulerLeaderElectionStatsDto
+    token_cache: CacheStatsDto
@@ -0,0 +1,50 @@
+"""
+Rate limiting.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: allows `rate_per_second` acquisitions per second on average, and up to `burst` at once
+    after being idle.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError(f"Invalid rate: {rate_per_second}")
+        if burst < 1:
+            raise ValueError(f"Invalid burst: {burst}")
+
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    async def acquire(self) -> None:
+        """
+        Waits until a token is available and takes it.
+        """
+        while True:
+            now = self._clock()
+            self._tokens = min(
+                self._burst,
+                self._tokens + (now - self._updated_at) * self._rate_per_second,
+            )
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self._rate_per_second)
@@ -8,11 +8,11 @@
 from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from fastapi import FastAPI
 
-from ycc_hull.app_controllers import get_controllers
+from ycc_hull.app_controllers import Controllers
 from ycc_hull.config import CONFIG
 from ycc_hull.constants import TIME_ZONE_ID
+from ycc_hull.scheduler_lock import SCHEDULER_LEADER_ELECTION
 
 _logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ def _parse_trigger(trigger_str: str | None) -> BaseTrigger | None:
     raise ValueError(f"Unsupported trigger type: {trigger_type}")
 
 
-def init_scheduler(app: FastAPI) -> AsyncIOScheduler:
+def init_scheduler(controllers: Controllers) -> AsyncIOScheduler:
     scheduler = AsyncIOScheduler(timezone=TIME_ZONE_ID)
 
     trigger = _parse_trigger(CONFIG.notifications.daily_notifications_trigger)
@@ -43,10 +43,28 @@ def init_scheduler(app: FastAPI) -> AsyncIOScheduler:
         async def send_daily_helper_task_reminders() -> None:
             task_name = send_daily_helper_task_reminders.__name__
 
-            _logger.info("Starting scheduled task: %s", task_name)
-
             try:
-                await get_controllers(app).helpers_controller.send_daily_reminders()
+                # Every worker fires the job, only the leader runs it. If the leader died shortly before, its lease
+                # expires within this time and another worker takes over. Should the old leader have run the job
+                # already, the reminder ledger keeps the reminders from being sent twice.
+                lease = await SCHEDULER_LEADER_ELECTION.acquire_within(
+                    CONFIG.scheduler_lock.lease_seconds
+                    + CONFIG.scheduler_lock.renew_interval_seconds
+                )
+                if lease is None:
+                    _logger.info(
+                        "Not the scheduler leader, skipping scheduled task: %s",
+                        task_name,
+                    )
+                    return
+
+                _logger.info(
+                    "Starting scheduled task: %s (lease token %d)",
+                    task_name,
+                    lease.token,
+                )
+
+                await controllers.helpers_controller.send_daily_reminders(lease=lease)
 
                 _logger.info("Scheduled task finished: %s", task_name)
             except Exception:
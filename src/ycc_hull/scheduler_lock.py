@@ -0,0 +1,330 @@
+"""
+Scheduler leader election: only the worker (process, pod) holding the lease of a `scheduler_locks` row runs the
+scheduled jobs, so they run once even with several workers.
+
+The leader renews its lease periodically. If it dies, the lease expires and another worker takes over. Every change of
+the owner increments the fencing token. Jobs verify it in their transaction before committing, so a leader which lost
+its lease (e.g., paused for longer than the lease) cannot commit after another worker took over.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ycc_hull.config import CONFIG, SchedulerLockConfig
+from ycc_hull.db.context import DatabaseContext, DatabaseContextHolder
+from ycc_hull.db.entities import SchedulerLockEntity
+from ycc_hull.utils import full_type_name, get_now
+
+SCHEDULER_LOCK_NAME = "scheduler"
+
+
+class SchedulerLeaseLostException(Exception):
+    """
+    Raised when another worker took over the lease.
+    """
+
+
+@dataclass(frozen=True)
+class SchedulerLease:
+    """
+    Lease held by the scheduler leader.
+    """
+
+    name: str
+    owner: str
+    token: int
+    """Fencing token, incremented on every change of the owner."""
+
+    async def verify(self, session: AsyncSession) -> None:
+        """
+        Checks that no other worker took over the lease. Must be called in the transaction of the job right before
+        committing: the lock row stays locked until the end of the transaction, so it cannot be taken over in between.
+
+        Args:
+            session (AsyncSession): session of the job
+
+        Raises:
+            SchedulerLeaseLostException: if another worker took over the lease
+        """
+        # Flushes the pending changes first, for SQLite the writes lock the database until the end of the transaction
+        lock = (
+            await session.execute(
+                select(SchedulerLockEntity.owner, SchedulerLockEntity.token)
+                .where(SchedulerLockEntity.name == self.name)
+                .with_for_update()
+            )
+        ).one_or_none()
+
+        if lock is None or tuple(lock) != (self.owner, self.token):
+            raise SchedulerLeaseLostException(
+                f"Lease {self.name} (token {self.token}) was taken over by {lock[0] if lock else None}"
+            )
+
+
+@dataclass(frozen=True)
+class SchedulerLeaderElectionStats:
+    """
+    Scheduler leader election statistics.
+    """
+
+    leader: bool
+    token: int | None
+    acquired: int
+    """Leases acquired (not renewed) by this worker."""
+    lost: int
+    """Leases lost by this worker, e.g., the renewal failed or another worker took over."""
+
+
+def _to_db_time(value: datetime) -> datetime:
+    # DATE columns have no time zone: the local time is stored
+    return value.replace(tzinfo=None)
+
+
+class SchedulerLeaderElection:  # pylint: disable=too-many-instance-attributes
+    """
+    Acquires and renews the lease of a scheduler lock in the background. Clocks of the workers should be synchronised,
+    the fencing token keeps the jobs safe if they are not.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        config: SchedulerLockConfig,
+        *,
+        name: str = SCHEDULER_LOCK_NAME,
+        owner: str | None = None,
+        database_context: Callable[
+            [], DatabaseContext
+        ] = lambda: DatabaseContextHolder.context,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logging.getLogger(full_type_name(self.__class__))
+        self._config = config
+        self._name = name
+        self._owner = (
+            owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._database_context = database_context
+        self._clock = clock
+        self._lease: SchedulerLease | None = None
+        self._lease_valid_until = 0.0
+        self._stop = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        self._acquired = 0
+        self._lost = 0
+
+    @property
+    def owner(self) -> str:
+        return self._owner
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def lease(self) -> SchedulerLease | None:
+        """
+        The lease if this worker is the leader. Considered lost when it was not renewed in time, even if it is still
+        valid in the database.
+        """
+        if self._lease is not None and self._clock() < self._lease_valid_until:
+            return self._lease
+        return None
+
+    @property
+    def stats(self) -> SchedulerLeaderElectionStats:
+        lease = self.lease
+        return SchedulerLeaderElectionStats(
+            leader=lease is not None,
+            token=lease.token if lease else None,
+            acquired=self._acquired,
+            lost=self._lost,
+        )
+
+    async def start(self) -> None:
+        if self._runner is None:
+            self._stop.clear()
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops renewing and releases the lease, so another worker can take over immediately.
+        """
+        if self._runner is not None:
+            self._stop.set()
+            await self._runner
+            self._runner = None
+
+        try:
+            await self.release()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Failed to release the lease %s", self._name)
+
+    async def try_acquire(self) -> SchedulerLease | None:
+        """
+        Renews the lease of this worker, or takes it over if it is free or expired.
+
+        Returns:
+            SchedulerLease | None: the lease if this worker is the leader
+        """
+        started_at = self._clock()
+        now = _to_db_time(get_now())
+        locked_until = now + timedelta(seconds=self._config.lease_seconds)
+
+        async with self._database_context().session() as session:
+            # No other worker took over if this worker is still the owner, even if the lease expired
+            renewed = await session.execute(
+                update(SchedulerLockEntity)
+                .where(
+                    SchedulerLockEntity.name == self._name,
+                    SchedulerLockEntity.owner == self._owner,
+                )
+                .values(locked_until=locked_until)
+            )
+            if renewed.rowcount != 1 and not await self._take_over(
+                session, now, locked_until
+            ):
+                await session.rollback()
+                self._set_lease(None, started_at)
+                return None
+
+            token = (
+                await session.execute(
+                    select(SchedulerLockEntity.token).where(
+                        SchedulerLockEntity.name == self._name
+                    )
+                )
+            ).scalar_one()
+
+            await session.commit()
+
+        self._set_lease(
+            SchedulerLease(name=self._name, owner=self._owner, token=token),
+            started_at,
+        )
+        return self._lease
+
+    async def acquire_within(self, timeout_seconds: float) -> SchedulerLease | None:
+        """
+        Returns the lease if this worker is the leader, otherwise keeps trying to take it over until the timeout. Used
+        when a job fires, so a leader which died shortly before is replaced once its lease expired, instead of every
+        worker skipping the job.
+
+        Args:
+            timeout_seconds (float): how long to keep trying, at the renewal interval
+
+        Returns:
+            SchedulerLease | None: the lease if this worker is (or became) the leader
+        """
+        deadline = self._clock() + timeout_seconds
+        while True:
+            lease = self.lease or await self.try_acquire()
+            if lease is not None or self._clock() >= deadline:
+                return lease
+            await asyncio.sleep(self._config.renew_interval_seconds)
+
+    async def release(self) -> None:
+        if self._lease is None:
+            return
+
+        async with self._database_context().session() as session:
+            await session.execute(
+                update(SchedulerLockEntity)
+                .where(
+                    SchedulerLockEntity.name == self._name,
+                    SchedulerLockEntity.owner == self._owner,
+                )
+                .values(locked_until=_to_db_time(get_now()))
+            )
+            await session.commit()
+
+        self._logger.info("Released the lease %s", self._name)
+        self._lease = None
+
+    async def _take_over(
+        self, session: AsyncSession, now: datetime, locked_until: datetime
+    ) -> bool:
+        taken_over = await session.execute(
+            update(SchedulerLockEntity)
+            .where(
+                SchedulerLockEntity.name == self._name,
+                SchedulerLockEntity.locked_until < now,
+            )
+            .values(
+                owner=self._owner,
+                token=SchedulerLockEntity.token + 1,
+                locked_until=locked_until,
+                acquired_at=now,
+            )
+        )
+        if taken_over.rowcount == 1:
+            return True
+
+        if await session.get(SchedulerLockEntity, self._name) is not None:
+            # Held by another worker
+            return False
+
+        session.add(
+            SchedulerLockEntity(
+                name=self._name,
+                owner=self._owner,
+                token=1,
+                locked_until=locked_until,
+                acquired_at=now,
+            )
+        )
+        try:
+            await session.flush()
+        except IntegrityError:
+            # Another worker created the lock at the same time
+            return False
+        return True
+
+    def _set_lease(self, lease: SchedulerLease | None, started_at: float) -> None:
+        if lease is not None and (
+            self._lease is None or self._lease.token != lease.token
+        ):
+            self._acquired += 1
+            self._logger.info(
+                "Acquired the lease %s (token %d) as %s",
+                self._name,
+                lease.token,
+                self._owner,
+            )
+        elif lease is None and self._lease is not None:
+            self._lost += 1
+            self._logger.warning("Lost the lease %s", self._name)
+
+        self._lease = lease
+        # Counted from before the renewal, so this worker gives up before the lease expires in the database
+        self._lease_valid_until = started_at + self._config.lease_seconds
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await self.try_acquire()
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception("Failed to renew the lease %s", self._name)
+                if self._lease is not None:
+                    self._lost += 1
+                    self._lease = None
+
+            try:
+                await asyncio.wait_for(
+                    self._stop.wait(), self._config.renew_interval_seconds
+                )
+            except TimeoutError:
+                pass
+
+
+SCHEDULER_LEADER_ELECTION = SchedulerLeaderElection(CONFIG.scheduler_lock)
@@ -0,0 +1,77 @@
+"""
+Standalone worker entry point: runs the background jobs (scheduler, email outbox worker) outside of the API process.
+
+Set `apiRunsBackgroundJobs` to false for the API processes when running this worker, so they only serve requests. The
+worker and the API can be scaled independently, the scheduler leader election makes sure scheduled jobs run once.
+"""
+
+import asyncio
+import locale
+import logging
+import logging.config
+import os
+import signal
+
+from ycc_hull.app_controllers import create_controllers
+from ycc_hull.background_jobs import (
+    BackgroundJobs,
+    start_common_services,
+    stop_common_services,
+)
+from ycc_hull.constants import LOGGING_CONFIG_FILE
+
+_logger = logging.getLogger(__name__)
+
+
+async def run_worker(stop: asyncio.Event) -> None:
+    """
+    Runs the background jobs until the stop event is set.
+
+    Args:
+        stop (asyncio.Event): set to shut down the worker
+    """
+    controllers = create_controllers()
+
+    # Poke the DB or fail early if the connection is wrong
+    _logger.info("Worker starting, testing DB connection...")
+    membership_types = await controllers.members_controller.find_all_membership_types()
+    _logger.info("DB connection successful, membership types: %s", membership_types)
+
+    await start_common_services()
+
+    background_jobs = BackgroundJobs(controllers)
+    await background_jobs.start()
+
+    _logger.info("Worker started")
+    await stop.wait()
+
+    _logger.info("Stop signal received")
+    await background_jobs.stop()
+    await stop_common_services()
+
+
+async def _run_until_signal() -> None:
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await run_worker(stop)
+
+
+def main() -> None:
+    """
+    Worker entry point.
+    """
+    if not os.path.exists("log"):
+        os.makedirs("log")
+
+    locale.setlocale(locale.LC_ALL, "en_GB.UTF-8")
+    logging.config.fileConfig(LOGGING_CONFIG_FILE, disable_existing_loggers=False)
+
+    asyncio.run(_run_until_signal())
+
+
+if __name__ == "__main__":
+    main()
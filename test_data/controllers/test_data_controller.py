@@ -7,7 +7,7 @@
 
 import aiofiles
 from sqlalchemy import delete
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from test_data.generator_config import (
     BOATS_JSON_FILE,
@@ -29,19 +29,24 @@
     AuditLogEntryEntity,
     BaseEntity,
     BoatEntity,
+    EmailOutboxEntity,
     EntranceFeeRecordEntity,
     FeeRecordEntity,
     HelpersAppPermissionEntity,
     HelperTaskCategoryEntity,
     HelperTaskEntity,
     HelperTaskHelperEntity,
+    HelperTaskReminderEntity,
+    HelperTaskReminderRunEntity,
     HolidayEntity,
     LicenceEntity,
     LicenceInfoEntity,
     MemberEntity,
     MembershipTypeEntity,
+    SchedulerLockEntity,
     UserEntity,
 )
+from ycc_hull.invalidation import INVALIDATION_BUS, InvalidationTopic
 from ycc_hull.utils import full_type_name, short_type_name
 
 
@@ -50,7 +55,7 @@ class _TestDataImporter:
     Test data importer. Able to import data from exported and generated files.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def import_exported(
@@ -74,7 +79,7 @@ async def _import(self, cls: type, entries: list, commit_on_each: bool) -> list:
             entry = self._prepare(entry)
             self._session.add(cls(**entry))
             if commit_on_each:
-                self._session.commit()
+                await self._session.commit()
         return entries
 
     def _prepare(self, entry: dict) -> dict:
@@ -101,7 +106,7 @@ class TestDataController(BaseController):
     async def populate(self, add_daily_helper_tasks: bool) -> list[str]:
         log: list[str] = []
 
-        with self.database_action(
+        async with self.database_action(
             action="Test Data / Populate", user=None, details=None
         ) as session:
             importer = _TestDataImporter(session=session)
@@ -111,17 +116,20 @@ async def populate(self, add_daily_helper_tasks: bool) -> list[str]:
             log.extend(await self._populate_boats(session, importer))
             log.extend(await self._populate_licences(session, importer))
 
-            session.commit()
+            await session.commit()
             log.append("Commit")
 
             log.extend(
                 await self._populate_helpers(add_daily_helper_tasks, session, importer)
             )
 
+        await INVALIDATION_BUS.publish(*InvalidationTopic)
+        log.append("Invalidate caches")
+
         return log
 
     async def _populate_holidays(
-        self, session: Session, importer: _TestDataImporter
+        self, session: AsyncSession, importer: _TestDataImporter
     ) -> list[str]:
         log: list[str] = []
 
@@ -134,7 +142,7 @@ async def _populate_holidays(
         return log
 
     async def _populate_members(
-        self, session: Session, importer: _TestDataImporter
+        self, session: AsyncSession, importer: _TestDataImporter
     ) -> list[str]:
         log: list[str] = []
 
@@ -171,7 +179,7 @@ async def _populate_members(
         return log
 
     async def _populate_boats(
-        self, session: Session, importer: _TestDataImporter
+        self, session: AsyncSession, importer: _TestDataImporter
     ) -> list[str]:
         log: list[str] = []
 
@@ -184,7 +192,7 @@ async def _populate_boats(
         return log
 
     async def _populate_licences(
-        self, session: Session, importer: _TestDataImporter
+        self, session: AsyncSession, importer: _TestDataImporter
     ) -> list[str]:
         log: list[str] = []
 
@@ -207,7 +215,7 @@ async def _populate_licences(
     async def _populate_helpers(
         self,
         add_daily_helper_tasks: bool,
-        session: Session,
+        session: AsyncSession,
         importer: _TestDataImporter,
     ) -> list[str]:
         log: list[str] = []
@@ -240,7 +248,7 @@ async def _populate_helpers(
             )
             log.append(f"Add {len(entries)} helper tasks")
 
-        session.commit()
+        await session.commit()
         log.append("Commit")
 
         if await self.database_context.query_count(
@@ -255,7 +263,7 @@ async def _populate_helpers(
             )
             log.append(f"Add {len(entries)} helper task helpers (COMMIT on each)")
 
-        session.commit()
+        await session.commit()
         log.append("Commit")
 
         if add_daily_helper_tasks:
@@ -265,7 +273,7 @@ async def _populate_helpers(
 
     async def _create_daily_helper_tasks(
         self,
-        session: Session,
+        session: AsyncSession,
     ) -> list[str]:
         log: list[str] = []
         tasks: list[HelperTaskEntity] = []
@@ -321,7 +329,7 @@ async def _create_daily_helper_tasks(
         session.add_all(tasks)
         log.append(f"Add {len(tasks)} daily helper tasks")
 
-        session.commit()
+        await session.commit()
         log.append("Commit")
 
         return log
@@ -332,6 +340,8 @@ async def clear(self) -> list[str]:
             # Helpers
             HelpersAppPermissionEntity,
             HelperTaskHelperEntity,
+            HelperTaskReminderEntity,
+            HelperTaskReminderRunEntity,
             HelperTaskEntity,
             HelperTaskCategoryEntity,
             # Licences,
@@ -347,6 +357,8 @@ async def clear(self) -> list[str]:
             BoatEntity,
             # General
             AuditLogEntryEntity,
+            EmailOutboxEntity,
+            SchedulerLockEntity,
             MembershipTypeEntity,
             HolidayEntity,
         )
@@ -361,16 +373,19 @@ async def clear(self) -> list[str]:
                 f"Some entity classes are not handled: {unhandled_class_names}"
             )
 
-        with self.database_action(
+        async with self.database_action(
             action="Test Data / Clear", user=None, details=None
         ) as session:
             for cls in classes:
                 log.append(f"Deleting {short_type_name(cls)} entities")
-                session.execute(delete(cls))
+                await session.execute(delete(cls))
 
-            session.commit()
+            await session.commit()
             log.append("Commit")
 
+        await INVALIDATION_BUS.publish(*InvalidationTopic)
+        log.append("Invalidate caches")
+
         return log
 
     async def repopulate(self, add_daily_helper_tasks: bool) -> list[str]:
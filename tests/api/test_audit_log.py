@@ -0,0 +1,229 @@
+"""
+Audit log API tests.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from tests.main_test import FakeAuth, app_test, init_test_database
+from ycc_hull.api.audit_log import api_audit_log
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import AuditLogEntryEntity
+
+app_test.include_router(api_audit_log)
+client = TestClient(app_test)
+
+START = datetime(2024, 5, 1, 10, 0, 0)
+ENTRY_COUNT = 25
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(delete(AuditLogEntryEntity))
+        for i in range(ENTRY_COUNT):
+            session.add(
+                AuditLogEntryEntity(
+                    id=i + 1,
+                    # Every second entry shares the time with the previous one
+                    created_at=START + timedelta(hours=i // 2 * 2),
+                    application="YCC Hull Test",
+                    principal="admin" if i % 3 == 0 else "editor",
+                    description=(
+                        f"Helpers/Tasks/Create/{i}"
+                        if i % 2 == 0
+                        else f"Helpers_Tasks/SignUp/{i}"
+                    ),
+                    data='{"key": "value"}',
+                )
+            )
+        await session.commit()
+
+
+def get_all_pages(**params: Any) -> list[list[dict]]:
+    pages: list[list[dict]] = []
+    cursor = None
+
+    while True:
+        response = client.get(
+            "/api/v1/audit-log/entries", params={**params, "cursor": cursor}
+        )
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page["entries"])
+        cursor = page["nextCursor"]
+        if cursor is None:
+            return pages
+
+
+def test_get_entries_first_page() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get("/api/v1/audit-log/entries", params={"limit": 3})
+
+    # Then
+    assert response.status_code == 200
+    page = response.json()
+    assert [entry["id"] for entry in page["entries"]] == [25, 24, 23]
+    assert page["entries"][0]["data"] is None
+    assert page["nextCursor"]
+
+
+@pytest.mark.parametrize("limit", [1, 2, 7, 25, 100])
+def test_get_entries_all_pages(limit: int) -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    pages = get_all_pages(limit=limit)
+
+    # Then
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+    # Newest first, ties broken by id, no duplicates or gaps between pages
+    assert [entry["id"] for page in pages for entry in page] == list(
+        range(ENTRY_COUNT, 0, -1)
+    )
+
+
+def test_get_entries_filtered() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    pages = get_all_pages(
+        limit=2,
+        principal="admin",
+        descriptionPrefix="Helpers/Tasks/",
+        createdFrom="2024-05-01",
+        createdTo="2024-05-01",
+    )
+
+    # Then
+    entries = [entry for page in pages for entry in page]
+    # Indices 0, 6, 12, 18 and 24 are from admin and creations, 18 and 24 are on the next day
+    assert [entry["id"] for entry in entries] == [13, 7, 1]
+
+
+def test_get_entries_description_prefix_is_not_a_pattern() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get(
+        "/api/v1/audit-log/entries",
+        params={"descriptionPrefix": "Helpers_Tasks/", "limit": 100},
+    )
+
+    # Then
+    entries = response.json()["entries"]
+    assert len(entries) == ENTRY_COUNT // 2
+    assert all(entry["description"].startswith("Helpers_Tasks/") for entry in entries)
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "WzEsMl0=", "WyIyMDI0IiwgIngiXQ=="])
+def test_get_entries_fails_if_cursor_invalid(cursor: str) -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get("/api/v1/audit-log/entries", params={"cursor": cursor})
+
+    # Then
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("limit", [0, 1001])
+def test_get_entries_fails_if_limit_invalid(limit: int) -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get("/api/v1/audit-log/entries", params={"limit": limit})
+
+    # Then
+    assert response.status_code == 422
+
+
+def test_get_entries_fails_if_not_admin() -> None:
+    # Given
+    FakeAuth.set_helpers_app_editor()
+
+    # When
+    response = client.get("/api/v1/audit-log/entries")
+
+    # Then
+    assert response.status_code == 403
+
+
+def test_export_entries_ndjson() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get(
+        "/api/v1/audit-log/entries/export", params={"principal": "admin"}
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert 'filename="audit-log.ndjson"' in response.headers["Content-Disposition"]
+    entries = [json.loads(line) for line in response.text.splitlines()]
+    assert [entry["id"] for entry in entries] == [25, 22, 19, 16, 13, 10, 7, 4, 1]
+    assert entries[0] == {
+        "id": 25,
+        "createdAt": "2024-05-02T10:00:00+02:00",
+        "application": "YCC Hull Test",
+        "principal": "admin",
+        "description": "Helpers/Tasks/Create/24",
+        "data": '{"key": "value"}',
+    }
+
+
+def test_export_entries_csv() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get(
+        "/api/v1/audit-log/entries/export",
+        params={"format": "CSV", "descriptionPrefix": "Helpers_Tasks/"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == ENTRY_COUNT // 2
+    assert rows[0] == {
+        "id": "24",
+        "createdAt": "2024-05-02T08:00:00+02:00",
+        "application": "YCC Hull Test",
+        "principal": "editor",
+        "description": "Helpers_Tasks/SignUp/23",
+        "data": '{"key": "value"}',
+    }
+
+
+def test_export_entries_fails_if_not_admin() -> None:
+    # Given
+    FakeAuth.set_helpers_app_editor()
+
+    # When
+    response = client.get("/api/v1/audit-log/entries/export")
+
+    # Then
+    assert response.status_code == 403
@@ -2,18 +2,26 @@
 Helpers API tests.
 """
 
+import csv
+import io
 import json
 from datetime import timedelta
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 from sqlalchemy import select
 
 from tests.main_test import FakeAuth, app_test, init_test_database
 from ycc_hull.api.helpers import api_helpers
+from ycc_hull.controllers.helpers_controller import HelpersController
 from ycc_hull.db.context import DatabaseContextHolder
-from ycc_hull.db.entities import AuditLogEntryEntity
+from ycc_hull.db.entities import (
+    AuditLogEntryEntity,
+    EmailOutboxEntity,
+    HelperTaskEntity,
+)
 from ycc_hull.models.helpers_dtos import HelperTaskDto
 from ycc_hull.utils import get_now
 
@@ -96,8 +104,8 @@ async def init_database() -> None:
 
 
 async def get_last_audit_log_entry() -> AuditLogEntryEntity:
-    with DatabaseContextHolder.context.session() as session:
-        entry = session.scalar(
+    async with DatabaseContextHolder.context.session() as session:
+        entry = await session.scalar(
             select(AuditLogEntryEntity).order_by(AuditLogEntryEntity.id.desc()).limit(1)
         )
         if not entry:
@@ -105,6 +113,16 @@ async def get_last_audit_log_entry() -> AuditLogEntryEntity:
         return entry
 
 
+async def get_last_outbox_email() -> EmailOutboxEntity:
+    async with DatabaseContextHolder.context.session() as session:
+        email = await session.scalar(
+            select(EmailOutboxEntity).order_by(EmailOutboxEntity.id.desc()).limit(1)
+        )
+        if not email:
+            raise AssertionError("No email found in the outbox")
+        return email
+
+
 async def verify_creation_audit_log_entry(short_description: str) -> None:
     audit = await get_last_audit_log_entry()
     assert audit.application.startswith("YCC Hull")
@@ -182,6 +200,72 @@ async def test_create_task_as_admin() -> None:
     await verify_creation_audit_log_entry(response_dto.short_description)
 
 
+def test_list_tasks_after_change() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    year = future_day[:4]
+    response = client.get(f"/api/v1/helpers/tasks?year={year}")
+    etag = response.headers["ETag"]
+    task_count = len(response.json())
+
+    # When
+    client.post("/api/v1/helpers/tasks", json=task_creation_shift)
+    response = client.get(f"/api/v1/helpers/tasks?year={year}")
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == task_count + 1
+
+    not_modified_response = client.get(
+        f"/api/v1/helpers/tasks?year={year}",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert not_modified_response.status_code == 304
+
+
+async def test_export_tasks() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    controller = HelpersController()
+    year = int(future_day[:4])
+    # Unlike in lists, the large fields are exported
+    tasks = [
+        await controller.get_task_by_id(task.id)
+        for task in await controller.find_all_tasks(year=year)
+    ]
+
+    # When
+    ndjson_response = client.get(f"/api/v1/helpers/tasks/export?year={year}")
+    csv_response = client.get(f"/api/v1/helpers/tasks/export?year={year}&format=CSV")
+
+    # Then
+    assert ndjson_response.status_code == 200
+    assert f'filename="helper-tasks-{year}.ndjson"' in (
+        ndjson_response.headers["Content-Disposition"]
+    )
+    exported = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert exported == [task.model_dump(mode="json", by_alias=True) for task in tasks]
+
+    assert csv_response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert [int(row["id"]) for row in rows] == [task.id for task in tasks]
+    assert [json.loads(row["contact"]) for row in rows] == [
+        task["contact"] for task in exported
+    ]
+
+
+def test_export_tasks_fails_if_not_admin() -> None:
+    # Given
+    FakeAuth.set_helpers_app_editor()
+
+    # When
+    response = client.get("/api/v1/helpers/tasks/export")
+
+    # Then
+    assert response.status_code == 403
+
+
 def test_create_task_fails_if_not_admin_nor_editor() -> None:
     # Given
     FakeAuth.set_member()
@@ -326,3 +410,182 @@ def test_update_task_cannot_unpublish_if_anyone_signed_up() -> None:
     assert response.status_code == 409 and response.json() == {
         "detail": "You must publish a task after anyone has signed up"
     }
+
+
+async def test_sign_up_enqueues_notification() -> None:
+    # Given
+    request = task_creation_deadline.copy()
+    request["title"] = "Outbox Test Task"
+    FakeAuth.set_helpers_app_admin()
+    task_id = client.post("/api/v1/helpers/tasks", json=request).json()["id"]
+    FakeAuth.set_member()
+
+    # When
+    response = client.post(f"/api/v1/helpers/tasks/{task_id}/sign-up-as-helper")
+
+    # Then
+    assert response.status_code == 200
+    email = await get_last_outbox_email()
+    assert email.status == "PENDING"
+    assert email.attempts == 0
+    assert "Outbox Test Task" in email.subject
+    assert "To: Test User <testuser@example.com>" in email.message
+
+
+async def count_outbox_emails() -> int:
+    async with DatabaseContextHolder.context.session() as session:
+        return len((await session.scalars(select(EmailOutboxEntity.id))).all())
+
+
+async def test_create_tasks_in_bulk() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    requests = [{**task_creation_deadline, "title": f"Bulk Task {i}"} for i in range(3)]
+
+    # When
+    response = client.post("/api/v1/helpers/tasks/bulk", json={"tasks": requests})
+
+    # Then
+    assert response.status_code == 200
+    tasks = [HelperTaskDto(**task) for task in response.json()]
+    assert [task.title for task in tasks] == [
+        "Bulk Task 0",
+        "Bulk Task 1",
+        "Bulk Task 2",
+    ]
+    assert all(task.long_description for task in tasks)
+
+    audit = await get_last_audit_log_entry()
+    assert audit.description == "Helpers/Tasks/BulkCreate"
+    assert audit.data is not None
+    audit_data = json.loads(audit.data)
+    assert [task["id"] for task in audit_data["new"]] == [task.id for task in tasks]
+
+
+def test_create_tasks_in_bulk_fails_if_editor_but_not_contact() -> None:
+    # Given
+    FakeAuth.set_helpers_app_editor()
+
+    # When
+    response = client.post(
+        "/api/v1/helpers/tasks/bulk",
+        json={"tasks": [task_creation_shift, task_creation_deadline]},
+    )
+
+    # Then
+    assert response.status_code == 403 and response.json() == {
+        "detail": "You have to be the contact for the tasks you create"
+    }
+
+
+def test_create_tasks_in_bulk_fails_if_any_task_is_invalid() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    invalid_request = {**task_creation_deadline, "helperMinCount": 3}
+
+    # When
+    response = client.post(
+        "/api/v1/helpers/tasks/bulk",
+        json={"tasks": [task_creation_deadline, invalid_request]},
+    )
+
+    # Then
+    assert response.status_code == 422
+
+
+async def count_tasks_with_title(title: str) -> int:
+    async with DatabaseContextHolder.context.session() as session:
+        return len(
+            (
+                await session.scalars(
+                    select(HelperTaskEntity.id).where(HelperTaskEntity.title == title)
+                )
+            ).all()
+        )
+
+
+async def test_create_tasks_in_bulk_creates_nothing_if_any_category_is_missing() -> (
+    None
+):
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    valid_request = {**task_creation_deadline, "title": "Bulk Missing Category"}
+    invalid_request = {**valid_request, "categoryId": 9999}
+
+    # When
+    response = client.post(
+        "/api/v1/helpers/tasks/bulk",
+        json={"tasks": [valid_request, invalid_request]},
+    )
+
+    # Then
+    assert response.status_code == 404 and response.json() == {
+        "detail": "Category not found"
+    }
+    assert await count_tasks_with_title("Bulk Missing Category") == 0
+
+
+async def test_create_tasks_in_bulk_rolls_back_after_flush(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    request = {**task_creation_deadline, "title": "Bulk Rolled Back"}
+    # Fails after the tasks are flushed, before the commit
+    mocker.patch.object(
+        HelperTaskDto, "create_many", side_effect=RuntimeError("Test failure")
+    )
+
+    # When
+    with pytest.raises(RuntimeError, match="Test failure"):
+        client.post("/api/v1/helpers/tasks/bulk", json={"tasks": [request, request]})
+
+    # Then
+    assert await count_tasks_with_title("Bulk Rolled Back") == 0
+
+
+async def test_add_helpers_enqueues_one_notification() -> None:
+    # Given
+    request = {**task_creation_deadline, "title": "Add Helpers Test Task"}
+    FakeAuth.set_helpers_app_admin()
+    task_id = client.post("/api/v1/helpers/tasks", json=request).json()["id"]
+    emails_before = await count_outbox_emails()
+
+    # When
+    response = client.post(
+        f"/api/v1/helpers/tasks/{task_id}/helpers", json={"memberIds": [3, 4]}
+    )
+
+    # Then
+    assert response.status_code == 200
+    task = HelperTaskDto(**response.json())
+    assert [helper.member.id for helper in task.helpers] == [3, 4]
+
+    assert await count_outbox_emails() == emails_before + 1
+    email = await get_last_outbox_email()
+    assert "Add Helpers Test Task" in email.subject
+
+    audit = await get_last_audit_log_entry()
+    assert audit.description == f"Helpers/Tasks/AddHelpers/{task_id}"
+    assert audit.data is not None
+    assert json.loads(audit.data) == {"member_ids": [3, 4]}
+
+
+def test_add_helpers_adds_nobody_if_over_capacity() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+    task_id = client.post("/api/v1/helpers/tasks", json=task_creation_deadline).json()[
+        "id"
+    ]
+
+    # When
+    response = client.post(
+        f"/api/v1/helpers/tasks/{task_id}/helpers", json={"memberIds": [3, 4, 5]}
+    )
+
+    # Then
+    assert response.status_code == 409 and response.json() == {
+        "detail": "Task helper limit reached"
+    }
+    task = client.get(f"/api/v1/helpers/tasks/{task_id}").json()
+    assert task["helpers"] == []
@@ -0,0 +1,55 @@
+"""
+Metrics API tests.
+"""
+
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from tests.main_test import FakeAuth, app_test, init_test_database
+from ycc_hull.api.metrics import api_metrics
+
+app_test.include_router(api_metrics)
+client = TestClient(app_test)
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+def test_get_metrics_as_admin() -> None:
+    # Given
+    FakeAuth.set_helpers_app_admin()
+
+    # When
+    response = client.get("/api/v1/metrics")
+
+    # Then
+    assert response.status_code == 200
+    metrics = response.json()
+    assert metrics.keys() == {
+        "auditLogSink",
+        "databasePool",
+        "emailOutbox",
+        "helperTaskListCache",
+        "referenceDataCache",
+        "schedulerLeaderElection",
+        "tokenCache",
+    }
+    assert metrics["databasePool"]["checkouts"] > 0
+    assert metrics["databasePool"]["maxSize"] == 15
+    assert metrics["tokenCache"]["maxSize"] == 1000
+    assert metrics["auditLogSink"]["maxQueueSize"] == 10000
+    assert metrics["emailOutbox"]["dead"] == 0
+    assert metrics["schedulerLeaderElection"]["lost"] == 0
+
+
+def test_get_metrics_fails_if_not_admin() -> None:
+    # Given
+    FakeAuth.set_helpers_app_editor()
+
+    # When
+    response = client.get("/api/v1/metrics")
+
+    # Then
+    assert response.status_code == 403
@@ -0,0 +1,129 @@
+"""
+Reference data API tests.
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from tests.main_test import FakeAuth, app_test, init_test_database
+from ycc_hull.api.boats import api_boats
+from ycc_hull.api.helpers import api_helpers
+from ycc_hull.api.holidays import api_holidays
+from ycc_hull.api.licences import api_licences
+from ycc_hull.api.members import api_members
+from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.controllers.reference_data_cache import (
+    REFERENCE_DATA_CACHE,
+    ReferenceData,
+)
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import HelperTaskCategoryEntity
+
+app_test.include_router(api_boats)
+app_test.include_router(api_helpers)
+app_test.include_router(api_holidays)
+app_test.include_router(api_licences)
+app_test.include_router(api_members)
+client = TestClient(app_test)
+
+REFERENCE_DATA_PATHS = [
+    "/api/v1/boats",
+    "/api/v1/helpers/task-categories",
+    "/api/v1/holidays",
+    "/api/v1/licence-infos",
+    "/api/v1/membership-types",
+]
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest.mark.parametrize("path", REFERENCE_DATA_PATHS)
+def test_get_reference_data_with_etag(path: str) -> None:
+    # Given
+    FakeAuth.set_member()
+
+    # When
+    response = client.get(path)
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.headers["ETag"].startswith('"')
+    assert response.json()
+
+
+@pytest.mark.parametrize("path", REFERENCE_DATA_PATHS)
+@pytest.mark.parametrize(
+    "if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"]
+)
+def test_get_reference_data_not_modified(path: str, if_none_match: str) -> None:
+    # Given
+    FakeAuth.set_member()
+    etag = client.get(path).headers["ETag"]
+
+    # When
+    response = client.get(
+        path, headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    # Then
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+def test_get_reference_data_modified() -> None:
+    # Given
+    FakeAuth.set_member()
+
+    # When
+    response = client.get("/api/v1/holidays", headers={"If-None-Match": '"outdated"'})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()
+
+
+async def test_get_reference_data_same_as_dtos() -> None:
+    # Given
+    FakeAuth.set_member()
+    categories = await HelpersController().find_all_task_categories()
+
+    # When
+    response = client.get("/api/v1/helpers/task-categories")
+
+    # Then
+    assert response.json() == [
+        category.model_dump(mode="json", by_alias=True) for category in categories
+    ]
+
+
+async def test_get_reference_data_after_invalidation() -> None:
+    # Given
+    FakeAuth.set_member()
+    response = client.get("/api/v1/helpers/task-categories")
+    etag = response.headers["ETag"]
+
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(
+            update(HelperTaskCategoryEntity)
+            .where(HelperTaskCategoryEntity.id == 1)
+            .values(title="Renamed Category")
+        )
+        await session.commit()
+
+    # When
+    cached_response = client.get("/api/v1/helpers/task-categories")
+    REFERENCE_DATA_CACHE.invalidate(ReferenceData.HELPER_TASK_CATEGORIES)
+    response = client.get("/api/v1/helpers/task-categories")
+
+    # Then
+    assert cached_response.headers["ETag"] == etag
+    assert response.headers["ETag"] != etag
+    assert "Renamed Category" in [category["title"] for category in response.json()]
@@ -0,0 +1,268 @@
+"""Tests for the auth dependency"""
+
+import asyncio
+import time
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from jwcrypto.jwk import JWK
+from jwcrypto.jwt import JWT
+from keycloak.exceptions import KeycloakPostError
+from pytest_mock import MockerFixture
+
+from ycc_hull import auth as auth_module
+from ycc_hull.auth import auth, token_cache_stats
+from ycc_hull.config import TokenValidation
+from ycc_hull.jwks import JwksTokenVerifier
+
+USER_INFO = {
+    "sub": "f:034bfedc-ed3d-4169-be68-9fd337eddff2:42",
+    "roles": ["ycc-member-active"],
+    "groups": ["ycc-members-all-past-and-present"],
+    "preferred_username": "MHUFF",
+    "given_name": "Michele",
+    "family_name": "Huff",
+    "email": "michele.huff@mailinator.com",
+}
+
+
+def token_info(*, active: bool = True, expires_in: float = 300) -> dict:
+    return {
+        "active": active,
+        "exp": int(time.time() + expires_in),
+        "sub": USER_INFO["sub"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache() -> Generator[None, None, None]:
+    # pylint: disable=protected-access
+    auth_module._TOKEN_CACHE.clear()
+    yield
+    auth_module._TOKEN_CACHE.clear()
+
+
+@pytest.fixture(name="keycloak")
+def fixture_keycloak(mocker: MockerFixture) -> MagicMock:
+    """
+    Keycloak client stub. User info requests go through a mock HTTP transport and are recorded in
+    `userinfo_requests`, the user info can be changed via `userinfo_handler`.
+    """
+    keycloak_mock = mocker.patch.object(auth_module, "_KEYCLOAK")
+    keycloak_mock.userinfo_requests = []
+    keycloak_mock.userinfo_handler = AsyncMock(return_value=USER_INFO)
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        keycloak_mock.userinfo_requests.append(request)
+        return httpx.Response(200, json=await keycloak_mock.userinfo_handler(request))
+
+    keycloak_mock.connection.async_s = httpx.AsyncClient(
+        transport=httpx.MockTransport(handle)
+    )
+    keycloak_mock.connection.headers = {"Content-Type": "application/json"}
+    keycloak_mock.connection.timeout = 10
+    keycloak_mock.a_introspect = AsyncMock(return_value=token_info())
+    keycloak_mock.a_certs = AsyncMock()
+    return keycloak_mock
+
+
+@pytest.mark.asyncio
+async def test_auth_validates_token_once(keycloak: MagicMock) -> None:
+    hits_before = token_cache_stats().hits
+
+    user1 = await auth("token-1")
+    user2 = await auth("token-1")
+
+    assert user1 == user2
+    assert user1.member_id == 42
+    assert len(keycloak.userinfo_requests) == 1
+    assert keycloak.a_introspect.call_count == 1
+    assert token_cache_stats().hits == hits_before + 1
+
+
+@pytest.mark.asyncio
+async def test_auth_caches_per_token(keycloak: MagicMock) -> None:
+    await auth("token-1")
+    await auth("token-2")
+
+    assert keycloak.a_introspect.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_does_not_cache_beyond_token_expiry(keycloak: MagicMock) -> None:
+    keycloak.a_introspect.return_value = token_info(expires_in=-1)
+
+    await auth("token-1")
+    await auth("token-1")
+
+    assert keycloak.a_introspect.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_does_not_cache_inactive_token(keycloak: MagicMock) -> None:
+    keycloak.a_introspect.return_value = token_info(active=False)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth("token-1")
+        assert exc_info.value.status_code == 401
+
+    assert keycloak.a_introspect.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_invalid_token(keycloak: MagicMock) -> None:
+    keycloak.connection.async_s = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(401, json={}))
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth("token-1")
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_auth_rejected_token(keycloak: MagicMock) -> None:
+    keycloak.connection.async_s = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(400, json={}))
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth("token-1")
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_auth_keycloak_unavailable(keycloak: MagicMock) -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    keycloak.connection.async_s = httpx.AsyncClient(
+        transport=httpx.MockTransport(refuse)
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth("token-1")
+
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_auth_keycloak_server_error(keycloak: MagicMock) -> None:
+    keycloak.a_introspect.side_effect = KeycloakPostError(
+        error_message="Internal Server Error", response_code=500
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth("token-1")
+
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_auth_cancels_introspection_if_user_info_fails(
+    keycloak: MagicMock,
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def introspect(_: str) -> dict:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return token_info()
+
+    keycloak.a_introspect.side_effect = introspect
+    keycloak.connection.async_s = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(401, json={}))
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await asyncio.wait_for(auth("token-1"), timeout=5)
+
+    assert exc_info.value.status_code == 401
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_auth_with_local_jwks_verification(
+    mocker: MockerFixture, keycloak: MagicMock
+) -> None:
+    key = JWK.generate(kty="RSA", size=2048, kid="key-1")
+    keycloak.a_certs.return_value = {"keys": [key.export_public(as_dict=True)]}
+    mocker.patch.object(auth_module, "_TOKEN_VALIDATION", TokenValidation.JWKS)
+    mocker.patch.object(
+        auth_module,
+        "_JWKS_VERIFIER",
+        # pylint: disable-next=protected-access
+        JwksTokenVerifier(auth_module._fetch_jwks, issuer=auth_module._ISSUER),
+    )
+
+    token = JWT(
+        header={"alg": "RS256", "kid": "key-1"},
+        claims={
+            # pylint: disable-next=protected-access
+            "iss": auth_module._ISSUER,
+            "typ": "Bearer",
+            "realm_access": {"roles": USER_INFO["roles"]},
+            **{key: value for key, value in USER_INFO.items() if key != "roles"},
+            **token_info(),
+        },
+    )
+    token.make_signed_token(key)
+
+    user = await auth(token.serialize())
+
+    assert user.member_id == 42
+    assert user.username == "MHUFF"
+    assert user.groups == ("ycc-members-all-past-and-present",)
+    assert user.active_member
+    assert not keycloak.userinfo_requests
+    keycloak.a_introspect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_auth_calls_keycloak_concurrently(keycloak: MagicMock) -> None:
+    introspected = asyncio.Event()
+
+    async def userinfo(_: httpx.Request) -> dict:
+        # Would never finish if the introspection was only started after the user info
+        await introspected.wait()
+        return USER_INFO
+
+    async def introspect(_: str) -> dict:
+        introspected.set()
+        return token_info()
+
+    keycloak.userinfo_handler.side_effect = userinfo
+    keycloak.a_introspect.side_effect = introspect
+
+    user = await asyncio.wait_for(auth("token-1"), timeout=5)
+
+    assert user.member_id == 42
+
+
+@pytest.mark.asyncio
+async def test_auth_concurrent_requests_use_their_own_token(
+    keycloak: MagicMock,
+) -> None:
+    async def userinfo(request: httpx.Request) -> dict:
+        member_id = request.headers["Authorization"].removeprefix("Bearer token-")
+        await asyncio.sleep(0.01)
+        return {
+            **USER_INFO,
+            "sub": f"f:034bfedc-ed3d-4169-be68-9fd337eddff2:{member_id}",
+        }
+
+    keycloak.userinfo_handler.side_effect = userinfo
+
+    users = await asyncio.gather(*(auth(f"token-{i}") for i in range(1, 6)))
+
+    assert [user.member_id for user in users] == [1, 2, 3, 4, 5]
+    assert keycloak.connection.headers == {"Content-Type": "application/json"}
@@ -0,0 +1,153 @@
+"""Tests for the cache module"""
+
+import asyncio
+
+import pytest
+
+from ycc_hull.cache import TtlCache
+
+
+class FakeClock:
+    """
+    Manually advanced clock.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_hit_and_miss() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60)
+
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entry_expires_after_ttl() -> None:
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.put("a", 1)
+
+    clock.now += 59
+    assert cache.get("a") == 1
+
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.stats.size == 0
+
+
+def test_max_age_shorter_than_ttl() -> None:
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.put("a", 1, max_age_seconds=10)
+
+    clock.now += 10
+    assert cache.get("a") is None
+
+
+def test_max_age_cannot_extend_ttl() -> None:
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.put("a", 1, max_age_seconds=3600)
+
+    clock.now += 60
+    assert cache.get("a") is None
+
+
+def test_already_expired_value_is_not_cached() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60)
+    cache.put("a", 1, max_age_seconds=-5)
+
+    assert cache.stats.size == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_and_clear() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.stats.size == 0
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_collapses_concurrent_loads() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60)
+    load_count = 0
+
+    async def loader() -> tuple[int, float | None]:
+        nonlocal load_count
+        load_count += 1
+        await asyncio.sleep(0.01)
+        return 42, None
+
+    results = await asyncio.gather(*(cache.get_or_load("a", loader) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert load_count == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.collapsed == 4
+
+    assert await cache.get_or_load("a", loader) == 42
+    assert load_count == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_failures() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=60)
+
+    async def failing_loader() -> tuple[int, float | None]:
+        await asyncio.sleep(0.01)
+        raise ValueError("Boom")
+
+    async def loader() -> tuple[int, float | None]:
+        return 42, None
+
+    results = await asyncio.gather(
+        cache.get_or_load("a", failing_loader),
+        cache.get_or_load("a", failing_loader),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await cache.get_or_load("a", loader) == 42
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_with_disabled_cache() -> None:
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl_seconds=0)
+    load_count = 0
+
+    async def loader() -> tuple[int, float | None]:
+        nonlocal load_count
+        load_count += 1
+        return load_count, None
+
+    assert await cache.get_or_load("a", loader) == 1
+    assert await cache.get_or_load("a", loader) == 2
+    assert cache.stats.size == 0
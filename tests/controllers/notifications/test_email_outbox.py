@@ -0,0 +1,361 @@
+"""
+Email outbox tests.
+"""
+
+import asyncio
+from email.message import EmailMessage
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+from sqlalchemy import delete, select
+
+from tests.main_test import init_test_database
+from ycc_hull.config import EmailOutboxConfig
+from ycc_hull.controllers.notifications.email_outbox import (
+    EMAIL_OUTBOX_WORKER,
+    EmailOutboxStatus,
+    EmailOutboxWorker,
+    enqueue_email,
+)
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import EmailOutboxEntity
+
+CONFIG = EmailOutboxConfig(
+    concurrency=2,
+    rate_per_second=1000,
+    burst=100,
+    batch_size=10,
+    max_attempts=3,
+    backoff_base_seconds=60,
+)
+
+
+class FakeSender:
+    """
+    Records the sent messages, fails on demand and tracks the concurrent sends.
+    """
+
+    def __init__(self, *, fail: bool = False, delay_seconds: float = 0) -> None:
+        self.messages: list[EmailMessage] = []
+        self.fail = fail
+        self.delay_seconds = delay_seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, message: EmailMessage) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+            if self.fail:
+                raise ConnectionError("SMTP server unavailable")
+            self.messages.append(message)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_outbox() -> None:
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(delete(EmailOutboxEntity))
+        await session.commit()
+
+
+@pytest.fixture(name="sender")
+def fixture_sender() -> FakeSender:
+    return FakeSender()
+
+
+@pytest.fixture(name="worker")
+def fixture_worker(sender: FakeSender) -> EmailOutboxWorker:
+    return EmailOutboxWorker(CONFIG, send=sender)
+
+
+def create_message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = "Sailor <sailor@example.com>"
+    message["Subject"] = subject
+    message.set_content("<p>Fair winds ⛵️</p>", subtype="html")
+    return message
+
+
+async def enqueue(*subjects: str) -> None:
+    async with DatabaseContextHolder.context.session() as session:
+        for subject in subjects:
+            enqueue_email(session, create_message(subject))
+        await session.commit()
+
+
+async def get_outbox() -> list[EmailOutboxEntity]:
+    async with DatabaseContextHolder.context.session() as session:
+        return list(
+            (
+                await session.scalars(
+                    select(EmailOutboxEntity).order_by(EmailOutboxEntity.id)
+                )
+            ).all()
+        )
+
+
+async def test_enqueued_only_if_committed() -> None:
+    # When
+    async with DatabaseContextHolder.context.session() as session:
+        enqueue_email(session, create_message("Rolled back"))
+        await session.rollback()
+    await enqueue("Committed")
+
+    # Then
+    assert [email.subject for email in await get_outbox()] == ["Committed"]
+
+
+async def test_sends_and_deletes_due_emails(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    await enqueue("First ⛵️", "Second")
+
+    # When
+    claimed = await worker.process_due()
+
+    # Then
+    assert claimed == 2
+    assert sorted(str(message["Subject"]) for message in sender.messages) == [
+        "First ⛵️",
+        "Second",
+    ]
+    assert sender.messages[0]["To"] == "Sailor <sailor@example.com>"
+    assert "Fair winds ⛵️" in sender.messages[0].get_content()
+    assert await get_outbox() == []
+    assert (await worker.stats()).sent == 2
+
+
+async def test_limits_concurrency(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.delay_seconds = 0.01
+    await enqueue(*(f"Message {i}" for i in range(6)))
+
+    # When
+    await worker.process_due()
+
+    # Then
+    assert len(sender.messages) == 6
+    assert sender.max_in_flight == CONFIG.concurrency
+
+
+async def test_retries_with_backoff(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.fail = True
+    await enqueue("Failing")
+
+    # When
+    await worker.process_due()
+
+    # Then
+    [email] = await get_outbox()
+    assert email.status == EmailOutboxStatus.PENDING
+    assert email.attempts == 1
+    assert email.last_error == "ConnectionError: SMTP server unavailable"
+    # Not due again before the backoff
+    assert await worker.process_due() == 0
+    assert (await worker.stats()).retried == 1
+
+
+async def test_dead_letters_after_max_attempts(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.fail = True
+    await enqueue("Failing")
+
+    # When
+    for _ in range(CONFIG.max_attempts):
+        async with DatabaseContextHolder.context.session() as session:
+            # Due now instead of after the backoff
+            [email] = (await session.scalars(select(EmailOutboxEntity))).all()
+            email.next_attempt_at = email.created_at
+            await session.commit()
+        await worker.process_due()
+
+    # Then
+    [email] = await get_outbox()
+    assert email.status == EmailOutboxStatus.DEAD
+    assert email.attempts == CONFIG.max_attempts
+    assert await worker.process_due() == 0
+    stats = await worker.stats()
+    assert stats.dead == 1
+    assert stats.pending == 0
+    assert stats.dead_lettered == 1
+
+
+async def test_claimed_emails_are_not_sent_by_other_workers(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.delay_seconds = 0.1
+    await enqueue("Claimed")
+    other_sender = FakeSender()
+    other_worker = EmailOutboxWorker(CONFIG, send=other_sender)
+
+    # When
+    processing = asyncio.create_task(worker.process_due())
+    await asyncio.sleep(0.05)
+    other_claimed = await other_worker.process_due()
+    await processing
+
+    # Then
+    assert other_claimed == 0
+    assert len(sender.messages) == 1
+    assert not other_sender.messages
+
+
+async def test_emails_are_claimed_right_before_sending(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.delay_seconds = 0.1
+    await enqueue(*(f"Message {i}" for i in range(4)))
+    other_sender = FakeSender(delay_seconds=0.1)
+    # The batch takes longer than the lease, each send does not
+    other_worker = EmailOutboxWorker(
+        CONFIG.model_copy(update={"concurrency": 1, "lease_seconds": 0.15}),
+        send=other_sender,
+    )
+
+    # When
+    processing = asyncio.create_task(other_worker.process_due())
+    # After the lease a whole batch would have had
+    await asyncio.sleep(0.25)
+    claimed = await worker.process_due()
+    other_claimed = await processing
+
+    # Then
+    subjects = [
+        str(message["Subject"]) for message in sender.messages + other_sender.messages
+    ]
+    assert sorted(subjects) == [f"Message {i}" for i in range(4)]
+    assert claimed + other_claimed == 4
+    assert await get_outbox() == []
+
+
+async def test_expired_claim_does_not_record_the_attempt(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.delay_seconds = 0.3
+    await enqueue("Slow")
+    stale_sender = FakeSender(fail=True, delay_seconds=0.1)
+    stale_worker = EmailOutboxWorker(
+        CONFIG.model_copy(update={"lease_seconds": 0.05}), send=stale_sender
+    )
+
+    # When
+    stale_processing = asyncio.create_task(stale_worker.process_due())
+    await asyncio.sleep(0.07)
+    processing = asyncio.create_task(worker.process_due())
+    await stale_processing
+    [email_after_stale_failure] = await get_outbox()
+    await processing
+
+    # Then
+    assert email_after_stale_failure.attempts == 0
+    assert email_after_stale_failure.last_error is None
+    assert (await stale_worker.stats()).retried == 0
+    assert len(sender.messages) == 1
+    assert await get_outbox() == []
+
+
+async def test_expired_claim_is_not_counted_as_sent(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    sender.delay_seconds = 0.05
+    await enqueue("Sent twice")
+    stale_sender = FakeSender(delay_seconds=0.2)
+    stale_worker = EmailOutboxWorker(
+        CONFIG.model_copy(update={"lease_seconds": 0.05}), send=stale_sender
+    )
+
+    # When
+    stale_processing = asyncio.create_task(stale_worker.process_due())
+    await asyncio.sleep(0.07)
+    await worker.process_due()
+    await stale_processing
+
+    # Then
+    stale_stats = await stale_worker.stats()
+    assert stale_stats.sent == 0
+    assert stale_stats.lost_claims == 1
+    stats = await worker.stats()
+    assert stats.sent == 1
+    assert stats.lost_claims == 0
+
+
+async def test_stop_does_not_wait_for_the_whole_batch() -> None:
+    # Given
+    sender = FakeSender()
+    worker = EmailOutboxWorker(
+        CONFIG.model_copy(update={"concurrency": 1, "rate_per_second": 1, "burst": 1}),
+        send=sender,
+    )
+    await enqueue(*(f"Message {i}" for i in range(5)))
+    await worker.start()
+    for _ in range(50):
+        if sender.messages:
+            break
+        await asyncio.sleep(0.01)
+
+    # When
+    await asyncio.wait_for(worker.stop(), timeout=2)
+
+    # Then
+    assert len(sender.messages) < 5
+    unsent = await get_outbox()
+    assert len(unsent) == 5 - len(sender.messages)
+    # Not claimed, so other workers can send them right away
+    assert all(email.claim_token is None for email in unsent)
+
+
+async def test_commit_wakes_the_worker(mocker: MockerFixture) -> None:
+    # Given
+    wake = mocker.patch.object(EMAIL_OUTBOX_WORKER, "wake")
+
+    # When, Then
+    async with DatabaseContextHolder.context.session() as session:
+        enqueue_email(session, create_message("Rolled back"))
+        await session.rollback()
+    wake.assert_not_called()
+
+    await enqueue("Committed")
+    wake.assert_called_once()
+
+
+async def test_started_worker_sends_when_woken(
+    worker: EmailOutboxWorker, sender: FakeSender
+) -> None:
+    # Given
+    await worker.start()
+
+    try:
+        # When
+        await enqueue("Woken up")
+        worker.wake()
+        for _ in range(50):
+            if sender.messages:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await worker.stop()
+
+    # Then
+    assert [str(message["Subject"]) for message in sender.messages] == ["Woken up"]
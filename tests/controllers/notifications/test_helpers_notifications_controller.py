@@ -0,0 +1,105 @@
+"""
+Helpers notifications controller tests.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+from sqlalchemy import delete, func, select
+
+from tests.main_test import init_test_database
+from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.controllers.notifications.format_utils import format_helper_task
+from ycc_hull.controllers.notifications.helpers_notifications_controller import (
+    HelpersNotificationsController,
+)
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import EmailOutboxEntity
+from ycc_hull.models.helpers_dtos import HelperTaskDto
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest_asyncio.fixture(name="tasks")
+async def fixture_tasks() -> Sequence[HelperTaskDto]:
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(delete(EmailOutboxEntity))
+        await session.commit()
+
+    return (await HelpersController().find_all_tasks())[:10]
+
+
+@pytest.fixture(name="controller")
+def fixture_controller() -> HelpersNotificationsController:
+    return HelpersNotificationsController()
+
+
+async def count_outbox() -> int:
+    async with DatabaseContextHolder.context.session() as session:
+        return (
+            await session.execute(
+                select(func.count()).select_from(  # pylint: disable=not-callable
+                    EmailOutboxEntity
+                )
+            )
+        ).scalar_one()
+
+
+async def test_send_reminders_enqueues_all(
+    controller: HelpersNotificationsController, tasks: Sequence[HelperTaskDto]
+) -> None:
+    # Given
+    upcoming_tasks = list(tasks[:6])
+    overdue_tasks = list(tasks[6:])
+    contact_count = len({task.contact.id for task in overdue_tasks})
+
+    # When
+    async with DatabaseContextHolder.context.session() as session:
+        stats = controller.send_reminders(
+            upcoming_tasks, overdue_tasks, session=session
+        )
+        await session.commit()
+
+    # Then
+    assert stats.enqueued == len(upcoming_tasks) + contact_count
+    assert stats.failed == 0
+    assert stats.reminded_task_ids == {task.id for task in tasks}
+    assert await count_outbox() == stats.enqueued
+
+
+async def test_send_reminders_continues_after_failure(
+    controller: HelpersNotificationsController,
+    tasks: Sequence[HelperTaskDto],
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    failing_task = tasks[1]
+
+    def format_or_fail(task: HelperTaskDto, **kwargs: Any) -> str:
+        if task is failing_task:
+            raise ValueError("Broken task")
+        return format_helper_task(task, **kwargs)
+
+    mocker.patch(
+        "ycc_hull.controllers.notifications.helpers_notifications_controller.format_helper_task",
+        side_effect=format_or_fail,
+    )
+
+    # When
+    async with DatabaseContextHolder.context.session() as session:
+        stats = controller.send_reminders(list(tasks[:4]), [], session=session)
+        await session.commit()
+
+    # Then
+    assert stats.enqueued == 3
+    assert stats.failed == 1
+    assert stats.reminded_task_ids == {task.id for task in tasks[:4]} - {
+        failing_task.id
+    }
+    assert await count_outbox() == 3
@@ -0,0 +1,208 @@
+"""
+SMTP connection pool tests, against a local SMTP server.
+"""
+
+import asyncio
+import socket
+from collections.abc import Generator
+from email.message import EmailMessage
+from typing import Any
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from ycc_hull.config import CONFIG, EmailConfig
+from ycc_hull.controllers.notifications.smtp import SmtpConnectionPool
+
+
+class RecordingHandler:
+    """aiosmtpd handler keeping the received messages."""
+
+    def __init__(self) -> None:
+        self.messages: list[bytes] = []
+
+    async def handle_DATA(  # pylint: disable=invalid-name
+        self, server: Any, session: Any, envelope: Any
+    ) -> str:
+        del server, session
+        self.messages.append(envelope.content)
+        return "250 Message accepted for delivery"
+
+
+class FakeClock:
+    """Monotonic clock moved by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(name="handler")
+def fixture_handler() -> RecordingHandler:
+    return RecordingHandler()
+
+
+class SmtpServer:
+    """Local SMTP server, which can be restarted on the same port."""
+
+    def __init__(self, handler: RecordingHandler) -> None:
+        self.hostname = "127.0.0.1"
+        self.port = find_free_port()
+        self._handler = handler
+        self._controller: Controller | None = None
+
+    def start(self) -> None:
+        # Controllers cannot be restarted
+        self._controller = Controller(
+            self._handler, hostname=self.hostname, port=self.port
+        )
+        self._controller.start()
+
+    def stop(self) -> None:
+        if self._controller:
+            self._controller.stop()
+            self._controller = None
+
+
+@pytest.fixture(name="server")
+def fixture_server(handler: RecordingHandler) -> Generator[SmtpServer, None, None]:
+    server = SmtpServer(handler)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(name="config")
+def fixture_config(server: SmtpServer) -> EmailConfig:
+    return EmailConfig(
+        from_email="noreply@example.com",
+        smtp_host=server.hostname,
+        smtp_port=server.port,
+        smtp_start_tls=False,
+        smtp_pool_size=2,
+        smtp_idle_timeout_seconds=60,
+        smtp_health_check_seconds=10,
+    )
+
+
+@pytest.fixture(name="clock")
+def fixture_clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(name="pool")
+def fixture_pool(config: EmailConfig, clock: FakeClock) -> SmtpConnectionPool:
+    return SmtpConnectionPool(config, clock=clock)
+
+
+def create_message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = "member@example.com"
+    message["Subject"] = subject
+    message.set_content("<p>Hello</p>", subtype="html")
+    return message
+
+
+async def test_reuses_connection(
+    pool: SmtpConnectionPool, handler: RecordingHandler
+) -> None:
+    # When
+    for i in range(3):
+        await pool.send_message(create_message(f"Message {i}"))
+    await pool.close()
+
+    # Then
+    assert len(handler.messages) == 3
+    assert f"Subject: Message 0 - {CONFIG.ycc_app.name}".encode() in handler.messages[0]
+    assert pool.connects == 1
+    assert pool.reuses == 2
+
+
+async def test_limits_concurrent_connections(
+    pool: SmtpConnectionPool, handler: RecordingHandler
+) -> None:
+    # When
+    await asyncio.gather(
+        *(pool.send_message(create_message(f"Message {i}")) for i in range(6))
+    )
+    await pool.close()
+
+    # Then
+    assert len(handler.messages) == 6
+    assert pool.connects == 2
+    assert pool.reuses == 4
+
+
+async def test_reconnects_if_server_restarted(
+    pool: SmtpConnectionPool, server: SmtpServer, handler: RecordingHandler
+) -> None:
+    # Given
+    await pool.send_message(create_message("Before restart"))
+    server.stop()
+    server.start()
+
+    # When
+    await pool.send_message(create_message("After restart"))
+    await pool.close()
+
+    # Then
+    assert len(handler.messages) == 2
+    assert pool.connects == 2
+
+
+async def test_reconnects_if_idle_timeout_passed(
+    pool: SmtpConnectionPool, clock: FakeClock, handler: RecordingHandler
+) -> None:
+    # Given
+    await pool.send_message(create_message("First"))
+
+    # When
+    clock.now += 60
+    await pool.send_message(create_message("Second"))
+    await pool.close()
+
+    # Then
+    assert len(handler.messages) == 2
+    assert pool.connects == 2
+    assert pool.reuses == 0
+
+
+async def test_reuses_connection_if_health_check_passes(
+    pool: SmtpConnectionPool, clock: FakeClock, handler: RecordingHandler
+) -> None:
+    # Given
+    await pool.send_message(create_message("First"))
+
+    # When
+    clock.now += 30
+    await pool.send_message(create_message("Second"))
+    await pool.close()
+
+    # Then
+    assert len(handler.messages) == 2
+    assert pool.connects == 1
+    assert pool.reuses == 1
+
+
+async def test_closes_idle_connections(config: EmailConfig) -> None:
+    # Given
+    pool = SmtpConnectionPool(
+        config.model_copy(update={"smtp_idle_timeout_seconds": 0.05})
+    )
+    await pool.send_message(create_message("Message"))
+    assert pool.idle_count == 1
+
+    # When
+    await asyncio.sleep(0.2)
+
+    # Then
+    assert pool.idle_count == 0
@@ -0,0 +1,112 @@
+"""
+Audit log entry creation tests.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from ycc_hull.config import AuditLogDataConfig, AuditLogDataFormat
+from ycc_hull.controllers.audit import create_audit_entry
+from ycc_hull.db.audit_data import decode_audit_data, encode_audit_data
+from ycc_hull.models.audit_log_dtos import AuditLogEntryDto
+from ycc_hull.models.helpers_dtos import HelperTaskCategoryDto
+from ycc_hull.models.user import User
+from ycc_hull.utils import deep_diff
+
+USER = User(
+    member_id=1,
+    username="testuser",
+    email="testuser@example.com",
+    first_name="Test",
+    last_name="User",
+    groups=(),
+    roles=(),
+)
+
+OLD = HelperTaskCategoryDto(
+    id=1,
+    title="Surveillance",
+    short_description="Surveillance of the club area",
+    long_description="<p>" + "Lorem ipsum dolor sit amet. " * 50 + "</p>",
+)
+NEW = OLD.model_copy(update={"title": "Surveillance & Safety"})
+UPDATE_DATA = {"diff": deep_diff(OLD, NEW), "old": OLD, "new": NEW}
+
+CATEGORY_TYPE = "ycc_hull.models.helpers_dtos.HelperTaskCategoryDto"
+
+
+def test_pretty_by_default() -> None:
+    entry = create_audit_entry(USER, "Test/Update", UPDATE_DATA)
+
+    assert entry.data
+    assert entry.data.startswith('{\n  "diff"')
+    assert json.loads(entry.data)["old"]["longDescription"] == OLD.long_description
+
+
+def test_compact_keeps_diff_and_identifiers() -> None:
+    config = AuditLogDataConfig(format=AuditLogDataFormat.COMPACT)
+
+    entry = create_audit_entry(USER, "Test/Update", UPDATE_DATA, config=config)
+
+    assert entry.data
+    assert "\n" not in entry.data
+    assert json.loads(entry.data) == {
+        "diff": {"title": {"old": "Surveillance", "new": "Surveillance & Safety"}},
+        "old": {"@type": CATEGORY_TYPE, "id": 1},
+        "new": {"@type": CATEGORY_TYPE, "id": 1},
+    }
+
+
+def test_compact_keeps_objects_without_diff() -> None:
+    config = AuditLogDataConfig(format=AuditLogDataFormat.COMPACT)
+
+    entry = create_audit_entry(USER, "Test/Create", {"new": NEW}, config=config)
+
+    assert entry.data
+    assert json.loads(entry.data)["new"]["title"] == NEW.title
+
+
+@pytest.mark.parametrize("data_format", list(AuditLogDataFormat))
+def test_compressed_if_over_threshold(data_format: AuditLogDataFormat) -> None:
+    config = AuditLogDataConfig(format=data_format, compression_threshold=100)
+
+    entry = create_audit_entry(USER, "Test/Update", UPDATE_DATA, config=config)
+    uncompressed = create_audit_entry(
+        USER, "Test/Update", UPDATE_DATA, config=AuditLogDataConfig(format=data_format)
+    )
+
+    assert entry.data
+    assert uncompressed.data
+    assert entry.data.startswith("zlib:")
+    assert len(entry.data) < len(uncompressed.data)
+    assert decode_audit_data(entry.data) == uncompressed.data
+
+
+def test_not_compressed_if_under_threshold() -> None:
+    assert encode_audit_data('{"a":1}', compression_threshold=100) == '{"a":1}'
+    assert encode_audit_data('{"a":1}', compression_threshold=None) == '{"a":1}'
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        AuditLogDataConfig(),
+        AuditLogDataConfig(format=AuditLogDataFormat.COMPACT),
+        AuditLogDataConfig(compression_threshold=100),
+        AuditLogDataConfig(format=AuditLogDataFormat.COMPACT, compression_threshold=0),
+    ],
+)
+def test_dto_decodes_all_formats(config: AuditLogDataConfig) -> None:
+    entry = create_audit_entry(USER, "Test/Update", UPDATE_DATA, config=config)
+    # As if it was read from the database
+    entry.id = 1
+    entry.created_at = datetime(2024, 5, 1, 10, 0, 0)
+
+    dto = AuditLogEntryDto.create_many([entry])[0]
+
+    assert dto.data
+    assert json.loads(dto.data)["diff"] == {
+        "title": {"old": "Surveillance", "new": "Surveillance & Safety"}
+    }
@@ -0,0 +1,110 @@
+"""
+Audit log sink tests.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from tests.main_test import init_test_database
+from ycc_hull.controllers.audit_log_sink import AuditLogSink
+from ycc_hull.db.context import DatabaseContext, DatabaseContextHolder
+from ycc_hull.db.entities import AuditLogEntryEntity
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest.fixture(name="sink")
+def fixture_sink() -> AuditLogSink:
+    return AuditLogSink(max_queue_size=100, batch_size=10, flush_interval_seconds=0.05)
+
+
+def create_entry(description: str) -> AuditLogEntryEntity:
+    return AuditLogEntryEntity(
+        application="YCC Hull Test",
+        principal="testuser",
+        description=description,
+        data=None,
+    )
+
+
+async def count_entries(description_prefix: str) -> int:
+    async with DatabaseContextHolder.context.session() as session:
+        return (
+            await session.execute(
+                select(func.count()).where(  # pylint: disable=not-callable
+                    AuditLogEntryEntity.description.startswith(description_prefix)
+                )
+            )
+        ).scalar_one()
+
+
+async def test_writes_immediately_if_not_started(sink: AuditLogSink) -> None:
+    await sink.write(create_entry("Sink/NotStarted"))
+
+    assert await count_entries("Sink/NotStarted") == 1
+    assert sink.stats.written == 1
+
+
+async def test_writes_in_batches(sink: AuditLogSink) -> None:
+    await sink.start()
+
+    for i in range(25):
+        await sink.write(create_entry(f"Sink/Batches/{i}"))
+
+    # Queued, not written yet
+    assert sink.stats.queue_size == 25
+
+    await sink.stop()
+
+    assert await count_entries("Sink/Batches/") == 25
+    assert sink.stats.queue_size == 0
+    assert sink.stats.written == 25
+
+
+async def test_flushes_after_interval(sink: AuditLogSink) -> None:
+    await sink.start()
+
+    await sink.write(create_entry("Sink/Interval"))
+    await asyncio.sleep(0.2)
+
+    assert await count_entries("Sink/Interval") == 1
+    await sink.stop()
+
+
+async def test_drops_entries_if_queue_full() -> None:
+    sink = AuditLogSink(max_queue_size=2, batch_size=10, flush_interval_seconds=0.05)
+    await sink.start()
+
+    for i in range(5):
+        await sink.write(create_entry(f"Sink/Full/{i}"))
+    await sink.stop()
+
+    assert sink.stats.dropped == 3
+    assert sink.stats.written == 2
+    assert await count_entries("Sink/Full/") == 2
+
+
+async def test_counts_failed_entries() -> None:
+    # The directory does not exist
+    unavailable = DatabaseContext("sqlite+aiosqlite:///missing/directory/ycc.db")
+    sink = AuditLogSink(
+        max_queue_size=100,
+        batch_size=10,
+        flush_interval_seconds=0.05,
+        database_context=lambda: unavailable,
+    )
+    await sink.start()
+
+    for i in range(3):
+        await sink.write(create_entry(f"Sink/Failed/{i}"))
+    await sink.stop()
+
+    assert sink.stats.failed == 3
+    assert sink.stats.written == 0
+    await unavailable.close()
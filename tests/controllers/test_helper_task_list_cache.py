@@ -0,0 +1,80 @@
+"""
+Helper task list cache tests.
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from ycc_hull.controllers.helper_task_list_cache import HelperTaskListCache
+from ycc_hull.models.helpers_dtos import HelperTaskDto
+
+
+class StubLoader:
+    """
+    Task loader which counts the loads and can be paused.
+    """
+
+    def __init__(self) -> None:
+        self.load_count = 0
+        self.resume = asyncio.Event()
+        self.resume.set()
+
+    async def __call__(self) -> Sequence[HelperTaskDto]:
+        self.load_count += 1
+        await self.resume.wait()
+        return []
+
+
+async def test_get_or_load_caches_per_filter() -> None:
+    cache = HelperTaskListCache(ttl_seconds=60)
+    loader = StubLoader()
+
+    first = await cache.get_or_load(year=2024, published=True, loader=loader)
+    second = await cache.get_or_load(year=2024, published=True, loader=loader)
+    await cache.get_or_load(year=2024, published=None, loader=loader)
+    await cache.get_or_load(year=2025, published=True, loader=loader)
+
+    assert first is second
+    assert first.body == b"[]"
+    assert loader.load_count == 3
+
+
+async def test_invalidate_reloads() -> None:
+    cache = HelperTaskListCache(ttl_seconds=60)
+    loader = StubLoader()
+
+    await cache.get_or_load(year=2024, published=True, loader=loader)
+    cache.invalidate()
+    await cache.get_or_load(year=2024, published=True, loader=loader)
+
+    assert cache.version == 1
+    assert loader.load_count == 2
+
+
+async def test_load_outdated_by_invalidation_is_not_reused() -> None:
+    cache = HelperTaskListCache(ttl_seconds=60)
+    loader = StubLoader()
+    loader.resume.clear()
+
+    # Load started before a change, finished after it
+    load = asyncio.create_task(
+        cache.get_or_load(year=2024, published=True, loader=loader)
+    )
+    await asyncio.sleep(0)
+    cache.invalidate()
+    loader.resume.set()
+    await load
+
+    await cache.get_or_load(year=2024, published=True, loader=loader)
+
+    assert loader.load_count == 2
+
+
+async def test_disabled_cache_always_loads() -> None:
+    cache = HelperTaskListCache(ttl_seconds=0)
+    loader = StubLoader()
+
+    for _ in range(3):
+        await cache.get_or_load(year=2024, published=True, loader=loader)
+
+    assert loader.load_count == 3
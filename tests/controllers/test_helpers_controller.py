@@ -0,0 +1,344 @@
+"""
+Helpers controller tests.
+"""
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event, select
+
+from tests.main_test import init_test_database
+from ycc_hull.controllers.exceptions import ControllerNotFoundException
+from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.controllers.helpers_reminders import HelperTaskReminderKind
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import (
+    HelperTaskEntity,
+    HelperTaskHelperEntity,
+    HelperTaskReminderEntity,
+    HelperTaskReminderRunEntity,
+)
+from ycc_hull.invalidation import INVALIDATION_BUS, InvalidationTopic
+from ycc_hull.models.user import User
+from ycc_hull.utils import get_now
+
+YEAR = 2040
+
+USER = User(
+    member_id=2,
+    username="CAPTAIN",
+    email="captain@example.com",
+    first_name="Captain",
+    last_name="Haddock",
+    groups=(),
+    roles=(),
+)
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest.fixture(name="statements")
+def fixture_statements() -> Generator[list[str], None, None]:
+    """
+    Records the SQL statements executed while the test runs.
+    """
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    engine = DatabaseContextHolder.context._engine  # pylint: disable=protected-access
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def add_tasks(count: int) -> None:
+    """
+    Adds done and validated shifts with a captain and two helpers, so every relationship of the DTO is populated.
+    """
+    starts_at = datetime(YEAR, 5, 1, 18, 0)
+
+    async with DatabaseContextHolder.context.session() as session:
+        for _ in range(count):
+            task = HelperTaskEntity(
+                category_id=1,
+                title="Surveillance",
+                short_description="Surveillance shift",
+                contact_id=1,
+                starts_at=starts_at,
+                ends_at=starts_at + timedelta(hours=2),
+                urgent=False,
+                captain_required_licence_info_id=9,
+                helper_min_count=1,
+                helper_max_count=2,
+                published=True,
+                captain_id=2,
+                captain_signed_up_at=starts_at - timedelta(days=7),
+                marked_as_done_at=starts_at + timedelta(hours=3),
+                marked_as_done_by_id=2,
+                validated_at=starts_at + timedelta(days=1),
+                validated_by_id=1,
+            )
+            task.helpers = [
+                HelperTaskHelperEntity(
+                    member_id=member_id, signed_up_at=starts_at - timedelta(days=7)
+                )
+                for member_id in (3, 4)
+            ]
+            session.add(task)
+        await session.commit()
+
+
+async def test_find_all_tasks_query_count_does_not_grow_with_tasks(
+    statements: list[str],
+) -> None:
+    controller = HelpersController()
+
+    await add_tasks(3)
+    statements.clear()
+    tasks = await controller.find_all_tasks(year=YEAR)
+    few_tasks_queries = len(statements)
+
+    assert len(tasks) == 3
+
+    await add_tasks(60)
+    statements.clear()
+    tasks = await controller.find_all_tasks(year=YEAR)
+    many_tasks_queries = len(statements)
+
+    assert len(tasks) == 63
+    assert all(len(task.helpers) == 2 for task in tasks)
+    assert all(task.captain and task.validated_by for task in tasks)
+    assert few_tasks_queries == many_tasks_queries == 2
+
+
+async def add_task(
+    *,
+    starts_at: datetime | None = None,
+    ends_at: datetime | None = None,
+    deadline: datetime | None = None,
+) -> int:
+    async with DatabaseContextHolder.context.session() as session:
+        task = HelperTaskEntity(
+            category_id=1,
+            title="Reminder",
+            short_description="Task to remind about",
+            contact_id=1,
+            starts_at=starts_at,
+            ends_at=ends_at,
+            deadline=deadline,
+            urgent=False,
+            helper_min_count=1,
+            helper_max_count=2,
+            published=True,
+        )
+        session.add(task)
+        await session.flush()
+        task_id = task.id
+        await session.commit()
+        return task_id
+
+
+async def get_reminders(
+    task_ids: list[int],
+) -> set[tuple[int, HelperTaskReminderKind]]:
+    async with DatabaseContextHolder.context.session() as session:
+        return {
+            (reminder.task_id, HelperTaskReminderKind(reminder.kind))
+            for reminder in await session.scalars(
+                select(HelperTaskReminderEntity).where(
+                    HelperTaskReminderEntity.task_id.in_(task_ids)
+                )
+            )
+        }
+
+
+async def test_send_daily_reminders_is_idempotent() -> None:
+    # Given
+    controller = HelpersController()
+    now = get_now().replace(tzinfo=None)
+    today = now.replace(hour=12, minute=0, second=0, microsecond=0)
+
+    in_3_days = await add_task(
+        starts_at=today + timedelta(days=3),
+        ends_at=today + timedelta(days=3, hours=2),
+    )
+    in_2_weeks = await add_task(deadline=today + timedelta(days=14))
+    tomorrow = await add_task(deadline=today + timedelta(days=1))
+    overdue_deadline = await add_task(deadline=now - timedelta(days=1))
+    overdue_shift = await add_task(
+        starts_at=now - timedelta(days=10), ends_at=now - timedelta(days=9)
+    )
+    shift_in_grace_period = await add_task(
+        starts_at=now - timedelta(days=3), ends_at=now - timedelta(days=2)
+    )
+    task_ids = [
+        in_3_days,
+        in_2_weeks,
+        tomorrow,
+        overdue_deadline,
+        overdue_shift,
+        shift_in_grace_period,
+    ]
+
+    # When
+    first_run = await controller.send_daily_reminders()
+    second_run = await controller.send_daily_reminders()
+
+    # Then
+    assert first_run and second_run
+    assert first_run.reminded_task_ids.issuperset(
+        {in_3_days, in_2_weeks, overdue_deadline, overdue_shift}
+    )
+    assert tomorrow not in first_run.reminded_task_ids
+    assert shift_in_grace_period not in first_run.reminded_task_ids
+    assert await get_reminders(task_ids) == {
+        (in_3_days, HelperTaskReminderKind.UPCOMING_3_DAYS),
+        (in_2_weeks, HelperTaskReminderKind.UPCOMING_2_WEEKS),
+        (overdue_deadline, HelperTaskReminderKind.OVERDUE),
+        (overdue_shift, HelperTaskReminderKind.OVERDUE),
+    }
+    assert second_run.enqueued == 0
+    assert not second_run.reminded_task_ids
+
+
+async def set_last_reminder_run(run_date: datetime) -> None:
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(delete(HelperTaskReminderRunEntity))
+        session.add(HelperTaskReminderRunEntity(run_date=run_date))
+        await session.commit()
+
+
+async def test_send_daily_reminders_does_not_catch_up_if_no_run_was_missed() -> None:
+    # Given
+    today = get_now().replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    await set_last_reminder_run(today - timedelta(days=1))
+    # E.g., created today, inside the 2-week window
+    in_13_days = await add_task(deadline=today + timedelta(days=13, hours=12))
+
+    # When
+    stats = await HelpersController().send_daily_reminders()
+
+    # Then
+    assert stats
+    assert in_13_days not in stats.reminded_task_ids
+    assert not await get_reminders([in_13_days])
+
+
+async def test_send_daily_reminders_catches_up_missed_run() -> None:
+    # Given
+    today = get_now().replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    await set_last_reminder_run(today - timedelta(days=2))
+    # Due for the 2-week reminder yesterday, when the run was missed
+    in_13_days = await add_task(deadline=today + timedelta(days=13, hours=12))
+
+    # When
+    stats = await HelpersController().send_daily_reminders()
+
+    # Then
+    assert stats
+    assert in_13_days in stats.reminded_task_ids
+    assert await get_reminders([in_13_days]) == {
+        (in_13_days, HelperTaskReminderKind.UPCOMING_2_WEEKS)
+    }
+
+
+async def test_send_daily_reminders_reminds_rescheduled_task_again() -> None:
+    # Given
+    controller = HelpersController()
+    today = get_now().replace(tzinfo=None, hour=12, minute=0, second=0, microsecond=0)
+    task_id = await add_task(deadline=today + timedelta(days=3))
+    await controller.send_daily_reminders()
+
+    async with DatabaseContextHolder.context.session() as session:
+        task = await session.get_one(HelperTaskEntity, task_id)
+        task.deadline = today + timedelta(days=14)
+        await session.commit()
+
+    # When
+    stats = await controller.send_daily_reminders()
+
+    # Then
+    assert stats and task_id in stats.reminded_task_ids
+    assert await get_reminders([task_id]) == {
+        (task_id, HelperTaskReminderKind.UPCOMING_3_DAYS),
+        (task_id, HelperTaskReminderKind.UPCOMING_2_WEEKS),
+    }
+
+
+async def test_task_year_is_kept_in_sync() -> None:
+    # Given
+    task_id = await add_task(deadline=datetime(YEAR + 1, 12, 31, 23, 0))
+
+    # When
+    async with DatabaseContextHolder.context.session() as session:
+        task = await session.get_one(HelperTaskEntity, task_id)
+        created_year = task.task_year
+        task.deadline = datetime(YEAR + 2, 1, 1, 9, 0)
+        await session.commit()
+        await session.refresh(task)
+        updated_year = task.task_year
+
+    # Then
+    assert created_year == YEAR + 1
+    assert updated_year == YEAR + 2
+    assert [
+        task.id for task in await HelpersController().find_all_tasks(year=YEAR + 2)
+    ] == [task_id]
+
+
+@pytest.fixture(name="invalidations")
+def fixture_invalidations() -> list[InvalidationTopic]:
+    """
+    Records the helper task invalidations published while the test runs.
+    """
+    invalidations: list[InvalidationTopic] = []
+    INVALIDATION_BUS.subscribe(
+        InvalidationTopic.HELPER_TASKS,
+        lambda: invalidations.append(InvalidationTopic.HELPER_TASKS),
+    )
+    return invalidations
+
+
+async def test_committed_task_change_invalidates_task_lists(
+    invalidations: list[InvalidationTopic],
+) -> None:
+    # Given
+    task_id = await add_task(deadline=datetime(YEAR, 6, 1, 12, 0))
+
+    # When
+    await HelpersController().add_helper(task_id, 5, USER)
+
+    # Then
+    assert invalidations == [InvalidationTopic.HELPER_TASKS]
+
+
+async def test_failed_task_change_does_not_invalidate_task_lists(
+    invalidations: list[InvalidationTopic],
+) -> None:
+    # When
+    with pytest.raises(ControllerNotFoundException):
+        await HelpersController().add_helper(-1, 1, USER)
+
+    # Then
+    assert not invalidations
+
+
+async def test_daily_reminders_do_not_invalidate_task_lists(
+    invalidations: list[InvalidationTopic],
+) -> None:
+    # Given
+    await add_task(deadline=get_now().replace(tzinfo=None) - timedelta(days=1))
+
+    # When
+    stats = await HelpersController().send_daily_reminders()
+
+    # Then
+    assert stats and stats.reminded_task_ids
+    assert not invalidations
@@ -0,0 +1,111 @@
+"""
+Index usage tests: the query plans of the hot helper task queries, see db_migrations/005_helper_tasks_indexes.sql and
+006_helper_tasks_task_year.sql.
+"""
+
+from collections.abc import Generator, Sequence
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+
+from tests.main_test import init_test_database
+from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import HelperTaskEntity, HelperTaskHelperEntity
+
+Statement = tuple[str, Sequence[Any]]
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest.fixture(name="statements")
+def fixture_statements() -> Generator[list[Statement], None, None]:
+    """
+    Records the SQL statements and their parameters executed while the test runs.
+    """
+    statements: list[Statement] = []
+
+    def record(*args: Any) -> None:
+        statements.append((args[2], args[3]))
+
+    engine = DatabaseContextHolder.context._engine  # pylint: disable=protected-access
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def explain(statement: Statement) -> str:
+    sql, parameters = statement
+    engine = DatabaseContextHolder.context._engine  # pylint: disable=protected-access
+    async with engine.connect() as connection:
+        rows = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {sql}", tuple(parameters)
+        )
+        return "\n".join(row[-1] for row in rows)
+
+
+def find_task_queries(statements: list[Statement]) -> list[Statement]:
+    return [
+        statement
+        for statement in statements
+        if "FROM helper_tasks" in statement[0]
+        and statement[0].lstrip().startswith("SELECT")
+    ]
+
+
+async def test_task_list_uses_year_index(statements: list[Statement]) -> None:
+    # When
+    await HelpersController().find_all_tasks(year=2024)
+
+    # Then
+    [query] = find_task_queries(statements)
+    plan = await explain(query)
+    assert "USING INDEX helper_tasks_year_idx" in plan
+    assert "SCAN helper_tasks" not in plan
+
+
+async def test_daily_reminders_use_timing_indexes(
+    statements: list[Statement],
+) -> None:
+    # When
+    await HelpersController().send_daily_reminders()
+
+    # Then
+    queries = [
+        query
+        for query in find_task_queries(statements)
+        if "helper_task_reminders" in query[0]
+    ]
+    # 3 upcoming reminder kinds and the overdue reminders
+    assert len(queries) == 4
+    for query in queries:
+        plan = await explain(query)
+        assert "USING INDEX helper_tasks_starts_at_idx" in plan
+        assert "sqlite_autoindex_helper_task_reminders_1" in plan
+        assert "SCAN helper_tasks" not in plan
+
+
+async def test_helper_sign_up_check_uses_primary_key() -> None:
+    # Given
+    query = select(HelperTaskEntity.id).where(
+        HelperTaskEntity.helpers.any(HelperTaskHelperEntity.member_id == 5)
+    )
+    compiled = query.compile(
+        DatabaseContextHolder.context._engine.sync_engine  # pylint: disable=protected-access
+    )
+
+    # When
+    plan = await explain(
+        (
+            str(compiled),
+            tuple(compiled.params[name] for name in compiled.positiontup or []),
+        )
+    )
+
+    # Then
+    assert "COVERING INDEX sqlite_autoindex_helper_task_helpers_1" in plan
@@ -0,0 +1,89 @@
+"""
+Database connection pool tests.
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from ycc_hull.config import DatabasePoolConfig
+from ycc_hull.db.context import DatabaseContext
+
+
+def create_database_context(name: str, **pool_config: object) -> DatabaseContext:
+    os.makedirs("tmp", exist_ok=True)
+    return DatabaseContext(
+        f"sqlite:///tmp/test-{__name__}-{name}.db",
+        pool_config=DatabasePoolConfig.model_validate(pool_config),
+    )
+
+
+async def test_pool_config_is_applied() -> None:
+    context = create_database_context(
+        "config", size=3, max_overflow=2, timeout_seconds=7, recycle_seconds=60
+    )
+    pool = context._engine.pool  # pylint: disable=protected-access
+
+    assert pool.size() == 3  # type: ignore[attr-defined]
+    assert pool.timeout() == 7  # type: ignore[attr-defined]
+    assert context.pool_stats.max_size == 5
+
+    await context.close()
+
+
+async def test_pool_stats_record_checkouts_and_overflow() -> None:
+    context = create_database_context("overflow", size=1, max_overflow=1)
+    release = asyncio.Event()
+
+    async def hold_connection() -> None:
+        async with context.session() as session:
+            await session.execute(text("SELECT 1"))
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold_connection()) for _ in range(2)]
+    while context.pool_stats.checked_out < 2:
+        await asyncio.sleep(0.01)
+
+    stats = context.pool_stats
+    assert stats.size == 2
+    assert stats.checkouts == 2
+    assert stats.overflow_events == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert context.pool_stats.checked_out == 0
+    await context.close()
+
+
+async def test_pool_stats_record_failed_checkouts() -> None:
+    context = create_database_context(
+        "timeout", size=1, max_overflow=0, timeout_seconds=0.1
+    )
+
+    async with context.session() as session:
+        await session.execute(text("SELECT 1"))
+
+        with pytest.raises(PoolTimeoutError):
+            async with context.session() as other_session:
+                await other_session.execute(text("SELECT 1"))
+
+    stats = context.pool_stats
+    assert stats.checkouts == 1
+    assert stats.failed_checkouts == 1
+    assert stats.wait_seconds_max >= 0.1
+    await context.close()
+
+
+async def test_pool_stats_survive_dispose() -> None:
+    context = create_database_context("dispose")
+
+    async with context.session() as session:
+        await session.execute(text("SELECT 1"))
+    await context._engine.dispose()  # pylint: disable=protected-access
+
+    assert context.pool_stats.checkouts == 1
+    await context.close()
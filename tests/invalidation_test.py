@@ -0,0 +1,218 @@
+"""Tests for the invalidation module"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from ycc_hull.invalidation import (
+    INVALIDATION_BUS,
+    InProcessInvalidationBus,
+    InvalidationTopic,
+    RedisInvalidationBus,
+)
+
+
+class FakeRedisServer:
+    """
+    In-memory stand-in for the publish/subscribe of a Redis server, shared by several clients (processes).
+    """
+
+    def __init__(self) -> None:
+        self.subscriptions: list[tuple[str, asyncio.Queue[dict[str, Any] | None]]] = []
+        self.available = True
+        self.hanging = False
+
+    def client(self) -> "FakeRedisClient":
+        return FakeRedisClient(self)
+
+    def disconnect_all(self) -> None:
+        for _, queue in self.subscriptions:
+            queue.put_nowait(None)
+        self.subscriptions.clear()
+
+
+class FakeRedisPubSub:
+    """
+    Stand-in for `redis.asyncio.client.PubSub`.
+    """
+
+    def __init__(self, server: FakeRedisServer) -> None:
+        self._server = server
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        if not self._server.available:
+            raise ConnectionError("Server unavailable")
+        for channel in channels:
+            self._server.subscriptions.append((channel, self._queue))
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while (message := await self._queue.get()) is not None:
+            yield message
+        raise ConnectionError("Connection closed")
+
+    async def aclose(self) -> None:
+        self._server.subscriptions = [
+            subscription
+            for subscription in self._server.subscriptions
+            if subscription[1] is not self._queue
+        ]
+
+
+class FakeRedisClient:
+    """
+    Stand-in for `redis.asyncio.Redis`.
+    """
+
+    def __init__(self, server: FakeRedisServer) -> None:
+        self._server = server
+
+    async def publish(self, channel: str, message: str) -> int:
+        if self._server.hanging:
+            # Never answers
+            await asyncio.Event().wait()
+        if not self._server.available:
+            raise ConnectionError("Server unavailable")
+        receivers = [
+            queue for name, queue in self._server.subscriptions if name == channel
+        ]
+        for queue in receivers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+    def pubsub(self) -> FakeRedisPubSub:
+        return FakeRedisPubSub(self._server)
+
+
+class Counter:
+    """
+    Subscriber which counts the events.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self) -> None:
+        self.count += 1
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> FakeRedisServer:
+    return FakeRedisServer()
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def start_bus(server: FakeRedisServer) -> RedisInvalidationBus:
+    bus = RedisInvalidationBus(server.client(), reconnect_delay_seconds=0)
+    await bus.start()
+    await bus.wait_until_subscribed()
+    return bus
+
+
+def test_default_bus_is_in_process() -> None:
+    assert isinstance(INVALIDATION_BUS, InProcessInvalidationBus)
+
+
+async def test_in_process_bus_delivers_to_topic_subscribers() -> None:
+    bus = InProcessInvalidationBus()
+    helper_tasks = Counter()
+    reference_data = Counter()
+    bus.subscribe(InvalidationTopic.HELPER_TASKS, helper_tasks)
+    bus.subscribe(InvalidationTopic.REFERENCE_DATA, reference_data)
+
+    await bus.publish(InvalidationTopic.HELPER_TASKS)
+
+    assert helper_tasks.count == 1
+    assert reference_data.count == 0
+
+
+async def test_redis_bus_delivers_to_all_processes(server: FakeRedisServer) -> None:
+    buses = [await start_bus(server) for _ in range(3)]
+    counters = [Counter() for _ in buses]
+    for bus, counter in zip(buses, counters):
+        bus.subscribe(InvalidationTopic.HELPER_TASKS, counter)
+
+    await buses[0].publish(InvalidationTopic.HELPER_TASKS)
+    await settle()
+
+    # Exactly once everywhere, including the publisher, which does not receive its own message again
+    assert [counter.count for counter in counters] == [1, 1, 1]
+
+    for bus in buses:
+        await bus.stop()
+    assert not server.subscriptions
+
+
+async def test_redis_bus_delivers_locally_if_server_unavailable(
+    server: FakeRedisServer,
+) -> None:
+    bus = await start_bus(server)
+    counter = Counter()
+    bus.subscribe(InvalidationTopic.REFERENCE_DATA, counter)
+    server.available = False
+
+    await bus.publish(InvalidationTopic.REFERENCE_DATA)
+
+    assert counter.count == 1
+    await bus.stop()
+
+
+async def test_redis_bus_publish_times_out_if_server_hangs(
+    server: FakeRedisServer,
+) -> None:
+    bus = RedisInvalidationBus(
+        server.client(), reconnect_delay_seconds=0, publish_timeout_seconds=0.05
+    )
+    await bus.start()
+    await bus.wait_until_subscribed()
+    counter = Counter()
+    bus.subscribe(InvalidationTopic.HELPER_TASKS, counter)
+    server.hanging = True
+
+    await asyncio.wait_for(bus.publish(InvalidationTopic.HELPER_TASKS), 1)
+
+    assert counter.count == 1
+    await bus.stop()
+
+
+async def test_redis_bus_invalidates_everything_after_reconnect(
+    server: FakeRedisServer,
+) -> None:
+    bus = await start_bus(server)
+    helper_tasks = Counter()
+    reference_data = Counter()
+    bus.subscribe(InvalidationTopic.HELPER_TASKS, helper_tasks)
+    bus.subscribe(InvalidationTopic.REFERENCE_DATA, reference_data)
+
+    server.disconnect_all()
+    await settle()
+
+    # Events may have been missed while disconnected
+    assert bus.subscribed
+    assert helper_tasks.count == 1
+    assert reference_data.count == 1
+    await bus.stop()
+
+
+async def test_redis_bus_ignores_invalid_messages(server: FakeRedisServer) -> None:
+    bus = await start_bus(server)
+    counter = Counter()
+    bus.subscribe(InvalidationTopic.HELPER_TASKS, counter)
+    client = server.client()
+
+    await client.publish("ycc-hull:invalidation", "not json")
+    await client.publish("ycc-hull:invalidation", '{"origin": "x", "topics": ["?"]}')
+    await client.publish(
+        "ycc-hull:invalidation", '{"origin": "x", "topics": ["HELPER_TASKS"]}'
+    )
+    await settle()
+
+    assert bus.subscribed
+    assert counter.count == 1
+    await bus.stop()
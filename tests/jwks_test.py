@@ -0,0 +1,126 @@
+"""Tests for the local JWT verification"""
+
+import time
+
+import pytest
+from jwcrypto.jwk import JWK
+from jwcrypto.jwt import JWT
+
+from ycc_hull.jwks import JwksTokenVerifier, TokenVerificationError
+
+ISSUER = "http://localhost:8080/realms/YCC-TEST"
+
+
+class StubJwksEndpoint:
+    """
+    Stub JWKS endpoint serving the public keys of the given key pairs.
+    """
+
+    def __init__(self, *keys: JWK) -> None:
+        self.keys = list(keys)
+        self.fetch_count = 0
+
+    async def __call__(self) -> dict:
+        self.fetch_count += 1
+        return {"keys": [key.export_public(as_dict=True) for key in self.keys]}
+
+
+def generate_key(kid: str) -> JWK:
+    return JWK.generate(kty="RSA", size=2048, kid=kid, alg="RS256", use="sig")
+
+
+def create_token(key: JWK, **claims: object) -> str:
+    now = int(time.time())
+    token = JWT(
+        header={"alg": "RS256", "kid": key["kid"], "typ": "JWT"},
+        claims={
+            "exp": now + 300,
+            "iat": now,
+            "iss": ISSUER,
+            "sub": "f:034bfedc-ed3d-4169-be68-9fd337eddff2:42",
+            "typ": "Bearer",
+            "preferred_username": "MHUFF",
+            **claims,
+        },
+    )
+    token.make_signed_token(key)
+    return token.serialize()
+
+
+KEY1 = generate_key("key-1")
+KEY2 = generate_key("key-2")
+
+
+@pytest.mark.asyncio
+async def test_verify_valid_token() -> None:
+    endpoint = StubJwksEndpoint(KEY1)
+    verifier = JwksTokenVerifier(endpoint, issuer=ISSUER)
+
+    claims = await verifier.verify(create_token(KEY1))
+    await verifier.verify(create_token(KEY1))
+
+    assert claims["preferred_username"] == "MHUFF"
+    assert endpoint.fetch_count == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_refreshes_keys_on_unknown_kid() -> None:
+    endpoint = StubJwksEndpoint(KEY1)
+    verifier = JwksTokenVerifier(
+        endpoint, issuer=ISSUER, min_refresh_interval_seconds=0
+    )
+    await verifier.verify(create_token(KEY1))
+
+    # Key rotation
+    endpoint.keys = [KEY2]
+    claims = await verifier.verify(create_token(KEY2))
+
+    assert claims["sub"].endswith(":42")
+    assert endpoint.fetch_count == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_unknown_kid_refresh_is_rate_limited() -> None:
+    endpoint = StubJwksEndpoint(KEY1)
+    verifier = JwksTokenVerifier(
+        endpoint, issuer=ISSUER, min_refresh_interval_seconds=3600
+    )
+
+    for _ in range(3):
+        with pytest.raises(TokenVerificationError):
+            await verifier.verify(create_token(KEY2))
+
+    assert endpoint.fetch_count == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_forged_signature() -> None:
+    forged_key = generate_key(KEY1["kid"])
+    verifier = JwksTokenVerifier(StubJwksEndpoint(KEY1), issuer=ISSUER)
+
+    with pytest.raises(TokenVerificationError):
+        await verifier.verify(create_token(forged_key))
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": int(time.time()) - 3600},
+        {"iss": "http://localhost:8080/realms/OTHER"},
+        {"typ": "ID"},
+    ],
+)
+@pytest.mark.asyncio
+async def test_verify_rejects_invalid_claims(claims: dict) -> None:
+    verifier = JwksTokenVerifier(StubJwksEndpoint(KEY1), issuer=ISSUER)
+
+    with pytest.raises(TokenVerificationError):
+        await verifier.verify(create_token(KEY1, **claims))
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_garbage() -> None:
+    verifier = JwksTokenVerifier(StubJwksEndpoint(KEY1), issuer=ISSUER)
+
+    with pytest.raises(TokenVerificationError):
+        await verifier.verify("not-a-token")
@@ -116,7 +116,8 @@ async def init_test_database(name: str) -> None:
         database_url=f"sqlite:///tmp/test-{name}.db", echo=False
     )
     engine = DatabaseContextHolder.context._engine  # pylint: disable=protected-access
-    BaseEntity.metadata.drop_all(bind=engine)
-    BaseEntity.metadata.create_all(bind=engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseEntity.metadata.drop_all)
+        await connection.run_sync(BaseEntity.metadata.create_all)
 
     await TestDataController().repopulate(False)
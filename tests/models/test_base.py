@@ -2,9 +2,14 @@
 Base DTO tests.
 """
 
+from datetime import datetime
+
 import pytest
+from pydantic import Field
 
+from ycc_hull.models import base
 from ycc_hull.models.base import (
+    CamelisedBaseModel,
     sanitise_datetime_input,
     sanitise_html_input,
     sanitise_text_input,
@@ -27,6 +32,33 @@ def test_sanitise_text_input(value: str, expected: str) -> None:
     assert sanitise_text_input(value) == expected
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Michele",
+        " +41 76 123 45 67 \n",
+        "\u00a0Ren\u00e9e\u00a0",
+        "Line 1\r\nLine 2\tTabbed",
+        "a > b",
+        "a\x00b",
+        "a\x1fb",
+        "\ufeffBOM",
+        "AT&amp;T",
+    ],
+)
+def test_sanitise_text_input_fast_path_matches_lxml(value: str) -> None:
+    # pylint: disable-next=protected-access
+    assert sanitise_text_input(value) == base._clean_text(base._parse_html(value))
+
+
+def test_sanitise_text_input_is_cached() -> None:
+    value = "A title which is sanitised <b>twice</b>"
+    hits_before = sanitise_text_input.cache_info().hits
+
+    assert sanitise_text_input(value) == sanitise_text_input(value)
+    assert sanitise_text_input.cache_info().hits == hits_before + 1
+
+
 @pytest.mark.parametrize(
     "value, expected",
     [
@@ -78,3 +110,45 @@ def test_datetime_input(value: str, expected: str) -> None:
         assert actual == expected
     else:
         assert actual.isoformat() == expected
+
+
+class ExampleDto(CamelisedBaseModel):
+    """
+    Example DTO with text, HTML and date time fields.
+    """
+
+    title: str | None
+    description: str | None = Field(json_schema_extra={"html": True})
+    created_at: datetime
+
+
+def test_create_sanitises_values() -> None:
+    dto = ExampleDto(
+        title=" <b>Title</b> ",
+        description="<p onclick=\"alert('XSS')\">Description</p>",
+        created_at=datetime(2024, 4, 1, 10, 0),
+    )
+
+    assert dto.title == "Title"
+    assert dto.description == "<p>Description</p>"
+
+
+def test_create_trusted_does_not_sanitise_values() -> None:
+    dto = ExampleDto.create_trusted(
+        title=" 1 < 2 ",
+        description="<p>Description</p>",
+        created_at=datetime(2024, 4, 1, 10, 0),
+    )
+
+    assert dto.title == "1 < 2"
+    assert dto.description == "<p>Description</p>"
+    assert dto.created_at.isoformat() == "2024-04-01T10:00:00+02:00"
+
+
+def test_create_trusted_normalises_empty_values() -> None:
+    dto = ExampleDto.create_trusted(
+        title=" \n ", description="  ", created_at=datetime(2024, 4, 1, 10, 0)
+    )
+
+    assert dto.title is None
+    assert dto.description is None
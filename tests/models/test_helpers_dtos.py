@@ -2,12 +2,86 @@
 Helpers DTO tests.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from pydantic import ValidationError
 
-from ycc_hull.models.helpers_dtos import HelperTaskCreationRequestDto
+from ycc_hull.db.entities import (
+    HelperTaskCategoryEntity,
+    HelperTaskEntity,
+    HelperTaskHelperEntity,
+    LicenceInfoEntity,
+    MemberEntity,
+    UserEntity,
+)
+from ycc_hull.models.helpers_dtos import HelperTaskCreationRequestDto, HelperTaskDto
+
+
+def create_task_entities(
+    count: int, *, member_count: int = 40
+) -> list[HelperTaskEntity]:
+    """
+    Creates loaded (transient) task entities, each with a contact, a captain, two helpers and validation.
+    """
+    members = [
+        MemberEntity(
+            id=member_id,
+            name=f"LAST{member_id}",
+            firstname=f"First{member_id}",
+            e_mail=f"member{member_id}@mailinator.com",
+            cell_phone="+41 76 123 45 67",
+            home_phone=None,
+            work_phone=None,
+            user=UserEntity(member_id=member_id, logon_id=f"USER{member_id}"),
+        )
+        for member_id in range(1, member_count + 1)
+    ]
+    category = HelperTaskCategoryEntity(
+        id=1,
+        title="Surveillance",
+        short_description="Surveillance shifts",
+        long_description="<p>Keep an eye on the <em>lake</em>!</p>",
+    )
+    licence_info = LicenceInfoEntity(infoid=9, nlicence="M", description="Moth")
+    starts_at = datetime(2040, 5, 1, 18, 0)
+
+    tasks = []
+    for task_id in range(1, count + 1):
+        task = HelperTaskEntity(
+            id=task_id,
+            category=category,
+            title=f"Task {task_id}",
+            short_description="The Club needs your help!",
+            long_description="<p>Really!</p>",
+            contact=members[task_id % member_count],
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(hours=2),
+            deadline=None,
+            urgent=False,
+            captain_required_licence_info=licence_info,
+            helper_min_count=1,
+            helper_max_count=2,
+            published=True,
+            captain=members[(task_id + 1) % member_count],
+            captain_signed_up_at=starts_at - timedelta(days=7),
+            marked_as_done_at=starts_at + timedelta(hours=3),
+            marked_as_done_by=members[(task_id + 1) % member_count],
+            marked_as_done_comment="Done",
+            validated_at=starts_at + timedelta(days=1),
+            validated_by=members[0],
+            validation_comment="Thank you!",
+        )
+        task.helpers = [
+            HelperTaskHelperEntity(
+                member=members[(task_id + offset) % member_count],
+                signed_up_at=starts_at - timedelta(days=offset),
+            )
+            for offset in (2, 3)
+        ]
+        tasks.append(task)
+
+    return tasks
 
 
 def test_creation_valid_shift() -> None:
@@ -239,3 +313,47 @@ def test_sanitise() -> None:
         request.ends_at is not None
         and request.ends_at.isoformat() == "2023-05-01T20:30:00+02:00"
     )
+
+
+async def test_create_many_matches_create() -> None:
+    tasks = create_task_entities(10)
+
+    dtos = HelperTaskDto.create_many(tasks)
+
+    assert [dto.model_dump() for dto in dtos] == [
+        (await HelperTaskDto.create(task)).model_dump() for task in tasks
+    ]
+
+
+def test_create_many_without_large_fields() -> None:
+    dto = HelperTaskDto.create_many(create_task_entities(1), large_fields=False)[0]
+
+    assert dto.long_description is None
+    assert dto.marked_as_done_comment is None
+    assert dto.validation_comment is None
+    assert dto.category.long_description == "<p>Keep an eye on the <em>lake</em>!</p>"
+
+
+def test_create_many_shares_dtos() -> None:
+    dtos = HelperTaskDto.create_many(create_task_entities(100, member_count=10))
+
+    assert dtos[0].validated_by is dtos[99].validated_by
+    assert dtos[0].contact is dtos[10].contact
+    assert dtos[0].category is dtos[99].category
+    assert (
+        dtos[0].captain_required_licence_info is dtos[99].captain_required_licence_info
+    )
+    assert dtos[0].captain and dtos[0].helpers[0].member is not dtos[0].captain.member
+    assert dtos[1].contact is dtos[0].captain.member
+
+
+def test_create_many_sanitises_legacy_data() -> None:
+    # Members and categories are written by the legacy applications
+    task = create_task_entities(1)[0]
+    task.contact.firstname = "<b>Eve</b><script>alert('Ahoy!')</script>"
+    task.category.long_description = "<p>Lake</p><script>alert('Ahoy!')</script>"
+
+    dto = HelperTaskDto.create_many([task])[0]
+
+    assert dto.contact.first_name == "Eve"
+    assert dto.category.long_description == "<div><p>Lake</p></div>"
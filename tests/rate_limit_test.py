@@ -0,0 +1,34 @@
+"""Tests for the rate limit module"""
+
+import asyncio
+import time
+
+import pytest
+
+from ycc_hull.rate_limit import TokenBucket
+
+
+async def test_burst_is_not_limited() -> None:
+    bucket = TokenBucket(rate_per_second=1, burst=5)
+    started_at = time.monotonic()
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at < 0.5
+
+
+async def test_limits_rate_after_burst() -> None:
+    bucket = TokenBucket(rate_per_second=50, burst=2)
+    started_at = time.monotonic()
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+
+    # 2 at once, then 5 at 50 per second
+    assert time.monotonic() - started_at >= 0.09
+
+
+@pytest.mark.parametrize("rate_per_second, burst", [(0, 1), (1, 0)])
+def test_fails_if_invalid(rate_per_second: float, burst: int) -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_second=rate_per_second, burst=burst)
@@ -0,0 +1,206 @@
+"""Tests for the scheduler lock module"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, update
+
+from tests.main_test import init_test_database
+from ycc_hull.config import SchedulerLockConfig
+from ycc_hull.controllers.helpers_controller import HelpersController
+from ycc_hull.db.context import DatabaseContextHolder
+from ycc_hull.db.entities import SchedulerLockEntity
+from ycc_hull.scheduler_lock import SchedulerLeaderElection, SchedulerLeaseLostException
+
+CONFIG = SchedulerLockConfig(lease_seconds=60, renew_interval_seconds=0.01)
+
+
+class FakeClock:
+    """Monotonic clock moved by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_locks() -> None:
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(delete(SchedulerLockEntity))
+        await session.commit()
+
+
+@pytest.fixture(name="clock")
+def fixture_clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(name="first")
+def fixture_first(clock: FakeClock) -> SchedulerLeaderElection:
+    return SchedulerLeaderElection(CONFIG, owner="first", clock=clock)
+
+
+@pytest.fixture(name="second")
+def fixture_second(clock: FakeClock) -> SchedulerLeaderElection:
+    return SchedulerLeaderElection(CONFIG, owner="second", clock=clock)
+
+
+async def expire_lease() -> None:
+    """
+    Simulates a leader which died: its lease is not renewed and expires.
+    """
+    async with DatabaseContextHolder.context.session() as session:
+        await session.execute(
+            update(SchedulerLockEntity).values(locked_until=datetime(2000, 1, 1))
+        )
+        await session.commit()
+
+
+async def test_only_one_leader(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # When
+    first_lease = await first.try_acquire()
+    second_lease = await second.try_acquire()
+
+    # Then
+    assert first_lease and first_lease.token == 1
+    assert second_lease is None
+    assert first.lease == first_lease
+    assert second.lease is None
+
+
+async def test_renewal_keeps_token(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    await first.try_acquire()
+
+    # When
+    lease = await first.try_acquire()
+
+    # Then
+    assert lease and lease.token == 1
+    assert await second.try_acquire() is None
+    assert first.stats.acquired == 1
+
+
+async def test_fails_over_when_leader_dies(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    first_lease = await first.try_acquire()
+    assert first_lease
+    await expire_lease()
+
+    # When
+    second_lease = await second.try_acquire()
+
+    # Then
+    assert second_lease and second_lease.token == 2
+    # The old leader is fenced off
+    async with DatabaseContextHolder.context.session() as session:
+        with pytest.raises(SchedulerLeaseLostException):
+            await first_lease.verify(session)
+        await second_lease.verify(session)
+    assert await first.try_acquire() is None
+    assert first.stats.lost == 1
+
+
+async def test_lease_is_lost_if_not_renewed_in_time(
+    first: SchedulerLeaderElection, clock: FakeClock
+) -> None:
+    # Given
+    await first.try_acquire()
+
+    # When
+    clock.now += CONFIG.lease_seconds
+
+    # Then
+    assert first.lease is None
+    assert not first.stats.leader
+
+
+async def test_stop_releases_lease(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    await first.start()
+    while first.lease is None:
+        await first.try_acquire()
+
+    # When
+    await first.stop()
+
+    # Then
+    assert first.lease is None
+    second_lease = await second.try_acquire()
+    assert second_lease and second_lease.token == 2
+
+
+async def test_acquire_within_takes_over_expired_lease(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    await first.try_acquire()
+    await expire_lease()
+
+    # When
+    lease = await second.acquire_within(0)
+
+    # Then
+    assert lease and lease.token == 2
+
+
+async def test_acquire_within_gives_up_while_leader_alive(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    await first.try_acquire()
+
+    # When
+    lease = await second.acquire_within(0)
+
+    # Then
+    assert lease is None
+    assert first.lease
+
+
+async def test_acquire_within_waits_for_lease_of_dead_leader(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    await first.try_acquire()
+
+    # When
+    acquiring = asyncio.create_task(second.acquire_within(CONFIG.lease_seconds))
+    await asyncio.sleep(0.05)
+    # The leader died just before the job fired, its lease expires now
+    await expire_lease()
+    lease = await asyncio.wait_for(acquiring, timeout=2)
+
+    # Then
+    assert lease and lease.token == 2
+
+
+async def test_fenced_off_leader_sends_no_reminders(
+    first: SchedulerLeaderElection, second: SchedulerLeaderElection
+) -> None:
+    # Given
+    first_lease = await first.try_acquire()
+    assert first_lease
+    await expire_lease()
+    await second.try_acquire()
+
+    # When, Then
+    with pytest.raises(SchedulerLeaseLostException):
+        await HelpersController().send_daily_reminders(lease=first_lease)
@@ -0,0 +1,56 @@
+"""Tests for the worker module"""
+
+import asyncio
+
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from tests.main_test import init_test_database
+from ycc_hull.app_controllers import create_controllers
+from ycc_hull.background_jobs import BackgroundJobs
+from ycc_hull.controllers.notifications.email_outbox import EMAIL_OUTBOX_WORKER
+from ycc_hull.scheduler_lock import SCHEDULER_LEADER_ELECTION
+from ycc_hull.worker import run_worker
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_database() -> None:
+    await init_test_database(__name__)
+
+
+async def test_runs_background_jobs_until_stopped() -> None:
+    # Given
+    stop = asyncio.Event()
+
+    # When
+    worker = asyncio.create_task(run_worker(stop))
+    for _ in range(100):
+        if SCHEDULER_LEADER_ELECTION.lease:
+            break
+        await asyncio.sleep(0.05)
+    running = EMAIL_OUTBOX_WORKER.started, SCHEDULER_LEADER_ELECTION.lease
+    stop.set()
+    await worker
+
+    # Then
+    assert running[0]
+    assert running[1]
+    assert not EMAIL_OUTBOX_WORKER.started
+    assert SCHEDULER_LEADER_ELECTION.lease is None
+
+
+async def test_no_leader_election_without_scheduled_jobs(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocker.patch("ycc_hull.scheduler._parse_trigger", return_value=None)
+    background_jobs = BackgroundJobs(create_controllers())
+
+    # When
+    await background_jobs.start()
+    started = SCHEDULER_LEADER_ELECTION.started
+    await background_jobs.stop()
+
+    # Then
+    assert not started
+    assert SCHEDULER_LEADER_ELECTION.lease is None